@@ -0,0 +1,213 @@
+"""
+Compare SDK hydration with raw JSON listings of large port, server and
+volume lists.
+
+Both paths parse the same canned API responses through a fake session, so
+the numbers only cover the client-side work: building openstacksdk
+resources and converting them to response models, against renaming the
+JSON keys and validating the models directly.
+
+Usage: python benchmarks/raw_listing.py [--items 10000] [--repeat 1]
+"""
+
+import argparse
+import time
+import tracemalloc
+import uuid
+
+from collections.abc import Callable
+from unittest.mock import Mock
+
+from keystoneauth1 import adapter
+from openstack.block_storage.v3 import volume as sdk_volume
+from openstack.compute.v2 import server as sdk_server
+from openstack.network.v2 import port as sdk_port
+
+from openstack_mcp_server.tools.block_storage_tools import BlockStorageTools
+from openstack_mcp_server.tools.network_tools import NetworkTools
+from openstack_mcp_server.tools.raw_listing import raw_list
+from openstack_mcp_server.tools.response.block_storage import Volume
+from openstack_mcp_server.tools.response.compute import Server
+from openstack_mcp_server.tools.response.network import Port
+
+
+def fake_port(index: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"port-{index}",
+        "status": "ACTIVE",
+        "description": "",
+        "device_id": str(uuid.uuid4()),
+        "device_owner": "compute:nova",
+        "network_id": str(uuid.uuid4()),
+        "mac_address": "fa:16:3e:00:00:00",
+        "admin_state_up": True,
+        "fixed_ips": [
+            {"subnet_id": str(uuid.uuid4()), "ip_address": "10.0.0.2"}
+        ],
+        "security_groups": [str(uuid.uuid4())],
+        "allowed_address_pairs": [],
+        "binding:host_id": "compute-01",
+        "binding:vnic_type": "normal",
+        "project_id": str(uuid.uuid4()),
+        "tags": [],
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def fake_server(index: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"server-{index}",
+        "status": "ACTIVE",
+        "flavor": {"original_name": "m1.small", "vcpus": 1, "ram": 2048},
+        "image": {"id": str(uuid.uuid4())},
+        "addresses": {
+            "private": [
+                {
+                    "addr": "10.0.0.2",
+                    "version": 4,
+                    "OS-EXT-IPS:type": "fixed",
+                }
+            ]
+        },
+        "key_name": "default",
+        "security_groups": [{"name": "default"}],
+        "OS-EXT-AZ:availability_zone": "nova",
+        "tenant_id": str(uuid.uuid4()),
+        "created": "2025-01-01T00:00:00Z",
+        "updated": "2025-01-01T00:00:00Z",
+        "metadata": {},
+        "tags": [],
+    }
+
+
+def fake_volume(index: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"volume-{index}",
+        "status": "in-use",
+        "size": 10,
+        "volume_type": "standard",
+        "availability_zone": "nova",
+        "created_at": "2025-01-01T00:00:00Z",
+        "bootable": "false",
+        "encrypted": False,
+        "multiattach": False,
+        "description": "",
+        "attachments": [
+            {
+                "server_id": str(uuid.uuid4()),
+                "device": "/dev/vdb",
+                "attachment_id": str(uuid.uuid4()),
+            }
+        ],
+        "metadata": {},
+    }
+
+
+def fake_session(key: str, items: list[dict]) -> Mock:
+    """Get a session answering every listing with a single page."""
+    response = Mock(status_code=200, headers={}, links={})
+    response.json.return_value = {key: items}
+    session = Mock(spec=adapter.Adapter)
+    session.default_microversion = "2.79"
+    session.get.return_value = response
+    session._get_connection = Mock(return_value=None)
+    return session
+
+
+def measure(fn: Callable[[], list], repeat: int) -> tuple[float, int]:
+    """
+    Measure a listing.
+
+    :return: The best CPU time in seconds and the peak traced allocation
+        in bytes.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    ports = fake_session("ports", [fake_port(i) for i in range(args.items)])
+    servers = fake_session(
+        "servers", [fake_server(i) for i in range(args.items)]
+    )
+    volumes = fake_session(
+        "volumes", [fake_volume(i) for i in range(args.items)]
+    )
+    network_tools = NetworkTools()
+    block_storage_tools = BlockStorageTools()
+
+    cases = {
+        "ports": (
+            lambda: [
+                network_tools._convert_to_port_model(port)
+                for port in sdk_port.Port.list(ports)
+            ],
+            lambda: [
+                Port.model_validate(port)
+                for port in raw_list(ports, sdk_port.Port)
+            ],
+        ),
+        "servers": (
+            lambda: [
+                Server(**server)
+                for server in sdk_server.Server.list(
+                    servers, base_path="/servers/detail"
+                )
+            ],
+            lambda: [
+                Server(**{**server, "image": server.get("image") or None})
+                for server in raw_list(
+                    servers, sdk_server.Server, base_path="/servers/detail"
+                )
+            ],
+        ),
+        "volumes": (
+            lambda: [
+                block_storage_tools._convert_to_volume_model(volume)
+                for volume in sdk_volume.Volume.list(
+                    volumes, base_path="/volumes/detail"
+                )
+            ],
+            lambda: [
+                Volume.model_validate(volume)
+                for volume in raw_list(
+                    volumes, sdk_volume.Volume, base_path="/volumes/detail"
+                )
+            ],
+        ),
+    }
+
+    print(f"{args.items} items, best of {args.repeat} runs")
+    print(
+        f"{'listing':<10}{'sdk cpu':>10}{'raw cpu':>10}"
+        f"{'sdk peak':>12}{'raw peak':>12}"
+    )
+    for name, (sdk, raw) in cases.items():
+        sdk_cpu, sdk_peak = measure(sdk, args.repeat)
+        raw_cpu, raw_peak = measure(raw, args.repeat)
+        print(
+            f"{name:<10}{sdk_cpu:>9.2f}s{raw_cpu:>9.2f}s"
+            f"{sdk_peak / 2**20:>10.1f}MB{raw_peak / 2**20:>10.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
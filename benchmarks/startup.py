@@ -0,0 +1,129 @@
+"""
+Measure the cold start of the MCP server.
+
+Each run starts a fresh interpreter, so module caches of earlier runs do
+not hide import costs. Two views are reported:
+
+- in-process phases: importing the server, registering the tools,
+  answering tools/list, and loading every service tool class. The last
+  phase is paid on the first call of each class's tools; before the tool
+  manifest it was part of the registration.
+- stdio: the latency an MCP client sees from spawning the server to the
+  initialize, tools/list and first tool call (get_cloud_names, which loads
+  openstacksdk) responses.
+
+Usage: python benchmarks/startup.py [--runs 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+PHASES = """
+import asyncio, json, time
+
+start = time.perf_counter()
+from fastmcp import FastMCP
+from openstack_mcp_server.tools import register_tool
+from openstack_mcp_server.tools import manifest
+imported = time.perf_counter()
+
+mcp = FastMCP("benchmark")
+register_tool(mcp)
+registered = time.perf_counter()
+
+asyncio.run(mcp.list_tools())
+listed = time.perf_counter()
+
+for module, class_name in manifest.SERVICE_TOOL_CLASSES:
+    manifest._load_tool_class(module, class_name)
+loaded = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - start,
+    "register": registered - imported,
+    "tools/list": listed - registered,
+    "load tool classes": loaded - listed,
+}))
+"""
+
+
+def run_phases() -> dict[str, float]:
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", PHASES],
+        env={**os.environ, "PYTHONPATH": SRC},
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+async def run_stdio() -> dict[str, float]:
+    transport = StdioTransport(
+        command=sys.executable,
+        args=["-m", "openstack_mcp_server"],
+        env={
+            **os.environ,
+            "PYTHONPATH": SRC,
+            "TRANSPORT": "stdio",
+            "FASTMCP_SHOW_SERVER_BANNER": "false",
+            "FASTMCP_CHECK_FOR_UPDATES": "off",
+        },
+        keep_alive=False,
+        log_file=Path(os.devnull),
+    )
+    start = time.perf_counter()
+    async with Client(transport) as client:
+        initialized = time.perf_counter()
+        await client.list_tools()
+        listed = time.perf_counter()
+        await client.call_tool("get_cloud_names", {}, raise_on_error=False)
+        called = time.perf_counter()
+    return {
+        "initialize": initialized - start,
+        "tools/list": listed - start,
+        "first call": called - start,
+    }
+
+
+def report(title: str, runs: list[dict[str, float]]) -> None:
+    print(title)
+    for phase in runs[0]:
+        values = [run[phase] for run in runs]
+        print(
+            f"  {phase:<20}{statistics.median(values) * 1000:>8.0f}ms"
+            f"  (min {min(values) * 1000:.0f}ms)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    report(
+        f"In-process phases, median of {args.runs} runs",
+        [run_phases() for _ in range(args.runs)],
+    )
+    report(
+        "stdio latency since spawn",
+        [asyncio.run(run_stdio()) for _ in range(args.runs)],
+    )
+
+
+if __name__ == "__main__":
+    main()
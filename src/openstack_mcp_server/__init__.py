@@ -19,16 +19,37 @@ def handle_interrupt(signum, frame):
     sys.exit(0)
 
 
+def _comma_separated(value: str) -> set[str]:
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
 def main():
     """Openstack MCP Server main entry point."""
     try:
         # Import here to avoid circular imports
-        from openstack_mcp_server.config import MCP_TRANSPORT
+        from openstack_mcp_server.config import (
+            MCP_ENABLED_SERVICES,
+            MCP_ENABLED_TOOLS,
+            MCP_TRANSPORT,
+        )
         from openstack_mcp_server.server import serve
 
         parser = argparse.ArgumentParser(
             description="Openstack MCP Server",
         )
+        parser.add_argument(
+            "--enabled-services",
+            type=_comma_separated,
+            default=MCP_ENABLED_SERVICES,
+            help="Comma-separated services whose tools are registered, "
+            "e.g. compute,network (default: every service)",
+        )
+        parser.add_argument(
+            "--enabled-tools",
+            type=_comma_separated,
+            default=MCP_ENABLED_TOOLS,
+            help="Comma-separated names of further tools to register",
+        )
 
         # Set up signal handler for graceful shutdown
         signal.signal(signal.SIGINT, handle_interrupt)
@@ -9,6 +9,100 @@ MCP_TRANSPORT: str = os.environ.get("TRANSPORT", "stdio")
 # Openstack client settings
 MCP_CLOUD_NAME: str = os.environ.get("CLOUD_NAME", "openstack")
 MCP_DEBUG_MODE: bool = os.environ.get("DEBUG_MODE", "true").lower() == "true"
+# Seconds before token expiry at which a pooled connection re-authenticates
+MCP_TOKEN_REFRESH_MARGIN: int = int(
+    os.environ.get("TOKEN_REFRESH_MARGIN", "300"),
+)
+# Persist keystone tokens on disk so restarted servers skip authentication
+MCP_TOKEN_CACHE_ENABLED: bool = (
+    os.environ.get("TOKEN_CACHE", "false").lower() == "true"
+)
+MCP_TOKEN_CACHE_DIR: Path = Path(
+    os.environ.get(
+        "TOKEN_CACHE_DIR",
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        / "openstack-mcp-server"
+        / "tokens",
+    ),
+)
+
+# Tool selection settings
+# Comma-separated services and tool names to register, e.g. "compute,image"
+# and "get_servers,get_networks"; when both are empty every tool is
+# registered. The connection and statistics tools are always registered.
+MCP_ENABLED_SERVICES: set[str] = {
+    service.strip()
+    for service in os.environ.get("ENABLED_SERVICES", "").split(",")
+    if service.strip()
+}
+MCP_ENABLED_TOOLS: set[str] = {
+    tool.strip()
+    for tool in os.environ.get("ENABLED_TOOLS", "").split(",")
+    if tool.strip()
+}
+# Hide the tools of services missing from the Keystone catalog of the
+# current cloud; reading the catalog authenticates on the first tools/list
+MCP_HIDE_UNAVAILABLE_SERVICES: bool = (
+    os.environ.get("HIDE_UNAVAILABLE_SERVICES", "false").lower() == "true"
+)
+
+# Tool execution settings
+MCP_TOOL_WORKERS: int = int(os.environ.get("TOOL_WORKERS", "16"))
+# Per-service concurrency limits, e.g. "compute=8,network=4"
+MCP_SERVICE_CONCURRENCY: dict[str, int] = {
+    service.strip(): int(limit)
+    for service, _, limit in (
+        item.partition("=")
+        for item in os.environ.get("SERVICE_CONCURRENCY", "").split(",")
+        if item.strip()
+    )
+}
+
+# Bulk tool settings
+MCP_BULK_WORKERS: int = int(os.environ.get("BULK_WORKERS", "32"))
+# Default number of items a single bulk tool call processes at once
+MCP_BULK_CONCURRENCY: int = int(os.environ.get("BULK_CONCURRENCY", "8"))
+
+# Unassigned floating IPs kept allocated per external network (0 disables)
+MCP_FLOATING_IP_POOL_SIZE: int = int(
+    os.environ.get("FLOATING_IP_POOL_SIZE", "0"),
+)
+# Seconds between reconciliations of the floating IP pools
+MCP_FLOATING_IP_POOL_REFILL_INTERVAL: float = float(
+    os.environ.get("FLOATING_IP_POOL_REFILL_INTERVAL", "30"),
+)
+
+# Seconds between two polls of resources being waited for; the interval
+# grows from the minimum to the maximum while no status changes
+MCP_WAIT_MIN_INTERVAL: float = float(
+    os.environ.get("WAIT_MIN_INTERVAL", "1"),
+)
+MCP_WAIT_MAX_INTERVAL: float = float(
+    os.environ.get("WAIT_MAX_INTERVAL", "15"),
+)
+
+# Read cache settings
+MCP_CACHE_ENABLED: bool = (
+    os.environ.get("CACHE_ENABLED", "true").lower() == "true"
+)
+MCP_CACHE_MAX_ENTRIES: int = int(os.environ.get("CACHE_MAX_ENTRIES", "256"))
+# Per-resource-type TTLs in seconds, e.g. "flavor=600,image=30"
+MCP_CACHE_TTLS: dict[str, float] = {
+    resource_type.strip(): float(ttl)
+    for resource_type, _, ttl in (
+        item.partition("=")
+        for item in os.environ.get("CACHE_TTL", "").split(",")
+        if item.strip()
+    )
+}
+
+# Default page size of list tools (0 returns every item)
+MCP_DEFAULT_PAGE_LIMIT: int = int(os.environ.get("DEFAULT_PAGE_LIMIT", "0"))
+# Map server, volume and port listings from the raw API JSON instead of
+# building openstacksdk resources for every item
+MCP_RAW_LISTINGS: bool = (
+    os.environ.get("RAW_LISTINGS", "false").lower() == "true"
+)
 
 # Application paths
 BASE_DIR = Path(__file__).parent.parent.parent
@@ -1,27 +1,62 @@
+import sys
+
+from collections.abc import Iterable
+
 from fastmcp.server import FastMCP
 from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
 from fastmcp.server.middleware.logging import LoggingMiddleware
 
+from openstack_mcp_server import config
 from openstack_mcp_server.tools import register_tool
+from openstack_mcp_server.tools.catalog import ServiceCatalogMiddleware
+from openstack_mcp_server.tools.executor import get_tool_executor
+
+
+# Modules running background threads, with the getter of their worker.
+# They are loaded with the tools that use them.
+_WORKER_MODULES = (
+    ("openstack_mcp_server.tools.bulk", "get_bulk_runner"),
+    ("openstack_mcp_server.tools.floating_ip_pool", "get_floating_ip_pool"),
+    ("openstack_mcp_server.tools.waiter", "get_waiter"),
+)
+
 
+def serve(
+    transport: str,
+    enabled_services: Iterable[str] = (),
+    enabled_tools: Iterable[str] = (),
+    **kwargs,
+):
+    """
+    Serve the MCP server with the specified transport.
 
-def serve(transport: str, **kwargs):
-    """Serve the MCP server with the specified transport."""
+    :param transport: The transport protocol.
+    :param enabled_services: Register only the tools of these services.
+    :param enabled_tools: Names of further service tools to register.
+    """
     mcp = FastMCP(
         "openstack_mcp_server",
     )
 
-    register_tool(mcp)
+    register_tool(mcp, enabled_services, enabled_tools)
     # resister_resources(mcp)
     # register_prompt(mcp)
 
     # Add middlewares
     mcp.add_middleware(ErrorHandlingMiddleware())
     mcp.add_middleware(LoggingMiddleware())
+    if config.MCP_HIDE_UNAVAILABLE_SERVICES:
+        mcp.add_middleware(ServiceCatalogMiddleware())
 
-    if transport == "stdio":
-        mcp.run(transport="stdio", **kwargs)
-    elif transport == "streamable-http":
-        mcp.run(transport="streamable-http", **kwargs)
-    else:
-        raise ValueError(f"Unsupported transport: {transport}")
+    try:
+        if transport == "stdio":
+            mcp.run(transport="stdio", **kwargs)
+        elif transport == "streamable-http":
+            mcp.run(transport="streamable-http", **kwargs)
+        else:
+            raise ValueError(f"Unsupported transport: {transport}")
+    finally:
+        get_tool_executor().shutdown()
+        for module, getter in _WORKER_MODULES:
+            if module in sys.modules:
+                getattr(sys.modules[module], getter)().shutdown()
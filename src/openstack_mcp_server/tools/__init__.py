@@ -1,22 +1,31 @@
+from collections.abc import Iterable
+
 from fastmcp import FastMCP
 
+from openstack_mcp_server.tools.cache import get_tool_cache
 from openstack_mcp_server.tools.connection import ConnectionManager
+from openstack_mcp_server.tools.executor import get_tool_executor
 
 
-def register_tool(mcp: FastMCP):
+def register_tool(
+    mcp: FastMCP,
+    services: Iterable[str] = (),
+    tools: Iterable[str] = (),
+):
     """
     Register Openstack MCP tools.
+
+    The OpenStack service tools are registered from the static tool
+    manifest; their modules are only imported when first called.
+
+    :param mcp: The FastMCP instance.
+    :param services: Register only the tools of these services.
+    :param tools: Names of further service tools to register.
     """
 
-    from .block_storage_tools import BlockStorageTools
-    from .compute_tools import ComputeTools
-    from .identity_tools import IdentityTools
-    from .image_tools import ImageTools
-    from .network_tools import NetworkTools
-
-    ComputeTools().register_tools(mcp)
-    ImageTools().register_tools(mcp)
-    IdentityTools().register_tools(mcp)
-    NetworkTools().register_tools(mcp)
-    BlockStorageTools().register_tools(mcp)
+    from .manifest import register_manifest_tools
+
+    register_manifest_tools(mcp, services, tools)
     ConnectionManager().register_tools(mcp)
+    get_tool_executor().register_tools(mcp)
+    get_tool_cache().register_tools(mcp)
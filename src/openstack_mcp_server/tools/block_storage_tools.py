@@ -1,12 +1,30 @@
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from openstack.block_storage.v3 import volume as sdk_volume
+
+from openstack_mcp_server import config
 
 from .base import get_openstack_conn
+from .cache import coalesced, invalidates
+from .conversion import ModelConverter
+from .executor import progress_reporter, register_service_tools
+from .pagination import marker_page, marker_query, page_limit
+from .projection import projected_fields
+from .raw_listing import raw_list
 from .response.block_storage import (
     Attachment,
     ConnectionInfo,
     Volume,
     VolumeAttachment,
 )
+from .response.common import Page
+from .waiter import DELETED, get_waiter
+
+
+_volume_converter = ModelConverter(
+    Volume,
+    created_at=lambda v: str(v.created_at) if v.created_at else None,
+    attachments=lambda v: v.attachments or [],
+)
 
 
 class BlockStorageTools:
@@ -18,55 +36,68 @@ class BlockStorageTools:
         """
         Register Block Storage-related tools with the FastMCP instance.
         """
-        mcp.tool()(self.get_volumes)
-        mcp.tool()(self.get_volume_details)
-        mcp.tool()(self.create_volume)
-        mcp.tool()(self.delete_volume)
-        mcp.tool()(self.extend_volume)
-
-        mcp.tool()(self.get_attachment_details)
-        mcp.tool()(self.get_attachments)
+        register_service_tools(
+            mcp,
+            "block_storage",
+            [
+                self.get_volumes,
+                self.get_volume_details,
+                self.create_volume,
+                self.delete_volume,
+                self.extend_volume,
+                self.get_attachment_details,
+                self.get_attachments,
+            ],
+        )
 
-    def get_volumes(self) -> list[Volume]:
+    @coalesced("volume")
+    def get_volumes(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Page[Volume]:
         """
         Get the list of Block Storage volumes.
 
-        :return: A list of Volume objects representing the volumes.
+        :param limit: Maximum number of volumes to return.
+        :param cursor: The next_cursor of the previous page.
+        :param fields: Fields to return for each volume, by default every field.
+        :return: A page of Volume objects representing the volumes.
         """
         conn = get_openstack_conn()
+        projection = projected_fields(Volume, fields)
 
         # List the volumes
-        volume_list = []
-        for volume in conn.block_storage.volumes():
-            attachments = []
-            for attachment in volume.attachments or []:
-                attachments.append(
-                    VolumeAttachment(
-                        server_id=attachment.get("server_id"),
-                        device=attachment.get("device"),
-                        attachment_id=attachment.get("attachment_id"),
-                    ),
-                )
-
-            volume_list.append(
-                Volume(
-                    id=volume.id,
-                    name=volume.name,
-                    status=volume.status,
-                    size=volume.size,
-                    volume_type=volume.volume_type,
-                    availability_zone=volume.availability_zone,
-                    created_at=str(volume.created_at)
-                    if volume.created_at
-                    else None,
-                    is_bootable=volume.is_bootable,
-                    is_encrypted=volume.is_encrypted,
-                    description=volume.description,
-                    attachments=attachments,
+        limit = page_limit(limit)
+        if config.MCP_RAW_LISTINGS:
+            page = marker_page(
+                raw_list(
+                    conn.block_storage,
+                    sdk_volume.Volume,
+                    base_path="/volumes/detail",
+                    **marker_query(limit, cursor),
                 ),
+                limit,
+                _volume_converter.validate_many,
+            )
+        else:
+            page = marker_page(
+                conn.block_storage.volumes(**marker_query(limit, cursor)),
+                limit,
+                _volume_converter.many,
             )
 
-        return volume_list
+        return page.project(projection)
+
+    def _convert_to_volume_model(self, volume) -> Volume:
+        """
+        Convert an OpenStack volume object to a Volume pydantic model.
+
+        :param volume: OpenStack volume object
+        :return: Pydantic Volume model
+        """
+        return _volume_converter(volume)
 
     def get_volume_details(self, volume_id: str) -> Volume:
         """
@@ -103,6 +134,7 @@ class BlockStorageTools:
             attachments=attachments,
         )
 
+    @invalidates("volume")
     def create_volume(
         self,
         name: str,
@@ -111,6 +143,9 @@ class BlockStorageTools:
         volume_type: str | None = None,
         availability_zone: str | None = None,
         image: str | None = None,
+        wait: bool = False,
+        timeout: int = 600,
+        ctx: Context | None = None,
     ) -> Volume:
         """
         Create a new volume.
@@ -121,6 +156,8 @@ class BlockStorageTools:
         :param volume_type: Optional volume type
         :param availability_zone: Optional availability zone
         :param image: Optional Image name, ID or object from which to create
+        :param wait: If True, wait until the volume is available or in error
+        :param timeout: Maximum number of seconds to wait
         :return: The created Volume object
         """
         conn = get_openstack_conn()
@@ -142,6 +179,18 @@ class BlockStorageTools:
             **volume_kwargs,
         )
 
+        if wait:
+            get_waiter().wait(
+                "volume",
+                [volume.id],
+                targets={"available"},
+                failures={"error", DELETED},
+                timeout=timeout,
+                on_progress=progress_reporter(ctx),
+            )
+            volume = conn.block_storage.get_volume(volume.id)
+            return self._convert_to_volume_model(volume)
+
         volume_obj = Volume(
             id=volume.id,
             name=volume.name,
@@ -158,6 +207,7 @@ class BlockStorageTools:
 
         return volume_obj
 
+    @invalidates("volume")
     def delete_volume(self, volume_id: str, force: bool = False) -> None:
         """
         Delete a volume.
@@ -174,17 +224,36 @@ class BlockStorageTools:
             ignore_missing=False,
         )
 
-    def extend_volume(self, volume_id: str, new_size: int) -> None:
+    @invalidates("volume")
+    def extend_volume(
+        self,
+        volume_id: str,
+        new_size: int,
+        wait: bool = False,
+        timeout: int = 600,
+        ctx: Context | None = None,
+    ) -> None:
         """
         Extend a volume to a new size.
 
         :param volume_id: The ID of the volume to extend
         :param new_size: The new size in GB (must be larger than current size)
+        :param wait: If True, wait until the volume is no longer extending
+        :param timeout: Maximum number of seconds to wait
         :return: None
         """
         conn = get_openstack_conn()
 
         conn.block_storage.extend_volume(volume_id, new_size)
+        if wait:
+            get_waiter().wait(
+                "volume",
+                [volume_id],
+                targets={"available", "in-use"},
+                failures={"error", "error_extending", DELETED},
+                timeout=timeout,
+                on_progress=progress_reporter(ctx),
+            )
 
     def get_attachment_details(self, attachment_id: str) -> Attachment:
         """
@@ -224,17 +293,22 @@ class BlockStorageTools:
 
         return Attachment(**params)
 
+    @coalesced("volume")
     def get_attachments(
         self,
         volume_id: str | None = None,
         instance: str | None = None,
-    ) -> list[Attachment]:
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Page[Attachment]:
         """
         Get the list of attachments.
 
         :param volume_id: The ID of the volume.
         :param instance: The ID of the instance.
-        :return: A list of Attachment objects.
+        :param limit: Maximum number of attachments to return.
+        :param cursor: The next_cursor of the previous page.
+        :return: A page of Attachment objects.
         """
         conn = get_openstack_conn()
 
@@ -244,20 +318,22 @@ class BlockStorageTools:
         if instance:
             filter["instance"] = instance
 
-        attachments = []
-        for attachment in conn.block_storage.attachments(**filter):
-            attachments.append(
-                Attachment(
-                    id=attachment.id,
-                    instance=attachment.instance,
-                    volume_id=attachment.volume_id,
-                    status=attachment.status,
-                    connection_info=attachment.connection_info,
-                    attach_mode=attachment.attach_mode,
-                    connector=attachment.connector,
-                    attached_at=attachment.attached_at,
-                    detached_at=attachment.detached_at,
-                )
+        limit = page_limit(limit)
+        attachments = (
+            Attachment(
+                id=attachment.id,
+                instance=attachment.instance,
+                volume_id=attachment.volume_id,
+                status=attachment.status,
+                connection_info=attachment.connection_info,
+                attach_mode=attachment.attach_mode,
+                connector=attachment.connector,
+                attached_at=attachment.attached_at,
+                detached_at=attachment.detached_at,
             )
+            for attachment in conn.block_storage.attachments(
+                **filter, **marker_query(limit, cursor)
+            )
+        )
 
-        return attachments
+        return marker_page(attachments, limit)
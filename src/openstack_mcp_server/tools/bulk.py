@@ -0,0 +1,159 @@
+import time
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, NamedTuple
+
+from openstack import exceptions
+
+from openstack_mcp_server import config
+
+
+# HTTP statuses of transient failures worth retrying: a resource busy with
+# another operation (409) and API rate limiting (429).
+RETRY_STATUS_CODES = (409, 429)
+
+
+class BulkOutcome(NamedTuple):
+    """Result of one item of a bulk operation."""
+
+    item: Any
+    result: Any = None
+    error: Exception | None = None
+
+
+class BulkRunner:
+    """
+    Fans the items of a bulk tool out to a shared thread pool.
+
+    The pool is long-lived and shared by every bulk tool; each call caps
+    how many of its items are in flight at once. Workers should call
+    get_openstack_conn themselves, which hands every worker thread its own
+    pooled connection.
+    """
+
+    def __init__(self, max_workers: int, default_concurrency: int):
+        self._max_workers = max_workers
+        self._default_concurrency = default_concurrency
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="openstack-mcp-bulk",
+        )
+
+    def run(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable,
+        concurrency: int | None = None,
+    ) -> list[BulkOutcome]:
+        """
+        Call a function for every item concurrently.
+
+        A failing item never stops the others; its exception is returned in
+        its outcome instead.
+
+        :param fn: The function to call with each item.
+        :param items: The items to process.
+        :param concurrency: Maximum number of items in flight, by default
+            the configured bulk concurrency.
+        :return: One outcome per item, in the order of the items.
+        """
+        limit = self._concurrency(concurrency)
+        outcomes: dict[int, BulkOutcome] = {}
+        pending: dict[Future, tuple[int, Any]] = {}
+
+        def collect(futures):
+            for future in futures:
+                index, item = pending.pop(future)
+                error = future.exception()
+                outcomes[index] = BulkOutcome(
+                    item=item,
+                    result=None if error else future.result(),
+                    error=error,
+                )
+
+        for index, item in enumerate(items):
+            if len(pending) >= limit:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending[self._pool.submit(fn, item)] = (index, item)
+        collect(wait(pending).done)
+
+        return [outcomes[index] for index in sorted(outcomes)]
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    def _concurrency(self, concurrency: int | None) -> int:
+        if concurrency is None:
+            concurrency = self._default_concurrency
+        if concurrency < 1:
+            raise ValueError(
+                f"concurrency must be a positive integer: {concurrency}"
+            )
+        return min(concurrency, self._max_workers)
+
+
+_bulk_runner = BulkRunner(
+    max_workers=config.MCP_BULK_WORKERS,
+    default_concurrency=config.MCP_BULK_CONCURRENCY,
+)
+
+
+def get_bulk_runner() -> BulkRunner:
+    return _bulk_runner
+
+
+def with_backoff(
+    fn: Callable[[Any], Any],
+    attempts: int = 5,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+) -> Callable[[Any], Any]:
+    """
+    Retry a per-item bulk function on conflicts and rate limiting.
+
+    The delay doubles after each failed attempt. A `Retry-After` header
+    sent with a 429 response takes precedence.
+
+    :param fn: The function to call with each item.
+    :param attempts: Maximum number of attempts per item.
+    :param base_delay: Delay in seconds before the first retry.
+    :param max_delay: Upper bound of the delay in seconds.
+    :return: The retrying function.
+    """
+
+    def call(item):
+        for attempt in range(attempts):
+            try:
+                return fn(item)
+            except exceptions.HttpException as e:
+                if (
+                    e.status_code not in RETRY_STATUS_CODES
+                    or attempt == attempts - 1
+                ):
+                    raise
+                time.sleep(_retry_delay(e, attempt, base_delay, max_delay))
+
+    return call
+
+
+def _retry_delay(
+    error: exceptions.HttpException,
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+) -> float:
+    response = getattr(error, "response", None)
+    retry_after = (
+        response.headers.get("Retry-After") if response is not None else None
+    )
+    try:
+        return min(float(retry_after), max_delay)
+    except (TypeError, ValueError):
+        return min(base_delay * 2**attempt, max_delay)
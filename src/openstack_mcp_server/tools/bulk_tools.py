@@ -0,0 +1,200 @@
+import time
+
+from collections.abc import Callable
+from enum import Enum
+
+from fastmcp import Context, FastMCP
+
+from .base import get_openstack_conn
+from .bulk import get_bulk_runner, with_backoff
+from .cache import invalidates
+from .executor import progress_reporter, register_service_tools
+from .response.common import BulkError, BulkResult, ResourceRef
+from .waiter import DELETED, get_waiter
+
+
+class DeletableResourceEnum(str, Enum):
+    """resource types supported by bulk deletion"""
+
+    SERVER = "server"
+    VOLUME = "volume"
+    PORT = "port"
+    FLOATING_IP = "floating_ip"
+
+
+# Statuses of resources whose deletion failed, per waited resource type.
+_DELETION_FAILURES = {
+    DeletableResourceEnum.SERVER: {"ERROR"},
+    DeletableResourceEnum.VOLUME: {"error_deleting"},
+}
+
+
+class BulkTools:
+    """
+    A class to encapsulate tools operating on many resources of several
+    OpenStack services at once.
+    """
+
+    def register_tools(self, mcp: FastMCP):
+        """
+        Register bulk tools with the FastMCP instance.
+        """
+        register_service_tools(
+            mcp,
+            "bulk",
+            [
+                self.delete_resources,
+            ],
+        )
+
+    @invalidates("server", "volume", "port", "floating_ip")
+    def delete_resources(
+        self,
+        server_ids: list[str] | None = None,
+        volume_ids: list[str] | None = None,
+        port_ids: list[str] | None = None,
+        floating_ip_ids: list[str] | None = None,
+        wait: bool = False,
+        timeout: int = 600,
+        concurrency: int | None = None,
+        ctx: Context | None = None,
+    ) -> BulkResult[ResourceRef]:
+        """
+        Delete many servers, volumes, ports and floating IPs concurrently.
+
+        Deletes are issued in dependency order: floating IPs and servers
+        first, then ports and volumes, which may still be attached to the
+        servers. When both servers and ports or volumes are given, the
+        servers are therefore always waited for. Deletes rejected with a
+        conflict (409) or rate limit (429) are retried with backoff. Already
+        deleted resources count as deleted.
+
+        :param server_ids: IDs of the servers to delete.
+        :param volume_ids: IDs of the volumes to delete.
+        :param port_ids: IDs of the ports to delete.
+        :param floating_ip_ids: IDs of the floating IPs to delete.
+        :param wait: If True, wait until every resource is gone.
+        :param timeout: Maximum number of seconds to wait.
+        :param concurrency: Maximum number of concurrent deletes.
+        :return: Deleted resources and per-resource errors.
+        """
+        deadline = time.monotonic() + timeout
+        result = BulkResult[ResourceRef]()
+
+        phases = [
+            {
+                DeletableResourceEnum.FLOATING_IP: floating_ip_ids or [],
+                DeletableResourceEnum.SERVER: server_ids or [],
+            },
+            {
+                DeletableResourceEnum.PORT: port_ids or [],
+                DeletableResourceEnum.VOLUME: volume_ids or [],
+            },
+        ]
+        for index, phase in enumerate(phases):
+            refs = [
+                ResourceRef(resource_type=resource_type.value, id=id)
+                for resource_type, ids in phase.items()
+                for id in dict.fromkeys(ids)
+            ]
+            deleted = self._delete(refs, concurrency, result)
+
+            blocks_next_phase = index + 1 < len(phases) and any(
+                phases[index + 1].values()
+            )
+            if wait or blocks_next_phase:
+                deleted = self._wait_for_deletion(
+                    deleted, deadline, result, progress_reporter(ctx)
+                )
+            result.succeeded.extend(deleted)
+
+        return result
+
+    def _delete(
+        self,
+        refs: list[ResourceRef],
+        concurrency: int | None,
+        result: BulkResult[ResourceRef],
+    ) -> list[ResourceRef]:
+        """
+        Issue deletes concurrently, recording failures in the result.
+
+        :return: The resources whose delete was accepted.
+        """
+
+        def delete(ref: ResourceRef):
+            conn = get_openstack_conn()
+            delete_methods = {
+                DeletableResourceEnum.SERVER: conn.compute.delete_server,
+                DeletableResourceEnum.VOLUME: conn.block_storage.delete_volume,
+                DeletableResourceEnum.PORT: conn.network.delete_port,
+                DeletableResourceEnum.FLOATING_IP: conn.network.delete_ip,
+            }
+            delete_methods[ref.resource_type](ref.id, ignore_missing=True)
+
+        outcomes = get_bulk_runner().run(
+            with_backoff(delete), refs, concurrency
+        )
+        result.failed.extend(
+            BulkError(
+                item=f"{o.item.resource_type}/{o.item.id}", error=str(o.error)
+            )
+            for o in outcomes
+            if o.error is not None
+        )
+        return [o.item for o in outcomes if o.error is None]
+
+    def _wait_for_deletion(
+        self,
+        refs: list[ResourceRef],
+        deadline: float,
+        result: BulkResult[ResourceRef],
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> list[ResourceRef]:
+        """
+        Wait until resources are gone.
+
+        Neutron deletes synchronously, so only servers and volumes are
+        waited for. Resources still present at the deadline or whose delete
+        failed are recorded as failures.
+
+        :return: The resources that are gone.
+        """
+        pending: dict[str, list[str]] = {}
+        for ref in refs:
+            if ref.resource_type in _DELETION_FAILURES:
+                pending.setdefault(ref.resource_type, []).append(ref.id)
+
+        statuses: dict[str, str | None] = {}
+        for resource_type, ids in pending.items():
+            statuses.update(
+                get_waiter().wait(
+                    resource_type,
+                    ids,
+                    targets={DELETED},
+                    failures=_DELETION_FAILURES[resource_type],
+                    timeout=max(deadline - time.monotonic(), 0),
+                    on_progress=on_progress,
+                )
+            )
+
+        gone = []
+        for ref in refs:
+            status = statuses.get(ref.id, DELETED)
+            if status == DELETED:
+                gone.append(ref)
+            elif status in _DELETION_FAILURES.get(ref.resource_type, ()):
+                result.failed.append(
+                    BulkError(
+                        item=f"{ref.resource_type}/{ref.id}",
+                        error=f"Deletion failed with status {status}",
+                    )
+                )
+            else:
+                result.failed.append(
+                    BulkError(
+                        item=f"{ref.resource_type}/{ref.id}",
+                        error="Timed out waiting for deletion",
+                    )
+                )
+        return gone
@@ -0,0 +1,384 @@
+import functools
+import inspect
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+from fastmcp import FastMCP
+from pydantic import BaseModel
+
+from openstack_mcp_server import config
+from openstack_mcp_server.tools.connection import ConnectionManager
+from openstack_mcp_server.tools.response.cache import CacheStats
+
+
+# Default time-to-live in seconds per cached resource type.
+DEFAULT_TTLS: dict[str, float] = {
+    "flavor": 300,
+    "image": 60,
+    "region": 600,
+    "domain": 300,
+}
+
+# Resource types whose cached results also change when a resource of the
+# key type is created, updated or deleted (e.g. deleting a server deletes
+# its ports).
+_INVALIDATION_DEPENDENCIES: dict[str, set[str]] = {}
+
+
+class ToolCache:
+    """
+    Size-bounded, TTL-expiring LRU cache for read tool results.
+
+    Entries are keyed by (cloud, resource type, tool, arguments) so results
+    of different clouds or filters never mix. Each entry remembers its
+    resource type, which allows dropping every entry of a type at once.
+
+    Concurrent identical loads are coalesced: while a load is in flight,
+    other callers with the same key wait for its result instead of calling
+    OpenStack themselves.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttls: dict[str, float] | None = None,
+        enabled: bool = True,
+    ):
+        self._max_entries = max_entries
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._enabled = enabled
+        self._entries: OrderedDict[tuple, tuple[float, str, Any]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, int] = {}
+        self._in_flight: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._coalesced = 0
+
+    def register_tools(self, mcp: FastMCP):
+        mcp.tool()(self.get_cache_stats)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled and self._max_entries > 0
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        :param key: The cache key.
+        :return: A (found, value) tuple.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry[2]
+
+    def generation(self, resource_type: str) -> int:
+        """
+        Return the invalidation counter of a resource type.
+
+        :param resource_type: The resource type.
+        :return: A counter increased by every invalidation of the type.
+        """
+        with self._lock:
+            return self._generations.get(resource_type, 0)
+
+    def set(
+        self,
+        key: tuple,
+        resource_type: str,
+        value: Any,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        :param key: The cache key.
+        :param resource_type: The resource type of the value.
+        :param value: The value to cache.
+        :param generation: The generation the value was loaded at. The value
+            is discarded if the resource type was invalidated since then.
+        """
+        ttl = self._ttls.get(resource_type, 0)
+        if ttl <= 0 or not self.enabled:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generations.get(
+                resource_type, 0
+            ):
+                return
+            self._entries[key] = (time.monotonic() + ttl, resource_type, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def load(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Call a loader, sharing the call with concurrent identical loads.
+
+        The first caller of a key runs the loader; callers arriving while it
+        is in flight receive its result or exception.
+
+        :param key: The load key. It should include the generation of the
+            resource type so that loads started before a write are not
+            joined after it.
+        :param loader: The callable loading the value.
+        :return: The loaded value.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self._coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def invalidate(self, resource_type: str) -> None:
+        """
+        Drop every cached entry of a resource type and its dependents.
+
+        :param resource_type: The resource type to drop.
+        """
+        resource_types = _dependent_resource_types(resource_type)
+        with self._lock:
+            for current in resource_types:
+                self._generations[current] = (
+                    self._generations.get(current, 0) + 1
+                )
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry[1] in resource_types
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._coalesced = 0
+
+    def get_cache_stats(self) -> CacheStats:
+        """
+        Get hit/miss counters of the cache in front of catalog read tools.
+
+        :return: Cache size and hit, miss, eviction and coalesced load
+            counters.
+        """
+        with self._lock:
+            return CacheStats(
+                enabled=self.enabled,
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                coalesced=self._coalesced,
+                ttls=dict(self._ttls),
+            )
+
+
+_tool_cache = ToolCache(
+    max_entries=config.MCP_CACHE_MAX_ENTRIES,
+    ttls=config.MCP_CACHE_TTLS,
+    enabled=config.MCP_CACHE_ENABLED,
+)
+
+
+def get_tool_cache() -> ToolCache:
+    return _tool_cache
+
+
+def cached(resource_type: str) -> Callable:
+    """
+    Cache the result of a read tool.
+
+    The decorated tool may declare a ``refresh`` parameter; passing
+    ``refresh=True`` bypasses the cache and stores the fresh result.
+
+    :param resource_type: The resource type returned by the tool.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key, refresh = _call_key(
+                fn, signature, resource_type, args, kwargs
+            )
+            if _tool_cache.enabled and not refresh:
+                found, value = _tool_cache.get(key)
+                if found:
+                    return value
+
+            # NOTE: A write that lands while the read is in flight bumps the
+            # generation, so the possibly stale result is not cached.
+            generation = _tool_cache.generation(resource_type)
+
+            def load():
+                value = fn(*args, **kwargs)
+                _tool_cache.set(key, resource_type, value, generation)
+                return value
+
+            return _tool_cache.load((*key, generation), load)
+
+        return wrapper
+
+    return decorator
+
+
+def coalesced(resource_type: str) -> Callable:
+    """
+    Share one in-flight call between concurrent identical read tool calls.
+
+    Unlike `cached`, the result is not kept once the call returned.
+
+    :param resource_type: The resource type returned by the tool.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key, _ = _call_key(fn, signature, resource_type, args, kwargs)
+            generation = _tool_cache.generation(resource_type)
+            return _tool_cache.load(
+                (*key, generation), lambda: fn(*args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def _call_key(
+    fn: Callable,
+    signature: inspect.Signature,
+    resource_type: str,
+    args: tuple,
+    kwargs: dict,
+) -> tuple[tuple, bool]:
+    """
+    Build the key of a read tool call.
+
+    :return: The key and the value of the tool's `refresh` argument.
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self", None)
+    refresh = arguments.pop("refresh", False)
+
+    key = (
+        ConnectionManager.get_cloud_name(),
+        resource_type,
+        fn.__qualname__,
+        _freeze(arguments),
+    )
+    return key, refresh
+
+
+def invalidates(*resource_types: str) -> Callable:
+    """
+    Invalidate cached results after a mutating tool ran.
+
+    The cache is invalidated even if the tool raised, since a failed call
+    may still have changed some resources.
+
+    :param resource_types: The resource types changed by the tool.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                for resource_type in resource_types:
+                    _tool_cache.invalidate(resource_type)
+
+        return wrapper
+
+    return decorator
+
+
+def register_invalidation(resource_type: str, *dependents: str) -> None:
+    """
+    Declare resource types affected by changes to another resource type.
+
+    :param resource_type: The mutated resource type.
+    :param dependents: Resource types whose cached results become stale.
+    """
+    _INVALIDATION_DEPENDENCIES.setdefault(resource_type, set()).update(
+        dependents
+    )
+
+
+def _dependent_resource_types(resource_type: str) -> set[str]:
+    """Resolve a resource type and, transitively, its dependents."""
+    resolved = set()
+    pending = [resource_type]
+    while pending:
+        current = pending.pop()
+        if current in resolved:
+            continue
+        resolved.add(current)
+        pending.extend(_INVALIDATION_DEPENDENCIES.get(current, ()))
+    return resolved
+
+
+register_invalidation("domain", "project")
+register_invalidation("server", "port", "floating_ip", "volume")
+register_invalidation("volume", "server")
+register_invalidation("network", "subnet", "port")
+register_invalidation("router", "port")
+register_invalidation("port", "floating_ip")
+
+
+def _freeze(value: Any) -> Any:
+    """Turn tool arguments into a hashable cache key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return value
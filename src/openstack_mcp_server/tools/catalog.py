@@ -0,0 +1,102 @@
+import asyncio
+import logging
+
+from collections.abc import Sequence
+
+import mcp.types as mt
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools import Tool, ToolResult
+
+from openstack_mcp_server.tools.base import (
+    get_openstack_cloud_name,
+    get_openstack_conn,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Catalog service types of the services whose tools are tagged with the
+# service. Bulk tools span several services and are never hidden.
+SERVICE_TYPES = {
+    "compute": "compute",
+    "image": "image",
+    "identity": "identity",
+    "network": "network",
+    "block_storage": "block-storage",
+}
+
+
+class ServiceCatalogMiddleware(Middleware):
+    """
+    Hides the tools of services missing from the Keystone catalog.
+
+    The catalog of each cloud is read once, on the first tools/list or tool
+    call after the cloud is selected. If it cannot be read, for example
+    because authentication fails, every tool stays available and the
+    catalog is read again on the next request.
+    """
+
+    def __init__(self):
+        self._unavailable: dict[str, frozenset[str]] = {}
+
+    async def on_list_tools(
+        self,
+        context: MiddlewareContext[mt.ListToolsRequest],
+        call_next: CallNext[mt.ListToolsRequest, Sequence[Tool]],
+    ) -> Sequence[Tool]:
+        tools = await call_next(context)
+        unavailable = await self.unavailable_services()
+        return [tool for tool in tools if unavailable.isdisjoint(tool.tags)]
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        if context.fastmcp_context is not None:
+            tool = await context.fastmcp_context.fastmcp.get_tool(
+                context.message.name
+            )
+            tags = tool.tags if tool is not None else set()
+            missing = tags & await self.unavailable_services()
+            if missing:
+                raise ToolError(
+                    f"The {', '.join(sorted(missing))} service is not in "
+                    f"the service catalog of cloud "
+                    f"{get_openstack_cloud_name()}"
+                )
+        return await call_next(context)
+
+    async def unavailable_services(self) -> frozenset[str]:
+        """
+        Get the services missing from the catalog of the current cloud.
+
+        :return: The services, empty if the catalog cannot be read.
+        """
+        cloud_name = get_openstack_cloud_name()
+        if cloud_name not in self._unavailable:
+            try:
+                # NOTE: Reading the catalog authenticates, so it runs off
+                # the event loop.
+                unavailable = await asyncio.to_thread(_missing_services)
+            except Exception:
+                logger.warning(
+                    "Cannot read the service catalog of cloud %s, "
+                    "every tool stays available",
+                    cloud_name,
+                    exc_info=True,
+                )
+                return frozenset()
+            self._unavailable[cloud_name] = unavailable
+        return self._unavailable[cloud_name]
+
+
+def _missing_services() -> frozenset[str]:
+    conn = get_openstack_conn()
+    return frozenset(
+        service
+        for service, service_type in SERVICE_TYPES.items()
+        if not conn.has_service(service_type)
+    )
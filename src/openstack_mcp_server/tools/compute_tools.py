@@ -1,14 +1,41 @@
+import functools
+import uuid
+
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from openstack.compute.v2 import server as sdk_server
 
+from openstack_mcp_server import config
 from openstack_mcp_server.tools.response.compute import (
     Flavor,
     Server,
+    ServerBatch,
+    ServerDetails,
+    ServerStatus,
 )
 
 from .base import get_openstack_conn
+from .bulk import get_bulk_runner
+from .cache import cached, coalesced, invalidates
+from .conversion import ModelConverter
+from .executor import progress_reporter, register_service_tools
+from .pagination import marker_page, marker_query, page_limit
+from .projection import projected_fields
+from .raw_listing import raw_list
+from .response.block_storage import Attachment
+from .response.common import BulkError, BulkResult, Page
+from .response.image import Image
+from .response.network import FloatingIP, Port
+from .waiter import DELETED, get_waiter
+
+
+_server_converter = ModelConverter(Server)
+_port_converter = ModelConverter(Port)
+_floating_ip_converter = ModelConverter(FloatingIP)
+_attachment_converter = ModelConverter(Attachment)
 
 
 class ServerActionEnum(str, Enum):
@@ -38,28 +65,148 @@ class ComputeTools:
         """
         Register Compute-related tools with the FastMCP instance.
         """
-        mcp.tool()(self.get_servers)
-        mcp.tool()(self.get_server)
-        mcp.tool()(self.create_server)
-        mcp.tool()(self.get_flavors)
-        mcp.tool()(self.action_server)
-        mcp.tool()(self.update_server)
-        mcp.tool()(self.delete_server)
-        mcp.tool()(self.attach_volume)
-        mcp.tool()(self.detach_volume)
+        register_service_tools(
+            mcp,
+            "compute",
+            [
+                self.get_servers,
+                self.get_server,
+                self.get_server_details,
+                self.create_server,
+                self.create_servers,
+                self.get_flavors,
+                self.action_server,
+                self.action_servers,
+                self.update_server,
+                self.delete_server,
+                self.attach_volume,
+                self.detach_volume,
+            ],
+        )
 
-    def get_servers(self) -> list[Server]:
+    @coalesced("server")
+    def get_servers(
+        self,
+        status: str | None = None,
+        name: str | None = None,
+        flavor_id: str | None = None,
+        image_id: str | None = None,
+        host: str | None = None,
+        availability_zone: str | None = None,
+        project_id: str | None = None,
+        all_projects: bool = False,
+        tags: list[str] | None = None,
+        changes_since: str | None = None,
+        ip: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Page[Server]:
         """
         Get the list of Compute servers.
 
-        :return: A list of Server objects.
+        Every filter is applied by Nova, so only matching servers are
+        transferred. Combining filters further restricts the result
+        (logical AND).
+
+        :param status: Filter by server status (e.g., `ACTIVE`, `ERROR`).
+        :param name: Filter by server name, as a regular expression.
+        :param flavor_id: Filter by flavor ID.
+        :param image_id: Filter by image ID.
+        :param host: Filter by compute host name (admin only).
+        :param availability_zone: Filter by availability zone.
+        :param project_id: Filter by project ID (admin only).
+        :param all_projects: If True, list servers of every project (admin only).
+        :param tags: Only servers having all of these tags.
+        :param changes_since: Only servers changed since this ISO 8601 time.
+        :param ip: Filter by IPv4 address, as a regular expression.
+        :param limit: Maximum number of servers to return.
+        :param cursor: The next_cursor of the previous page.
+        :param fields: Fields to return for each server, by default every field.
+        :return: A page of Server objects.
         """
         conn = get_openstack_conn()
-        server_list = []
-        for server in conn.compute.servers():
-            server_list.append(Server(**server))
+        projection = projected_fields(Server, fields)
+
+        filters = self._server_filters(
+            status=status,
+            name=name,
+            flavor_id=flavor_id,
+            image_id=image_id,
+            host=host,
+            availability_zone=availability_zone,
+            project_id=project_id,
+            all_projects=all_projects,
+            tags=tags,
+            changes_since=changes_since,
+            ip=ip,
+        )
+
+        limit = page_limit(limit)
+        query = {**filters, **marker_query(limit, cursor)}
+        if config.MCP_RAW_LISTINGS:
+            # NOTE: Servers booted from a volume have an empty string image.
+            servers = (
+                {**server, "image": server.get("image") or None}
+                for server in raw_list(
+                    conn.compute,
+                    sdk_server.Server,
+                    base_path="/servers/detail",
+                    **query,
+                )
+            )
+        else:
+            # NOTE: openstacksdk resources are mappings keyed by attribute
+            # name, so they are validated as they are.
+            servers = conn.compute.servers(**query)
+
+        return marker_page(
+            servers, limit, _server_converter.validate_many
+        ).project(projection)
+
+    def _server_filters(
+        self,
+        status: str | None = None,
+        name: str | None = None,
+        flavor_id: str | None = None,
+        image_id: str | None = None,
+        host: str | None = None,
+        availability_zone: str | None = None,
+        project_id: str | None = None,
+        all_projects: bool = False,
+        tags: list[str] | None = None,
+        changes_since: str | None = None,
+        ip: str | None = None,
+    ) -> dict:
+        """
+        Translate server filters into Nova list query parameters.
 
-        return server_list
+        :return: Query parameters to pass to the openstacksdk list call.
+        """
+        filters: dict = {}
+        if status:
+            filters["status"] = status.upper()
+        if name:
+            filters["name"] = name
+        if flavor_id:
+            filters["flavor"] = flavor_id
+        if image_id:
+            filters["image"] = image_id
+        if host:
+            filters["compute_host"] = host
+        if availability_zone:
+            filters["availability_zone"] = availability_zone
+        if project_id:
+            filters["project_id"] = project_id
+        if all_projects:
+            filters["all_projects"] = True
+        if tags:
+            filters["tags"] = ",".join(tags)
+        if changes_since:
+            filters["changes_since"] = changes_since
+        if ip:
+            filters["ipv4_address"] = ip
+        return filters
 
     def get_server(self, id: str) -> Server:
         """
@@ -72,6 +219,90 @@ class ComputeTools:
         server = conn.compute.get_server(id)
         return Server(**server)
 
+    def get_server_details(self, id: str) -> ServerDetails:
+        """
+        Get a Compute server together with its ports, floating IPs, volume
+        attachments and image.
+
+        The related resources are fetched concurrently from the Network,
+        Block Storage and Image services, every page of them regardless of
+        the default page limit. A failed lookup leaves its field empty and
+        is reported in `errors` instead of failing the call.
+
+        :param id: The ID of the server.
+        :return: The server and its related resources.
+        """
+        # NOTE: Each lookup runs on a bulk runner thread and gets the
+        # connection of that thread.
+        results, errors = self._fan_out(
+            {
+                "server": lambda: self.get_server(id),
+                "ports": lambda: _port_converter.many(
+                    get_openstack_conn().network.ports(device_id=id)
+                ),
+                "volume_attachments": lambda: _attachment_converter.many(
+                    get_openstack_conn().block_storage.attachments(instance=id)
+                ),
+            }
+        )
+        if "server" not in results:
+            raise next(e for name, e in errors if name == "server")
+
+        details = ServerDetails(
+            server=results["server"],
+            ports=results.get("ports"),
+            volume_attachments=results.get("volume_attachments"),
+        )
+
+        # NOTE: The image and floating IPs are only known once the server
+        # and its ports are, so they are looked up in a second round.
+        lookups: dict[str, Callable[[], Any]] = {}
+        image = details.server.image
+        if image and image.id:
+            lookups["image"] = lambda: Image(
+                **get_openstack_conn().image.get_image(image.id)
+            )
+        for port in details.ports or []:
+            lookups[f"floating_ips/{port.id}"] = functools.partial(
+                lambda port_id: _floating_ip_converter.many(
+                    get_openstack_conn().network.ips(port_id=port_id)
+                ),
+                port.id,
+            )
+        more_results, more_errors = self._fan_out(lookups)
+        errors.extend(more_errors)
+
+        details.image = more_results.get("image")
+        if details.ports is not None:
+            details.floating_ips = [
+                ip
+                for name, ips in more_results.items()
+                if name.startswith("floating_ips/")
+                for ip in ips
+            ]
+        details.errors = [
+            BulkError(item=name, error=str(error)) for name, error in errors
+        ]
+        return details
+
+    def _fan_out(
+        self, lookups: dict[str, Callable[[], Any]]
+    ) -> tuple[dict[str, Any], list[tuple[str, Exception]]]:
+        """
+        Run independent lookups concurrently.
+
+        :param lookups: Lookup functions by name.
+        :return: The results by name and the (name, error) of each failed
+            lookup.
+        """
+        outcomes = get_bulk_runner().run(
+            lambda name: lookups[name](), list(lookups)
+        )
+        results = {o.item: o.result for o in outcomes if o.error is None}
+        errors = [(o.item, o.error) for o in outcomes if o.error is not None]
+        return results, errors
+
+    @invalidates("server")
     def create_server(
         self,
         name: str,
@@ -81,6 +312,9 @@ class ComputeTools:
         key_name: str | None = None,
         security_groups: list[str] | None = None,
         user_data: str | None = None,
+        wait: bool = False,
+        timeout: int = 600,
+        ctx: Context | None = None,
     ) -> Server:
         """
         Create a new Compute server.
@@ -92,9 +326,119 @@ class ComputeTools:
         :param key_name: The name of the key pair to use.
         :param security_groups: A list of security group names to attach.
         :param user_data: User data to pass to the server.
+        :param wait: If True, wait until the server is ACTIVE or ERROR.
+        :param timeout: Maximum number of seconds to wait.
         :return: A Server object
         """
         conn = get_openstack_conn()
+        server_params = self._server_params(
+            name, image, flavor, network, key_name, security_groups, user_data
+        )
+
+        resp = conn.compute.create_server(**server_params)
+        if wait:
+            get_waiter().wait(
+                "server",
+                [resp.id],
+                targets={"ACTIVE"},
+                failures={"ERROR", DELETED},
+                timeout=timeout,
+                on_progress=progress_reporter(ctx),
+            )
+        # NOTE: The create_server method returns a server object with minimal information.
+        # To get the full server details, we need to fetch it again.
+        server = conn.compute.get_server(resp.id)
+
+        return Server(**server)
+
+    @invalidates("server")
+    def create_servers(
+        self,
+        name: str,
+        image: str,
+        flavor: int,
+        network: str,
+        count: int,
+        min_count: int | None = None,
+        key_name: str | None = None,
+        security_groups: list[str] | None = None,
+        user_data: str | None = None,
+        wait: bool = False,
+        timeout: int = 600,
+        ctx: Context | None = None,
+    ) -> ServerBatch:
+        """
+        Create many identical Compute servers with a single API call.
+
+        Nova boots between `min_count` and `count` servers, named after
+        `name` with a numeric suffix. Every server of the batch is tagged
+        with the returned tag, which selects the batch in get_servers.
+
+        :param name: The name of the servers.
+        :param image: The ID of the image to use.
+        :param flavor: The ID of the flavor to use.
+        :param network: The ID of the network to attach.
+        :param count: The number of servers to create.
+        :param min_count: The minimum number of servers to create; the
+            request fails if not that many fit in the quota. Defaults to
+            `count`.
+        :param key_name: The name of the key pair to use.
+        :param security_groups: A list of security group names to attach.
+        :param user_data: User data to pass to the servers.
+        :param wait: If True, wait until every server is ACTIVE or ERROR.
+        :param timeout: Maximum number of seconds to wait.
+        :return: The batch tag and the ID, name and status of each server.
+        """
+        if count < 1:
+            raise ValueError(f"count must be a positive integer: {count}")
+
+        conn = get_openstack_conn()
+        tag = f"mcp-batch-{uuid.uuid4().hex[:12]}"
+        server_params = self._server_params(
+            name, image, flavor, network, key_name, security_groups, user_data
+        )
+        conn.compute.create_server(
+            **server_params,
+            min_count=min_count or count,
+            max_count=count,
+            tags=[tag],
+        )
+
+        servers = [
+            ServerStatus(id=s.id, name=s.name, status=s.status)
+            for s in conn.compute.servers(tags=tag)
+        ]
+        if wait:
+            statuses = get_waiter().wait(
+                "server",
+                [s.id for s in servers],
+                targets={"ACTIVE"},
+                failures={"ERROR", DELETED},
+                timeout=timeout,
+                on_progress=progress_reporter(ctx),
+                # NOTE: One listing of the batch serves every server.
+                filters={"tags": tag},
+            )
+            for server in servers:
+                server.status = statuses[server.id] or server.status
+
+        return ServerBatch(tag=tag, servers=servers)
+
+    def _server_params(
+        self,
+        name: str,
+        image: str,
+        flavor: int,
+        network: str,
+        key_name: str | None,
+        security_groups: list[str] | None,
+        user_data: str | None,
+    ) -> dict[str, Any]:
+        """
+        Build the create arguments of a server.
+
+        :return: Arguments of the create call.
+        """
         server_params: dict[str, Any] = {
             "name": name,
             "flavorRef": flavor,
@@ -104,29 +448,29 @@ class ComputeTools:
             "security_groups": security_groups,
             "user_data": user_data,
         }
-        server_params = {
-            k: v for k, v in server_params.items() if v is not None
-        }
-
-        resp = conn.compute.create_server(**server_params)
-        # NOTE: The create_server method returns a server object with minimal information.
-        # To get the full server details, we need to fetch it again.
-        server = conn.compute.get_server(resp.id)
-
-        return Server(**server)
+        return {k: v for k, v in server_params.items() if v is not None}
 
-    def get_flavors(self) -> list[Flavor]:
+    @cached("flavor")
+    def get_flavors(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        refresh: bool = False,
+    ) -> Page[Flavor]:
         """
         Get flavors (server hardware configurations).
 
-        :return: A list of Flavor objects.
+        :param limit: Maximum number of flavors to return.
+        :param cursor: The next_cursor of the previous page.
+        :param refresh: Bypass the cache and fetch fresh flavors.
+        :return: A page of Flavor objects.
         """
         conn = get_openstack_conn()
-        flavor_list = []
-        for flavor in conn.compute.flavors():
-            flavor_list.append(Flavor(**flavor))
-        return flavor_list
+        limit = page_limit(limit)
+        flavors = conn.compute.flavors(**marker_query(limit, cursor))
+        return marker_page((Flavor(**flavor) for flavor in flavors), limit)
 
+    @invalidates("server")
     def action_server(self, id: str, action: str) -> None:
         """
         Perform an action on a Compute server.
@@ -152,6 +496,86 @@ class ComputeTools:
         """
         conn = get_openstack_conn()
 
+        self._action_method(conn, action)(id)
+        return None
+
+    @invalidates("server")
+    def action_servers(
+        self,
+        action: ServerActionEnum,
+        ids: list[str] | None = None,
+        status: str | None = None,
+        name: str | None = None,
+        tags: list[str] | None = None,
+        project_id: str | None = None,
+        all_projects: bool = False,
+        concurrency: int | None = None,
+    ) -> BulkResult[str]:
+        """
+        Perform an action on many Compute servers concurrently.
+
+        Servers are selected by ID, by filters, or both. A server on which
+        the action fails (e.g. stopping a server that is already stopped
+        raises a conflict) does not stop the others; it is reported in
+        `failed` instead.
+
+        :param action: The action to perform, as for action_server.
+        :param ids: IDs of the servers.
+        :param status: Select servers with this status (e.g., `ACTIVE`).
+        :param name: Select servers whose name matches this regular expression.
+        :param tags: Select servers having all of these tags.
+        :param project_id: Select servers of this project (admin only).
+        :param all_projects: If True, select servers of every project (admin only).
+        :param concurrency: Maximum number of concurrent actions.
+        :return: IDs of the servers the action succeeded on and per-server errors.
+        :raises ValueError: If the action is not supported or no server is selected.
+        """
+        conn = get_openstack_conn()
+        # Validate the action before touching any server.
+        self._action_method(conn, action)
+
+        filters = self._server_filters(
+            status=status,
+            name=name,
+            project_id=project_id,
+            all_projects=all_projects,
+            tags=tags,
+        )
+        if not ids and not filters:
+            raise ValueError("Select servers by ids or by a filter")
+
+        # NOTE: A dict keeps the selection ordered and deduplicated in
+        # constant time per server.
+        selected = dict.fromkeys(ids or [])
+        if filters:
+            selected.update(
+                (server.id, None)
+                for server in conn.compute.servers(details=False, **filters)
+            )
+        server_ids = list(selected)
+
+        def run_action(server_id):
+            self._action_method(get_openstack_conn(), action)(server_id)
+
+        outcomes = get_bulk_runner().run(run_action, server_ids, concurrency)
+        return BulkResult[str](
+            succeeded=[o.item for o in outcomes if o.error is None],
+            failed=[
+                BulkError(item=o.item, error=str(o.error))
+                for o in outcomes
+                if o.error is not None
+            ],
+        )
+
+    def _action_method(self, conn, action: str):
+        """
+        Resolve the proxy method performing a server action.
+
+        :param conn: The OpenStack connection.
+        :param action: The action to perform.
+        :return: A callable taking the server ID.
+        :raises ValueError: If the action is not supported.
+        """
         action_methods = {
             ServerActionEnum.PAUSE.value: conn.compute.pause_server,
             ServerActionEnum.UNPAUSE.value: conn.compute.unpause_server,
@@ -171,9 +595,9 @@ class ComputeTools:
         if action not in action_methods:
             raise ValueError(f"Unsupported action: {action}")
 
-        action_methods[action](id)
-        return None
+        return action_methods[action]
 
+    @invalidates("server")
     def update_server(
         self,
         id: str,
@@ -208,6 +632,7 @@ class ComputeTools:
         server = conn.compute.update_server(id, **server_params)
         return Server(**server)
 
+    @invalidates("server")
     def delete_server(self, id: str) -> None:
         """
         Delete a Compute server.
@@ -217,6 +642,7 @@ class ComputeTools:
         conn = get_openstack_conn()
         conn.compute.delete_server(id)
 
+    @invalidates("server", "volume")
     def attach_volume(
         self, server_id: str, volume_id: str, device: str | None = None
     ) -> None:
@@ -232,6 +658,7 @@ class ComputeTools:
             server_id, volume_id=volume_id, device=device
         )
 
+    @invalidates("server", "volume")
     def detach_volume(self, server_id: str, volume_id: str) -> None:
         """
         Detach a volume from a Compute server.
@@ -1,29 +1,227 @@
-import openstack
+from __future__ import annotations
+
+import functools
+import threading
+
+from typing import TYPE_CHECKING
 
 from fastmcp import FastMCP
-from openstack import connection
-from openstack.config.loader import OpenStackConfig
 
 from openstack_mcp_server import config
+from openstack_mcp_server.tools.lazy import lazy_import
+from openstack_mcp_server.tools.token_cache import TokenCache
+
+
+if TYPE_CHECKING:
+    from openstack import connection
+
+# NOTE: openstacksdk takes a large share of the startup time, so it is only
+# loaded when the first connection is made or the cloud config is read.
+openstack = lazy_import("openstack")
+
+
+# NOTE: Auth arguments holding secrets are never part of a token cache key.
+_SECRET_AUTH_ARGS = ("password", "secret", "token")
 
 
 class ConnectionManager:
     _cloud_name = config.MCP_CLOUD_NAME
 
+    # NOTE: Connections are pooled at class level so that every
+    # ConnectionManager instance shares the same authenticated sessions.
+    # The pool key is (cloud name, region name, project name, thread id):
+    # tools run on worker threads and each thread keeps its own connection.
+    _connections: dict[tuple, connection.Connection] = {}
+    _lock = threading.Lock()
+    _token_cache = (
+        TokenCache(config.MCP_TOKEN_CACHE_DIR)
+        if config.MCP_TOKEN_CACHE_ENABLED
+        else None
+    )
+
     def register_tools(self, mcp: FastMCP):
         mcp.tool(self.get_cloud_config)
         mcp.tool(self.get_cloud_names)
         mcp.tool(self.get_cloud_name)
         mcp.tool(self.set_cloud_name)
 
-    def get_connection(self) -> connection.Connection:
-        return openstack.connect(cloud=self._cloud_name)
+    def get_connection(
+        self,
+        region_name: str | None = None,
+        project_name: str | None = None,
+    ) -> connection.Connection:
+        """Return a pooled connection for the current cloud.
+
+        The connection (and its keystone session) is created once per
+        (cloud, region, project) scope and thread and reused by later calls,
+        so tools do not re-parse clouds.yaml or re-authenticate on every
+        invocation.
+
+        :param region_name: Region to scope the connection to.
+        :param project_name: Project to scope the connection to.
+        :return: An openstacksdk Connection.
+        """
+        key = self._connection_key(region_name, project_name)
+        with self._lock:
+            conn = self._connections.get(key)
+            sibling = None
+            if conn is None:
+                sibling = next(
+                    (
+                        c
+                        for k, c in self._connections.items()
+                        if k[:3] == key[:3]
+                    ),
+                    None,
+                )
+
+        if conn is None:
+            conn = self._create_connection(region_name, project_name, sibling)
+            with self._lock:
+                self._connections[key] = conn
+
+        self._refresh_expiring_token(conn)
+        return conn
+
+    @classmethod
+    def invalidate_connections(cls, cloud_name: str | None = None) -> None:
+        """Close and drop pooled connections.
+
+        :param cloud_name: Only drop connections of this cloud. Drops every
+            pooled connection when omitted.
+        """
+        with cls._lock:
+            keys = [
+                key
+                for key in cls._connections
+                if cloud_name is None or key[0] == cloud_name
+            ]
+            stale = [cls._connections.pop(key) for key in keys]
+
+        for conn in stale:
+            conn.close()
+
+    def _connection_key(
+        self,
+        region_name: str | None,
+        project_name: str | None,
+    ) -> tuple:
+        return (
+            self._cloud_name,
+            region_name,
+            project_name,
+            threading.get_ident(),
+        )
+
+    def _create_connection(
+        self,
+        region_name: str | None,
+        project_name: str | None,
+        sibling: connection.Connection | None = None,
+    ) -> connection.Connection:
+        connect_args = {"cloud": self._cloud_name}
+        if region_name:
+            connect_args["region_name"] = region_name
+        if project_name:
+            connect_args["project_name"] = project_name
+        _enable_logging()
+        conn = openstack.connect(**connect_args)
+        if not self._share_auth_state(conn, sibling):
+            self._restore_auth_state(conn)
+        return conn
+
+    @staticmethod
+    def _share_auth_state(
+        conn: connection.Connection,
+        sibling: connection.Connection | None,
+    ) -> bool:
+        """Reuse the token of another thread's connection of the same scope.
+
+        :return: True if a token was copied over.
+        """
+        if sibling is None:
+            return False
+
+        auth = conn.session.auth
+        if not hasattr(auth, "set_auth_state"):
+            return False
+
+        state = sibling.session.auth.get_auth_state()
+        if not state:
+            return False
+
+        auth.set_auth_state(state)
+        return True
+
+    def _restore_auth_state(self, conn: connection.Connection) -> None:
+        """Seed a new connection with a token from the on-disk cache.
+
+        A still-valid cached token lets the first tool call after a restart
+        skip keystone entirely. Otherwise the connection authenticates now
+        and the fresh token is written back to the cache.
+        """
+        if self._token_cache is None:
+            return
+
+        auth = conn.session.auth
+        if not hasattr(auth, "set_auth_state"):
+            return
+
+        state = self._token_cache.load(self._token_cache_key(conn))
+        if state:
+            auth.set_auth_state(state)
+            if not self._is_token_expiring(auth):
+                return
+            auth.invalidate()
+
+        conn.authorize()
+        self._store_auth_state(conn)
+
+    def _store_auth_state(self, conn: connection.Connection) -> None:
+        state = conn.session.auth.get_auth_state()
+        if state:
+            self._token_cache.save(self._token_cache_key(conn), state)
+
+    def _token_cache_key(self, conn: connection.Connection) -> str:
+        scope = {
+            k: v
+            for k, v in conn.config.get_auth_args().items()
+            if not any(secret in k for secret in _SECRET_AUTH_ARGS)
+        }
+        scope["region_name"] = conn.config.get_region_name()
+        return TokenCache.make_key(self._cloud_name, scope)
+
+    def _refresh_expiring_token(self, conn: connection.Connection) -> None:
+        """Drop the cached token if it is about to expire.
+
+        keystoneauth re-authenticates transparently on the next request once
+        the token is invalidated, reusing the same keep-alive session. With
+        the token cache enabled the replacement token is fetched eagerly so
+        it can be persisted.
+        """
+        auth = conn.session.auth
+        if not self._is_token_expiring(auth):
+            return
+
+        auth.invalidate()
+        if self._token_cache is not None:
+            conn.authorize()
+            self._store_auth_state(conn)
+
+    @staticmethod
+    def _is_token_expiring(auth) -> bool:
+        auth_ref = getattr(auth, "auth_ref", None)
+        if auth_ref is None:
+            return False
+        return auth_ref.will_expire_soon(config.MCP_TOKEN_REFRESH_MARGIN)
 
     def get_cloud_names(self) -> list[str]:
         """List available cloud configurations.
 
         :return: Names of OpenStack clouds from user's config file.
         """
+        from openstack.config.loader import OpenStackConfig
+
         config = OpenStackConfig()
         return list(config.get_cloud_names())
 
@@ -32,6 +230,8 @@ class ConnectionManager:
 
         :return: Cloud configuration dictionary with credentials masked.
         """
+        from openstack.config.loader import OpenStackConfig
+
         config = OpenStackConfig()
         return ConnectionManager._mask_credential(
             config.cloud_config, ["password"]
@@ -67,4 +267,13 @@ class ConnectionManager:
 
         :param cloud_name: Name of the OpenStack cloud profile to activate.
         """
+        previous = cls._cloud_name
         cls._cloud_name = cloud_name
+        if previous != cloud_name:
+            cls.invalidate_connections(previous)
+
+
+@functools.cache
+def _enable_logging() -> None:
+    """Configure openstacksdk logging once, before the first connection."""
+    openstack.enable_logging(debug=config.MCP_DEBUG_MODE)
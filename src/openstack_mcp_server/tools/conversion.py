@@ -0,0 +1,112 @@
+import operator
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class ModelConverter(Generic[ModelT]):
+    """
+    Converts openstacksdk resources to a response model.
+
+    The accessors of the model fields are resolved once per resource class:
+    fields that are plain attributes of the same name are read together by
+    one `operator.attrgetter`, and fields the openstacksdk resource class
+    does not declare (e.g. `status` of a subnet) are None. Lists are
+    validated in a single TypeAdapter pass instead of one model
+    construction per item.
+    """
+
+    def __init__(
+        self,
+        model: type[ModelT],
+        **accessors: Callable[[Any], Any],
+    ):
+        """
+        :param model: The response model.
+        :param accessors: Callables reading a field from a resource, for
+            fields that are not a plain attribute of the same name.
+        """
+        self._model = model
+        self._adapter = TypeAdapter(list[model])
+        self._accessors = tuple(accessors.items())
+        self._names = tuple(
+            name for name in model.model_fields if name not in accessors
+        )
+        # Resource class -> (present names, their getter, missing names)
+        self._getters: dict[
+            type, tuple[tuple[str, ...], Callable, dict[str, None]]
+        ] = {}
+
+    def __call__(self, resource: Any) -> ModelT:
+        """
+        Convert one resource.
+
+        :param resource: The openstacksdk resource.
+        :return: The model.
+        """
+        return self._model.model_validate(self._values(resource))
+
+    def many(self, resources: Iterable[Any]) -> list[ModelT]:
+        """
+        Convert a list of resources.
+
+        :param resources: The openstacksdk resources.
+        :return: The models, in the same order.
+        """
+        return self._adapter.validate_python(
+            [self._values(resource) for resource in resources]
+        )
+
+    def validate_many(self, values: Iterable[Mapping]) -> list[ModelT]:
+        """
+        Validate a list of mappings already keyed by field name, such as
+        raw listings or resources the model reads as a mapping.
+
+        :param values: The mappings.
+        :return: The models, in the same order.
+        """
+        return self._adapter.validate_python(list(values))
+
+    def _values(self, resource: Any) -> dict[str, Any]:
+        resource_class = type(resource)
+        getter = self._getters.get(resource_class)
+        if getter is None:
+            getter = self._getters[resource_class] = self._getter(
+                resource_class
+            )
+        names, get_names, missing = getter
+        try:
+            values = dict(zip(names, get_names(resource)))
+        except AttributeError:
+            values = {
+                name: getattr(resource, name, None) for name in self._names
+            }
+        else:
+            values.update(missing)
+        for name, get in self._accessors:
+            values[name] = get(resource)
+        return values
+
+    def _getter(
+        self, resource_class: type
+    ) -> tuple[tuple[str, ...], Callable, dict[str, None]]:
+        # NOTE: openstacksdk resources declare their attributes on the
+        # class. Other objects, such as mocks, only have instance attributes
+        # and are read by name.
+        names = tuple(
+            name for name in self._names if hasattr(resource_class, name)
+        )
+        if not names:
+            names = self._names
+        missing = dict.fromkeys(
+            name for name in self._names if name not in names
+        )
+        # NOTE: attrgetter returns a bare value instead of a tuple for a
+        # single name, so a trailing attribute every object has is read too
+        # and dropped again by zip.
+        return names, operator.attrgetter(*names, "__class__"), missing
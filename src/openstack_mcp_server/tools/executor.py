@@ -0,0 +1,242 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastmcp import Context, FastMCP
+
+from openstack_mcp_server import config
+from openstack_mcp_server.tools.response.executor import (
+    ExecutorStats,
+    ServicePoolStats,
+)
+
+
+# Event loop and cancellation flag of the tool call a worker thread runs.
+_tool_call: contextvars.ContextVar[
+    tuple[asyncio.AbstractEventLoop, threading.Event] | None
+] = contextvars.ContextVar("tool_call", default=None)
+
+
+class ToolExecutor:
+    """
+    Runs synchronous tool bodies on a bounded worker thread pool.
+
+    openstacksdk is blocking, so calling it directly from a tool would stall
+    the event loop and every other client connected to the server. Each
+    service additionally has its own concurrency limit so that one slow
+    service cannot occupy every worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        service_limits: dict[str, int] | None = None,
+    ):
+        self._max_workers = max_workers
+        self._service_limits = service_limits or {}
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="openstack-mcp-tool",
+        )
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def register_tools(self, mcp: FastMCP):
+        mcp.tool()(self.get_tool_executor_stats)
+
+    def wrap(self, fn: Callable, service: str) -> Callable:
+        """
+        Wrap a synchronous tool so that it runs on the worker pool.
+
+        The wrapper keeps the signature and docstring of the wrapped tool, so
+        FastMCP derives the same tool schema from it.
+
+        :param fn: The tool function.
+        :param service: The OpenStack service the tool talks to.
+        :return: An async tool function.
+        """
+        if inspect.iscoroutinefunction(fn):
+            return fn
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await self.run(service, fn, *args, **kwargs)
+
+        return wrapper
+
+    async def run(self, service: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking call on the worker pool.
+
+        :param service: The OpenStack service the call talks to.
+        :param fn: The blocking callable.
+        :return: The result of the call.
+        """
+        stats = self._service_stats(service)
+        semaphore = self._semaphore(service)
+
+        # NOTE: The counters are only touched from the event loop thread.
+        stats["waiting"] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            stats["waiting"] -= 1
+
+        stats["active"] += 1
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+
+        def finish() -> None:
+            stats["active"] -= 1
+            stats["completed"] += 1
+            semaphore.release()
+
+        # NOTE: The context is copied so that the tool body still sees
+        # context variables (e.g. the FastMCP request context).
+        token = _tool_call.set((loop, cancelled))
+        ctx = contextvars.copy_context()
+        _tool_call.reset(token)
+        try:
+            future = self._pool.submit(ctx.run, fn, *args, **kwargs)
+        except BaseException:
+            finish()
+            raise
+        # NOTE: The worker thread cannot be interrupted, so the slot of the
+        # service is held until the thread is done, even if the call is
+        # cancelled before.
+        future.add_done_callback(lambda _: _call_soon(loop, finish))
+        try:
+            return await asyncio.wrap_future(future, loop=loop)
+        except asyncio.CancelledError:
+            # NOTE: Long running tool bodies poll the flag (see
+            # current_cancel_event).
+            cancelled.set()
+            raise
+
+    def get_tool_executor_stats(self) -> ExecutorStats:
+        """
+        Get saturation metrics of the worker pool that runs OpenStack calls.
+
+        :return: Pool size and per-service active, waiting and completed calls.
+        """
+        services = [
+            ServicePoolStats(
+                service=service,
+                limit=self._service_limit(service),
+                active=stats["active"],
+                waiting=stats["waiting"],
+                completed=stats["completed"],
+            )
+            for service, stats in sorted(self._stats.items())
+        ]
+        return ExecutorStats(
+            max_workers=self._max_workers,
+            active=sum(s.active for s in services),
+            waiting=sum(s.waiting for s in services),
+            services=services,
+        )
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    def _service_limit(self, service: str) -> int:
+        return min(
+            self._service_limits.get(service, self._max_workers),
+            self._max_workers,
+        )
+
+    def _semaphore(self, service: str) -> asyncio.Semaphore:
+        if service not in self._semaphores:
+            self._semaphores[service] = asyncio.Semaphore(
+                self._service_limit(service)
+            )
+        return self._semaphores[service]
+
+    def _service_stats(self, service: str) -> dict[str, int]:
+        return self._stats.setdefault(
+            service, {"active": 0, "waiting": 0, "completed": 0}
+        )
+
+
+_tool_executor = ToolExecutor(
+    max_workers=config.MCP_TOOL_WORKERS,
+    service_limits=config.MCP_SERVICE_CONCURRENCY,
+)
+
+
+def get_tool_executor() -> ToolExecutor:
+    return _tool_executor
+
+
+def current_cancel_event() -> threading.Event | None:
+    """
+    Return the flag set when the tool call of the worker thread is cancelled.
+
+    :return: The cancellation flag, or None outside of a pooled tool call.
+    """
+    tool_call = _tool_call.get()
+    return tool_call[1] if tool_call else None
+
+
+def progress_reporter(
+    ctx: Context | None,
+) -> Callable[[int, int], None] | None:
+    """
+    Build a callback sending MCP progress notifications from a worker thread.
+
+    :param ctx: The FastMCP context of the tool call.
+    :return: A (progress, total) callback, or None if progress cannot be
+        reported.
+    """
+    tool_call = _tool_call.get()
+    if ctx is None or tool_call is None:
+        return None
+    loop = tool_call[0]
+
+    def report(progress: int, total: int) -> None:
+        _submit(loop, ctx.report_progress(progress, total))
+
+    return report
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable) -> None:
+    """Schedule a callback on the event loop from any thread."""
+    try:
+        loop.call_soon_threadsafe(callback)
+    except RuntimeError:
+        # The event loop is already closed.
+        pass
+
+
+def _submit(loop: asyncio.AbstractEventLoop, coro: Coroutine) -> None:
+    """Schedule a coroutine on the event loop without waiting for it."""
+    try:
+        asyncio.run_coroutine_threadsafe(coro, loop)
+    except RuntimeError:
+        # The event loop is already closed.
+        coro.close()
+
+
+def register_service_tools(
+    mcp: FastMCP,
+    service: str,
+    tools: list[Callable],
+) -> None:
+    """
+    Register tools of an OpenStack service, running them on the worker pool.
+
+    The tools are tagged with the service, so they can be selected or
+    hidden per service.
+
+    :param mcp: The FastMCP instance.
+    :param service: The OpenStack service the tools talk to.
+    :param tools: The tool functions.
+    """
+    for tool in tools:
+        mcp.tool(tags={service})(_tool_executor.wrap(tool, service))
@@ -0,0 +1,158 @@
+import logging
+import threading
+
+from collections import OrderedDict
+
+from openstack_mcp_server import config
+from openstack_mcp_server.tools.base import get_openstack_conn
+from openstack_mcp_server.tools.bulk import get_bulk_runner
+from openstack_mcp_server.tools.connection import ConnectionManager
+
+
+logger = logging.getLogger("openstack-mcp-server")
+
+
+class FloatingIPPool:
+    """
+    Keeps unassigned floating IPs allocated per external network.
+
+    A background thread reconciles the pool of every network used so far
+    with Neutron and allocates floating IPs until `size` are free. Popping
+    an entry is atomic, so concurrent tool calls never receive the same
+    floating IP. Entries carry the revision the floating IP was indexed at;
+    assigning with `if_revision` makes Neutron reject entries that another
+    client took in the meantime. Pops only wake the refiller once fewer
+    than half of `size` floating IPs are left.
+    """
+
+    def __init__(self, size: int, refill_interval: float):
+        self._size = size
+        self._low_water = (size + 1) // 2
+        self._refill_interval = refill_interval
+        # (cloud name, network ID) -> {floating IP ID: revision number}
+        self._free: dict[tuple[str, str], OrderedDict[str, int | None]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._size > 0
+
+    def pop(self, floating_network_id: str) -> tuple[str, int | None] | None:
+        """
+        Take a free floating IP of an external network out of the pool.
+
+        The first call for a network starts pooling it, so it returns None
+        until the pool has been filled.
+
+        :param floating_network_id: External network ID
+        :return: A (floating IP ID, revision number) tuple, or None if the
+            pool of the network is empty.
+        """
+        key = self._key(floating_network_id)
+        with self._lock:
+            free = self._free.setdefault(key, OrderedDict())
+            entry = free.popitem(last=False) if free else None
+            low = len(free) < self._low_water
+            self._start()
+        if low:
+            self._wakeup.set()
+        return entry
+
+    def refill(self, floating_network_id: str) -> None:
+        """
+        Reconcile the pool of a network with Neutron and top it up.
+
+        Entries whose floating IP was assigned or deleted elsewhere are
+        dropped, then floating IPs are allocated until `size` are free.
+
+        :param floating_network_id: External network ID
+        """
+        key = self._key(floating_network_id)
+        conn = get_openstack_conn()
+
+        free: OrderedDict[str, int | None] = OrderedDict()
+        for ip in conn.network.ips(floating_network_id=floating_network_id):
+            if not ip.port_id:
+                free[ip.id] = ip.revision_number
+                if len(free) >= self._size:
+                    break
+
+        outcomes = get_bulk_runner().run(
+            lambda _: get_openstack_conn().network.create_ip(
+                floating_network_id=floating_network_id,
+            ),
+            range(self._size - len(free)),
+        )
+        for outcome in outcomes:
+            if outcome.error is not None:
+                logger.warning(
+                    f"Failed to allocate pooled floating IP on network "
+                    f"{floating_network_id}: {outcome.error}"
+                )
+                continue
+            free[outcome.result.id] = outcome.result.revision_number
+
+        with self._lock:
+            self._free[key] = free
+
+    def size(self, floating_network_id: str) -> int:
+        """
+        Return the number of pooled floating IPs of a network.
+
+        :param floating_network_id: External network ID
+        """
+        with self._lock:
+            return len(self._free.get(self._key(floating_network_id), ()))
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _start(self) -> None:
+        # NOTE: Called with the lock held.
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="openstack-mcp-floating-ip-pool",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._refill_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                return
+
+            cloud_name = ConnectionManager.get_cloud_name()
+            with self._lock:
+                keys = list(self._free)
+            for cloud, floating_network_id in keys:
+                # Connections only reach the current cloud.
+                if cloud != cloud_name:
+                    continue
+                try:
+                    self.refill(floating_network_id)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to refill floating IP pool of network "
+                        f"{floating_network_id}: {e}"
+                    )
+
+    @staticmethod
+    def _key(floating_network_id: str) -> tuple[str, str]:
+        return ConnectionManager.get_cloud_name(), floating_network_id
+
+
+_floating_ip_pool = FloatingIPPool(
+    size=config.MCP_FLOATING_IP_POOL_SIZE,
+    refill_interval=config.MCP_FLOATING_IP_POOL_REFILL_INTERVAL,
+)
+
+
+def get_floating_ip_pool() -> FloatingIPPool:
+    return _floating_ip_pool
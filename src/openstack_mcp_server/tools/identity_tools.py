@@ -1,6 +1,10 @@
 from fastmcp import FastMCP
 
 from .base import get_openstack_conn
+from .cache import cached, coalesced, invalidates
+from .executor import register_service_tools
+from .pagination import offset_page, page_limit
+from .response.common import Page
 from .response.identity import Domain, Project, Region
 
 
@@ -13,40 +17,52 @@ class IdentityTools:
         """
         Register Identity-related tools with the FastMCP instance.
         """
+        register_service_tools(
+            mcp,
+            "identity",
+            [
+                self.get_regions,
+                self.get_region,
+                self.create_region,
+                self.delete_region,
+                self.update_region,
+                self.get_domains,
+                self.get_domain,
+                self.create_domain,
+                self.delete_domain,
+                self.update_domain,
+                self.get_projects,
+                self.get_project,
+                self.create_project,
+                self.delete_project,
+                self.update_project,
+            ],
+        )
 
-        mcp.tool()(self.get_regions)
-        mcp.tool()(self.get_region)
-        mcp.tool()(self.create_region)
-        mcp.tool()(self.delete_region)
-        mcp.tool()(self.update_region)
-
-        mcp.tool()(self.get_domains)
-        mcp.tool()(self.get_domain)
-        mcp.tool()(self.create_domain)
-        mcp.tool()(self.delete_domain)
-        mcp.tool()(self.update_domain)
-
-        mcp.tool()(self.get_projects)
-        mcp.tool()(self.get_project)
-        mcp.tool()(self.create_project)
-        mcp.tool()(self.delete_project)
-        mcp.tool()(self.update_project)
-
-    def get_regions(self) -> list[Region]:
+    @cached("region")
+    def get_regions(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        refresh: bool = False,
+    ) -> Page[Region]:
         """
         Get the list of Identity regions.
 
-        :return: A list of Region objects representing the regions.
+        :param limit: Maximum number of regions to return.
+        :param cursor: The next_cursor of the previous page.
+        :param refresh: Bypass the cache and fetch fresh regions.
+
+        :return: A page of Region objects representing the regions.
         """
         conn = get_openstack_conn()
 
-        region_list = []
-        for region in conn.identity.regions():
-            region_list.append(
-                Region(id=region.id, description=region.description),
-            )
+        regions = (
+            Region(id=region.id, description=region.description)
+            for region in conn.identity.regions()
+        )
 
-        return region_list
+        return offset_page(regions, page_limit(limit), cursor)
 
     def get_region(self, id: str) -> Region:
         """
@@ -62,6 +78,7 @@ class IdentityTools:
 
         return Region(id=region.id, description=region.description)
 
+    @invalidates("region")
     def create_region(self, id: str, description: str | None = None) -> Region:
         """
         Create a new region.
@@ -77,6 +94,7 @@ class IdentityTools:
 
         return Region(id=region.id, description=region.description)
 
+    @invalidates("region")
     def delete_region(self, id: str) -> None:
         """
         Delete a region.
@@ -92,6 +110,7 @@ class IdentityTools:
 
         return None
 
+    @invalidates("region")
     def update_region(self, id: str, description: str | None = None) -> Region:
         """
         Update a region.
@@ -113,25 +132,34 @@ class IdentityTools:
             description=updated_region.description,
         )
 
-    def get_domains(self) -> list[Domain]:
+    @cached("domain")
+    def get_domains(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        refresh: bool = False,
+    ) -> Page[Domain]:
         """
         Get the list of Identity domains.
 
-        :return: A list of Domain objects representing the domains.
+        :param limit: Maximum number of domains to return.
+        :param cursor: The next_cursor of the previous page.
+        :param refresh: Bypass the cache and fetch fresh domains.
+
+        :return: A page of Domain objects representing the domains.
         """
         conn = get_openstack_conn()
 
-        domain_list = []
-        for domain in conn.identity.domains():
-            domain_list.append(
-                Domain(
-                    id=domain.id,
-                    name=domain.name,
-                    description=domain.description,
-                    is_enabled=domain.is_enabled,
-                ),
+        domains = (
+            Domain(
+                id=domain.id,
+                name=domain.name,
+                description=domain.description,
+                is_enabled=domain.is_enabled,
             )
-        return domain_list
+            for domain in conn.identity.domains()
+        )
+        return offset_page(domains, page_limit(limit), cursor)
 
     def get_domain(self, name: str) -> Domain:
         """
@@ -152,6 +180,7 @@ class IdentityTools:
             is_enabled=domain.is_enabled,
         )
 
+    @invalidates("domain")
     def create_domain(
         self,
         name: str,
@@ -180,6 +209,7 @@ class IdentityTools:
             is_enabled=domain.is_enabled,
         )
 
+    @invalidates("domain")
     def delete_domain(self, name: str) -> None:
         """
         Delete a domain.
@@ -193,6 +223,7 @@ class IdentityTools:
 
         return None
 
+    @invalidates("domain")
     def update_domain(
         self,
         id: str,
@@ -227,14 +258,22 @@ class IdentityTools:
             is_enabled=updated_domain.is_enabled,
         )
 
-    def get_projects(self, name: str | None = None) -> list[Project]:
+    @coalesced("project")
+    def get_projects(
+        self,
+        name: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Page[Project]:
         """
         Get the list of Identity projects.
 
         :param name: The name of the project.
             It is used to get a project_id from a project name.
+        :param limit: Maximum number of projects to return.
+        :param cursor: The next_cursor of the previous page.
 
-        :return: A list of Project objects representing the projects.
+        :return: A page of Project objects representing the projects.
         """
         conn = get_openstack_conn()
 
@@ -242,20 +281,19 @@ class IdentityTools:
         if name:
             filters["name"] = name
 
-        project_list = []
-        for project in conn.identity.projects(**filters):
-            project_list.append(
-                Project(
-                    id=project.id,
-                    name=project.name,
-                    description=project.description,
-                    is_enabled=project.is_enabled,
-                    domain_id=project.domain_id,
-                    parent_id=project.parent_id,
-                ),
+        projects = (
+            Project(
+                id=project.id,
+                name=project.name,
+                description=project.description,
+                is_enabled=project.is_enabled,
+                domain_id=project.domain_id,
+                parent_id=project.parent_id,
             )
+            for project in conn.identity.projects(**filters)
+        )
 
-        return project_list
+        return offset_page(projects, page_limit(limit), cursor)
 
     def get_project(self, name: str) -> Project:
         """
@@ -280,6 +318,7 @@ class IdentityTools:
             parent_id=project.parent_id,
         )
 
+    @invalidates("project")
     def create_project(
         self,
         name: str,
@@ -318,6 +357,7 @@ class IdentityTools:
             parent_id=project.parent_id,
         )
 
+    @invalidates("project")
     def delete_project(self, id: str) -> None:
         """
         Delete a project.
@@ -328,6 +368,7 @@ class IdentityTools:
         conn.identity.delete_project(project=id, ignore_missing=False)
         return None
 
+    @invalidates("project")
     def update_project(
         self,
         id: str,
@@ -1,9 +1,15 @@
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from openstack_mcp_server.tools.request.image import CreateImage
 from openstack_mcp_server.tools.response.image import Image
 
 from .base import get_openstack_conn
+from .cache import cached, invalidates
+from .executor import progress_reporter, register_service_tools
+from .pagination import marker_page, marker_query, page_limit
+from .projection import projected_fields
+from .response.common import Page
+from .waiter import DELETED, get_waiter
 
 
 class ImageTools:
@@ -15,11 +21,16 @@ class ImageTools:
         """
         Register Image-related tools with the FastMCP instance.
         """
-
-        mcp.tool()(self.get_image)
-        mcp.tool()(self.get_images)
-        mcp.tool()(self.create_image)
-        mcp.tool()(self.delete_image)
+        register_service_tools(
+            mcp,
+            "image",
+            [
+                self.get_image,
+                self.get_images,
+                self.create_image,
+                self.delete_image,
+            ],
+        )
 
     def get_image(self, id: str) -> Image:
         """
@@ -29,12 +40,17 @@ class ImageTools:
         image = conn.image.get_image(id)
         return Image(**image)
 
+    @cached("image")
     def get_images(
         self,
         name: str | None = None,
         status: str | None = None,
         visibility: str | None = None,
-    ) -> list[Image]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        refresh: bool = False,
+    ) -> Page[Image]:
         """
         Get the list of OpenStack images with optional filtering.
 
@@ -45,9 +61,14 @@ class ImageTools:
         :param name: Filter by image name
         :param status: Filter by status
         :param visibility: Filter by visibility
-        :return: A list of Image objects.
+        :param limit: Maximum number of images to return
+        :param cursor: The next_cursor of the previous page
+        :param fields: Fields to return for each image, by default every field
+        :param refresh: Bypass the cache and fetch fresh images
+        :return: A page of Image objects.
         """
         conn = get_openstack_conn()
+        projection = projected_fields(Image, fields)
 
         # Build filters for the image query
         filters = {}
@@ -58,13 +79,21 @@ class ImageTools:
         if visibility and visibility.strip():
             filters["visibility"] = visibility.strip()
 
-        image_list = []
-        for image in conn.image.images(**filters):
-            image_list.append(Image(**image))
+        limit = page_limit(limit)
+        images = conn.image.images(**filters, **marker_query(limit, cursor))
 
-        return image_list
+        return marker_page(
+            (Image(**image) for image in images), limit
+        ).project(projection)
 
-    def create_image(self, image_data: CreateImage) -> Image:
+    @invalidates("image")
+    def create_image(
+        self,
+        image_data: CreateImage,
+        wait: bool = False,
+        timeout: int = 3600,
+        ctx: Context | None = None,
+    ) -> Image:
         """Create a new Openstack image.
         This method handles both cases of image creation:
         1. If a volume is provided, it creates an image from the volume.
@@ -79,6 +108,8 @@ class ImageTools:
             - must provide a glance_region and glance_image_id.
 
         :param image_data: An instance of CreateImage containing the image details.
+        :param wait: If True, wait until the image is active or failed to import.
+        :param timeout: Maximum number of seconds to wait.
         :return: An Image object representing the created image.
         """
         conn = get_openstack_conn()
@@ -120,9 +151,20 @@ class ImageTools:
                 remote_service_interface=image_data.import_options.glance_service_interface,
             )
 
+        if wait:
+            get_waiter().wait(
+                "image",
+                [created_image.id],
+                targets={"active"},
+                failures={"killed", "deleted", DELETED},
+                timeout=timeout,
+                on_progress=progress_reporter(ctx),
+            )
+
         image = conn.get_image(created_image.id)
         return Image(**image)
 
+    @invalidates("image")
     def delete_image(self, image_id: str) -> None:
         """
         Delete an OpenStack image.
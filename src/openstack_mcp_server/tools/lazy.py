@@ -0,0 +1,25 @@
+import importlib.util
+import sys
+
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module whose code only runs on first attribute access.
+
+    :param name: The absolute module name.
+    :return: The module, loaded already if it was imported before.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
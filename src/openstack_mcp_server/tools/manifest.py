@@ -0,0 +1,213 @@
+import asyncio
+import importlib
+import importlib.metadata
+import json
+import logging
+import threading
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Annotated, Any
+
+from fastmcp import FastMCP
+from fastmcp.tools import Tool, ToolResult
+from pydantic import Field
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+
+# Packages generating the tool schemas. Their versions are recorded in the
+# manifest, which is only used when the installed versions match.
+SCHEMA_PACKAGES = ("fastmcp", "pydantic")
+
+# Classes of the OpenStack service tools, in registration order.
+SERVICE_TOOL_CLASSES = (
+    ("openstack_mcp_server.tools.compute_tools", "ComputeTools"),
+    ("openstack_mcp_server.tools.image_tools", "ImageTools"),
+    ("openstack_mcp_server.tools.identity_tools", "IdentityTools"),
+    ("openstack_mcp_server.tools.network_tools", "NetworkTools"),
+    ("openstack_mcp_server.tools.block_storage_tools", "BlockStorageTools"),
+    ("openstack_mcp_server.tools.bulk_tools", "BulkTools"),
+)
+
+# Tool attributes stored in the manifest, as shown by tools/list.
+_SCHEMA_FIELDS = {
+    "name",
+    "title",
+    "description",
+    "tags",
+    "parameters",
+    "output_schema",
+    "annotations",
+}
+
+_loaded: dict[tuple[str, str], FastMCP] = {}
+_lock = threading.Lock()
+
+
+class LazyTool(Tool):
+    """
+    A tool registered from its manifest entry.
+
+    Listing the tool only needs the schemas stored in the manifest. The
+    module implementing it, with openstacksdk and the response models, is
+    imported on the first call of any tool of its class.
+    """
+
+    tool_module: Annotated[str, Field(exclude=True)]
+    tool_class: Annotated[str, Field(exclude=True)]
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        key = (self.tool_module, self.tool_class)
+        server = _loaded.get(key)
+        if server is None:
+            # NOTE: Importing the tool module blocks for a while, so it runs
+            # off the event loop.
+            server = await asyncio.to_thread(_load_tool_class, *key)
+
+        tool = await server.get_tool(self.name)
+        if tool is None:
+            raise RuntimeError(
+                f"Tool {self.name} is not registered by {self.tool_class}, "
+                "the tool manifest is out of date"
+            )
+        return await tool.run(arguments)
+
+
+def _load_tool_class(module: str, class_name: str) -> FastMCP:
+    """
+    Import a tool class and register its tools on a private server.
+
+    :param module: The module of the tool class.
+    :param class_name: The tool class name.
+    :return: The server holding the tools of the class.
+    """
+    key = (module, class_name)
+    with _lock:
+        if key not in _loaded:
+            tools = getattr(importlib.import_module(module), class_name)()
+            server = FastMCP(class_name)
+            tools.register_tools(server)
+            _loaded[key] = server
+        return _loaded[key]
+
+
+def register_manifest_tools(
+    mcp: FastMCP,
+    services: Iterable[str] = (),
+    tools: Iterable[str] = (),
+) -> None:
+    """
+    Register the OpenStack service tools from the tool manifest.
+
+    Without services or tools every tool is registered. Otherwise only the
+    tools of the given services and the given tools are.
+
+    The manifest schemas are those generated by the fastmcp and pydantic
+    versions recorded in it. With other versions installed, the tool
+    classes are imported and their tools registered eagerly instead.
+
+    :param mcp: The FastMCP instance.
+    :param services: The services whose tools are registered, e.g. compute.
+    :param tools: The names of further tools to register.
+    """
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    entries = manifest["tools"]
+    services, tools = set(services), set(tools)
+
+    unknown_services = services.difference(
+        *(entry["tags"] for entry in entries)
+    )
+    if unknown_services:
+        raise ValueError(
+            f"Unknown services: {', '.join(sorted(unknown_services))}"
+        )
+    unknown_tools = tools - {entry["name"] for entry in entries}
+    if unknown_tools:
+        raise ValueError(f"Unknown tools: {', '.join(sorted(unknown_tools))}")
+
+    selected = [
+        entry
+        for entry in entries
+        if not (services or tools)
+        or entry["name"] in tools
+        or not services.isdisjoint(entry["tags"])
+    ]
+
+    versions = schema_versions()
+    if manifest["versions"] == versions:
+        for entry in selected:
+            mcp.add_tool(LazyTool(**entry))
+        return
+
+    logger.warning(
+        "The tool manifest was generated with %s, not the installed %s; "
+        "registering the tools eagerly",
+        manifest["versions"],
+        versions,
+    )
+    classes = dict.fromkeys(
+        (entry["tool_module"], entry["tool_class"]) for entry in selected
+    )
+    for module, class_name in classes:
+        getattr(importlib.import_module(module), class_name)().register_tools(
+            mcp
+        )
+    unselected = {
+        entry["name"]
+        for entry in entries
+        if (entry["tool_module"], entry["tool_class"]) in classes
+    } - {entry["name"] for entry in selected}
+    if unselected:
+        mcp.disable(names=unselected, components={"tool"})
+
+
+def schema_versions() -> dict[str, str]:
+    """
+    Get the installed versions of the packages generating the tool schemas.
+
+    :return: The version of each package by name.
+    """
+    return {
+        package: importlib.metadata.version(package)
+        for package in SCHEMA_PACKAGES
+    }
+
+
+async def build_manifest() -> dict[str, Any]:
+    """
+    Build the manifest of the service tools.
+
+    Every tool class is imported and registered, so the entries hold the
+    exact schemas the tools have when registered directly.
+
+    :return: The versions of the packages generating the schemas and the
+        tool entries, in registration order.
+    """
+    entries = []
+    for module, class_name in SERVICE_TOOL_CLASSES:
+        server = _load_tool_class(module, class_name)
+        for tool in await server.list_tools():
+            entry = tool.model_dump(
+                mode="json", include=_SCHEMA_FIELDS, exclude_none=True
+            )
+            entry["tags"] = sorted(entry["tags"])
+            entries.append(
+                {**entry, "tool_module": module, "tool_class": class_name}
+            )
+    return {"versions": schema_versions(), "tools": entries}
+
+
+def write_manifest() -> None:
+    """Regenerate the tool manifest after tools or their models change."""
+    manifest = asyncio.run(build_manifest())
+    MANIFEST_PATH.write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+if __name__ == "__main__":
+    write_manifest()
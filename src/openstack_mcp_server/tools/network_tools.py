@@ -1,19 +1,96 @@
+from collections.abc import Callable
+
 from fastmcp import FastMCP
+from openstack import exceptions
+from openstack.network.v2 import network as sdk_network
+from openstack.network.v2 import port as sdk_port
+from openstack.network.v2 import security_group as sdk_security_group
+from openstack.network.v2 import subnet as sdk_subnet
+
+from openstack_mcp_server import config
 
 from .base import get_openstack_conn
+from .bulk import get_bulk_runner
+from .cache import coalesced, invalidates
+from .conversion import ModelConverter
+from .executor import register_service_tools
+from .floating_ip_pool import get_floating_ip_pool
+from .pagination import marker_page, marker_query, page_limit
+from .projection import fields_query, projected_fields
+from .raw_listing import raw_list
 from .request.network import (
+    CreateNetwork,
+    CreatePort,
+    CreateSubnet,
     ExternalGatewayInfo,
     Route,
 )
+from .response.common import BulkError, BulkResult, Page
 from .response.network import (
     FloatingIP,
     Network,
+    NetworkTopology,
     Port,
     Router,
     RouterInterface,
     SecurityGroup,
     SecurityGroupRule,
     Subnet,
+    TopologyDevice,
+    TopologyNetwork,
+    TopologyPort,
+    TopologyRouter,
+    TopologySubnet,
+)
+
+
+# Device owners of ports plugging a router into a subnet.
+_ROUTER_INTERFACE_OWNERS = (
+    "network:router_interface",
+    "network:router_interface_distributed",
+    "network:ha_router_replicated_interface",
+)
+
+# Maximum number of IDs in one query string filter, which keeps request
+# URLs well below the limits of API frontends.
+_ID_QUERY_CHUNK_SIZE = 100
+
+# Statuses of bulk create requests a plugin without bulk support rejects.
+# A chunk failing otherwise, e.g. on a timeout, may have been created.
+_BULK_UNSUPPORTED_STATUSES = {400, 404, 501}
+
+_network_converter = ModelConverter(
+    Network,
+    name=lambda n: n.name or "",
+    status=lambda n: n.status or "",
+    description=lambda n: n.description or None,
+    is_admin_state_up=lambda n: n.is_admin_state_up or False,
+    is_shared=lambda n: n.is_shared or False,
+    mtu=lambda n: n.mtu or None,
+    provider_network_type=lambda n: n.provider_network_type or None,
+    provider_physical_network=lambda n: n.provider_physical_network or None,
+    provider_segmentation_id=lambda n: n.provider_segmentation_id or None,
+    project_id=lambda n: n.project_id or None,
+)
+_subnet_converter = ModelConverter(Subnet)
+_port_converter = ModelConverter(Port)
+_floating_ip_converter = ModelConverter(FloatingIP)
+_router_converter = ModelConverter(Router)
+_security_group_rule_converter = ModelConverter(SecurityGroupRule)
+
+
+def _security_group_rule_ids(openstack_sg) -> list[str] | None:
+    # NOTE: Embedded rules are plain dicts, only their IDs are read.
+    rules = getattr(openstack_sg, "security_group_rules", None)
+    if rules is None:
+        return None
+    return [str(rule["id"]) for rule in rules if rule.get("id")]
+
+
+_security_group_converter = ModelConverter(
+    SecurityGroup,
+    security_group_rule_ids=_security_group_rule_ids,
+    security_group_rules=lambda sg: None,
 )
 
 
@@ -26,57 +103,74 @@ class NetworkTools:
         """
         Register Network-related tools with the FastMCP instance.
         """
+        register_service_tools(
+            mcp,
+            "network",
+            [
+                self.get_networks,
+                self.create_network,
+                self.create_networks,
+                self.get_network_detail,
+                self.update_network,
+                self.delete_network,
+                self.get_subnets,
+                self.create_subnet,
+                self.create_subnets,
+                self.get_subnet_detail,
+                self.update_subnet,
+                self.delete_subnet,
+                self.get_ports,
+                self.create_port,
+                self.create_ports,
+                self.get_port_detail,
+                self.update_port,
+                self.delete_port,
+                self.get_port_allowed_address_pairs,
+                self.set_port_binding,
+                self.get_floating_ips,
+                self.create_floating_ip,
+                self.delete_floating_ip,
+                self.update_floating_ip,
+                self.create_floating_ips_bulk,
+                self.assign_first_available_floating_ip,
+                self.get_routers,
+                self.create_router,
+                self.get_router_detail,
+                self.update_router,
+                self.delete_router,
+                self.add_router_interface,
+                self.get_router_interfaces,
+                self.remove_router_interface,
+                self.get_security_groups,
+                self.create_security_group,
+                self.get_security_group_detail,
+                self.update_security_group,
+                self.delete_security_group,
+                self.get_network_topology,
+            ],
+        )
 
-        mcp.tool()(self.get_networks)
-        mcp.tool()(self.create_network)
-        mcp.tool()(self.get_network_detail)
-        mcp.tool()(self.update_network)
-        mcp.tool()(self.delete_network)
-        mcp.tool()(self.get_subnets)
-        mcp.tool()(self.create_subnet)
-        mcp.tool()(self.get_subnet_detail)
-        mcp.tool()(self.update_subnet)
-        mcp.tool()(self.delete_subnet)
-        mcp.tool()(self.get_ports)
-        mcp.tool()(self.create_port)
-        mcp.tool()(self.get_port_detail)
-        mcp.tool()(self.update_port)
-        mcp.tool()(self.delete_port)
-        mcp.tool()(self.get_port_allowed_address_pairs)
-        mcp.tool()(self.set_port_binding)
-        mcp.tool()(self.get_floating_ips)
-        mcp.tool()(self.create_floating_ip)
-        mcp.tool()(self.delete_floating_ip)
-        mcp.tool()(self.update_floating_ip)
-        mcp.tool()(self.create_floating_ips_bulk)
-        mcp.tool()(self.assign_first_available_floating_ip)
-        mcp.tool()(self.get_routers)
-        mcp.tool()(self.create_router)
-        mcp.tool()(self.get_router_detail)
-        mcp.tool()(self.update_router)
-        mcp.tool()(self.delete_router)
-        mcp.tool()(self.add_router_interface)
-        mcp.tool()(self.get_router_interfaces)
-        mcp.tool()(self.remove_router_interface)
-        mcp.tool()(self.get_security_groups)
-        mcp.tool()(self.create_security_group)
-        mcp.tool()(self.get_security_group_detail)
-        mcp.tool()(self.update_security_group)
-        mcp.tool()(self.delete_security_group)
-
+    @coalesced("network")
     def get_networks(
         self,
         status_filter: str | None = None,
         shared_only: bool = False,
-    ) -> list[Network]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Page[Network]:
         """
         Get the list of Networks with optional filtering.
 
         :param status_filter: Filter networks by status (e.g., `ACTIVE`, `DOWN`)
         :param shared_only: If True, only show shared networks
-        :return: List of Network objects
+        :param limit: Maximum number of networks to return
+        :param cursor: The next_cursor of the previous page
+        :param fields: Fields to return for each network, by default every field
+        :return: Page of Network objects
         """
         conn = get_openstack_conn()
+        projection = projected_fields(Network, fields)
 
         filters = {}
 
@@ -86,12 +180,16 @@ class NetworkTools:
         if shared_only:
             filters["is_shared"] = True
 
-        networks = conn.network.networks(**filters)
+        limit = page_limit(limit)
+        networks = conn.network.networks(
+            **filters, **marker_query(limit, cursor)
+        )
 
-        return [
-            self._convert_to_network_model(network) for network in networks
-        ]
+        return marker_page(networks, limit, _network_converter.many).project(
+            projection
+        )
 
+    @invalidates("network")
     def create_network(
         self,
         name: str,
@@ -117,32 +215,89 @@ class NetworkTools:
         """
         conn = get_openstack_conn()
 
-        network_args = {
-            "name": name,
-            "admin_state_up": is_admin_state_up,
-            "shared": is_shared,
+        network_args = self._network_args(
+            CreateNetwork(
+                name=name,
+                description=description,
+                is_admin_state_up=is_admin_state_up,
+                is_shared=is_shared,
+                provider_network_type=provider_network_type,
+                provider_physical_network=provider_physical_network,
+                provider_segmentation_id=provider_segmentation_id,
+                project_id=project_id,
+            )
+        )
+
+        network = conn.network.create_network(**network_args)
+
+        return self._convert_to_network_model(network)
+
+    @invalidates("network")
+    def create_networks(
+        self,
+        networks: list[CreateNetwork],
+        chunk_size: int = 100,
+        concurrency: int | None = None,
+    ) -> BulkResult[Network]:
+        """
+        Create many Networks with Neutron's bulk create API.
+
+        Networks are sent in chunks of `chunk_size` per request. A chunk
+        the bulk API rejects is retried as concurrent single creates, so
+        failures are reported per network. Other chunk errors fail every
+        network of the chunk without a retry.
+
+        :param networks: Attributes of the networks to create
+        :param chunk_size: Maximum number of networks per bulk request
+        :param concurrency: Maximum number of concurrent requests
+        :return: Created Network objects and per-network errors
+        """
+        return self._bulk_create(
+            [self._network_args(network) for network in networks],
+            lambda conn, data: sdk_network.Network.bulk_create(
+                conn.network, data
+            ),
+            lambda conn, args: conn.network.create_network(**args),
+            self._convert_to_network_model,
+            chunk_size,
+            concurrency,
+        )
+
+    def _network_args(self, network: CreateNetwork) -> dict:
+        """
+        Translate network attributes into openstacksdk create arguments.
+
+        :param network: Attributes of the network to create
+        :return: Arguments of the create call
+        """
+        network_args: dict = {
+            "name": network.name,
+            "admin_state_up": network.is_admin_state_up,
+            "shared": network.is_shared,
         }
 
-        if description:
-            network_args["description"] = description
+        if network.description:
+            network_args["description"] = network.description
 
-        if provider_network_type:
-            network_args["provider_network_type"] = provider_network_type
+        if network.provider_network_type:
+            network_args["provider_network_type"] = (
+                network.provider_network_type
+            )
 
-        if project_id:
-            network_args["project_id"] = project_id
+        if network.project_id:
+            network_args["project_id"] = network.project_id
 
-        if provider_physical_network:
+        if network.provider_physical_network:
             network_args["provider_physical_network"] = (
-                provider_physical_network
+                network.provider_physical_network
             )
 
-        if provider_segmentation_id is not None:
-            network_args["provider_segmentation_id"] = provider_segmentation_id
-
-        network = conn.network.create_network(**network_args)
+        if network.provider_segmentation_id is not None:
+            network_args["provider_segmentation_id"] = (
+                network.provider_segmentation_id
+            )
 
-        return self._convert_to_network_model(network)
+        return network_args
 
     def get_network_detail(self, network_id: str) -> Network:
         """
@@ -156,6 +311,7 @@ class NetworkTools:
         network = conn.network.get_network(network_id)
         return self._convert_to_network_model(network)
 
+    @invalidates("network")
     def update_network(
         self,
         network_id: str,
@@ -193,6 +349,7 @@ class NetworkTools:
         network = conn.network.update_network(network_id, **update_args)
         return self._convert_to_network_model(network)
 
+    @invalidates("network")
     def delete_network(self, network_id: str) -> None:
         """
         Delete a Network.
@@ -212,23 +369,9 @@ class NetworkTools:
         :param openstack_network: OpenStack network object
         :return: Pydantic Network model
         """
-        return Network(
-            id=openstack_network.id,
-            name=openstack_network.name or "",
-            status=openstack_network.status or "",
-            description=openstack_network.description or None,
-            is_admin_state_up=openstack_network.is_admin_state_up or False,
-            is_shared=openstack_network.is_shared or False,
-            mtu=openstack_network.mtu or None,
-            provider_network_type=openstack_network.provider_network_type
-            or None,
-            provider_physical_network=openstack_network.provider_physical_network
-            or None,
-            provider_segmentation_id=openstack_network.provider_segmentation_id
-            or None,
-            project_id=openstack_network.project_id or None,
-        )
+        return _network_converter(openstack_network)
 
+    @coalesced("subnet")
     def get_subnets(
         self,
         network_id: str | None = None,
@@ -236,7 +379,10 @@ class NetworkTools:
         project_id: str | None = None,
         has_gateway: bool | None = None,
         is_dhcp_enabled: bool | None = None,
-    ) -> list[Subnet]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Page[Subnet]:
         """
         Get the list of Subnets with optional filtering.
 
@@ -244,7 +390,7 @@ class NetworkTools:
         DHCP-enabled state.
 
         Notes:
-        - has_gateway is applied client-side after retrieval and checks whether `gateway_ip` is set.
+        - has_gateway is applied client-side while streaming the listing and checks whether `gateway_ip` is set.
         - `is_dhcp_enabled` maps to Neutron's `enable_dhcp` filter.
         - Combining filters further restricts the result (logical AND).
 
@@ -258,9 +404,13 @@ class NetworkTools:
         :param project_id: Filter by project ID
         :param has_gateway: True for subnets with a gateway, False for no gateway
         :param is_dhcp_enabled: True for DHCP-enabled subnets, False for disabled
-        :return: List of Subnet objects
+        :param limit: Maximum number of subnets to return
+        :param cursor: The next_cursor of the previous page
+        :param fields: Fields to return for each subnet, by default every field
+        :return: Page of Subnet objects
         """
         conn = get_openstack_conn()
+        projection = projected_fields(Subnet, fields)
         filters: dict = {}
         if network_id:
             filters["network_id"] = network_id
@@ -270,13 +420,22 @@ class NetworkTools:
             filters["project_id"] = project_id
         if is_dhcp_enabled is not None:
             filters["enable_dhcp"] = is_dhcp_enabled
-        subnets = conn.network.subnets(**filters)
+        limit = page_limit(limit)
+        subnets = conn.network.subnets(
+            **filters, **marker_query(limit, cursor)
+        )
+        # NOTE: Neutron cannot filter on a null gateway_ip, so has_gateway
+        # is applied while streaming the listing. Only as many subnets as
+        # fill the page are fetched and no intermediate list is built.
         if has_gateway is not None:
-            subnets = [
+            subnets = (
                 s for s in subnets if (s.gateway_ip is not None) == has_gateway
-            ]
-        return [self._convert_to_subnet_model(subnet) for subnet in subnets]
+            )
+        return marker_page(subnets, limit, _subnet_converter.many).project(
+            projection
+        )
 
+    @invalidates("subnet")
     def create_subnet(
         self,
         network_id: str,
@@ -306,27 +465,81 @@ class NetworkTools:
         :return: Created Subnet object
         """
         conn = get_openstack_conn()
-        subnet_args: dict = {
-            "network_id": network_id,
-            "cidr": cidr,
-            "ip_version": ip_version,
-            "enable_dhcp": is_dhcp_enabled,
-        }
-        if name:
-            subnet_args["name"] = name
-        if description:
-            subnet_args["description"] = description
-        if gateway_ip:
-            subnet_args["gateway_ip"] = gateway_ip
-        if dns_nameservers is not None:
-            subnet_args["dns_nameservers"] = dns_nameservers
-        if allocation_pools is not None:
-            subnet_args["allocation_pools"] = allocation_pools
-        if host_routes is not None:
-            subnet_args["host_routes"] = host_routes
+        subnet_args = self._subnet_args(
+            CreateSubnet(
+                network_id=network_id,
+                cidr=cidr,
+                name=name,
+                ip_version=ip_version,
+                gateway_ip=gateway_ip,
+                is_dhcp_enabled=is_dhcp_enabled,
+                description=description,
+                dns_nameservers=dns_nameservers,
+                allocation_pools=allocation_pools,
+                host_routes=host_routes,
+            )
+        )
         subnet = conn.network.create_subnet(**subnet_args)
         return self._convert_to_subnet_model(subnet)
 
+    @invalidates("subnet")
+    def create_subnets(
+        self,
+        subnets: list[CreateSubnet],
+        chunk_size: int = 100,
+        concurrency: int | None = None,
+    ) -> BulkResult[Subnet]:
+        """
+        Create many Subnets with Neutron's bulk create API.
+
+        Subnets are sent in chunks of `chunk_size` per request. A chunk
+        the bulk API rejects is retried as concurrent single creates, so
+        failures are reported per subnet. Other chunk errors fail every
+        subnet of the chunk without a retry.
+
+        :param subnets: Attributes of the subnets to create
+        :param chunk_size: Maximum number of subnets per bulk request
+        :param concurrency: Maximum number of concurrent requests
+        :return: Created Subnet objects and per-subnet errors
+        """
+        return self._bulk_create(
+            [self._subnet_args(subnet) for subnet in subnets],
+            lambda conn, data: sdk_subnet.Subnet.bulk_create(
+                conn.network, data
+            ),
+            lambda conn, args: conn.network.create_subnet(**args),
+            self._convert_to_subnet_model,
+            chunk_size,
+            concurrency,
+        )
+
+    def _subnet_args(self, subnet: CreateSubnet) -> dict:
+        """
+        Translate subnet attributes into openstacksdk create arguments.
+
+        :param subnet: Attributes of the subnet to create
+        :return: Arguments of the create call
+        """
+        subnet_args: dict = {
+            "network_id": subnet.network_id,
+            "cidr": subnet.cidr,
+            "ip_version": subnet.ip_version,
+            "enable_dhcp": subnet.is_dhcp_enabled,
+        }
+        if subnet.name:
+            subnet_args["name"] = subnet.name
+        if subnet.description:
+            subnet_args["description"] = subnet.description
+        if subnet.gateway_ip:
+            subnet_args["gateway_ip"] = subnet.gateway_ip
+        if subnet.dns_nameservers is not None:
+            subnet_args["dns_nameservers"] = subnet.dns_nameservers
+        if subnet.allocation_pools is not None:
+            subnet_args["allocation_pools"] = subnet.allocation_pools
+        if subnet.host_routes is not None:
+            subnet_args["host_routes"] = subnet.host_routes
+        return subnet_args
+
     def get_subnet_detail(self, subnet_id: str) -> Subnet:
         """
         Get detailed information about a specific Subnet.
@@ -338,6 +551,7 @@ class NetworkTools:
         subnet = conn.network.get_subnet(subnet_id)
         return self._convert_to_subnet_model(subnet)
 
+    @invalidates("subnet")
     def update_subnet(
         self,
         subnet_id: str,
@@ -407,6 +621,7 @@ class NetworkTools:
         subnet = conn.network.update_subnet(subnet_id, **update_args)
         return self._convert_to_subnet_model(subnet)
 
+    @invalidates("subnet")
     def delete_subnet(self, subnet_id: str) -> None:
         """
         Delete a Subnet.
@@ -425,39 +640,31 @@ class NetworkTools:
         :param openstack_subnet: OpenStack subnet object
         :return: Pydantic Subnet model
         """
-        return Subnet(
-            id=openstack_subnet.id,
-            name=openstack_subnet.name,
-            status=getattr(openstack_subnet, "status", None),
-            description=openstack_subnet.description,
-            project_id=openstack_subnet.project_id,
-            network_id=openstack_subnet.network_id,
-            cidr=openstack_subnet.cidr,
-            ip_version=openstack_subnet.ip_version,
-            gateway_ip=openstack_subnet.gateway_ip,
-            is_dhcp_enabled=openstack_subnet.is_dhcp_enabled,
-            allocation_pools=getattr(
-                openstack_subnet, "allocation_pools", None
-            ),
-            dns_nameservers=getattr(openstack_subnet, "dns_nameservers", None),
-            host_routes=getattr(openstack_subnet, "host_routes", None),
-        )
+        return _subnet_converter(openstack_subnet)
 
+    @coalesced("port")
     def get_ports(
         self,
         status_filter: str | None = None,
         device_id: str | None = None,
         network_id: str | None = None,
-    ) -> list[Port]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Page[Port]:
         """
         Get the list of Ports with optional filtering.
 
         :param status_filter: Filter by port status (e.g., `ACTIVE`, `DOWN`)
         :param device_id: Filter by device ID
         :param network_id: Filter by network ID
-        :return: List of Port objects
+        :param limit: Maximum number of ports to return
+        :param cursor: The next_cursor of the previous page
+        :param fields: Fields to return for each port, by default every field
+        :return: Page of Port objects
         """
         conn = get_openstack_conn()
+        projection = projected_fields(Port, fields)
         filters: dict = {}
         if status_filter:
             filters["status"] = status_filter.upper()
@@ -466,9 +673,26 @@ class NetworkTools:
         if network_id:
             filters["network_id"] = network_id
 
-        ports = conn.network.ports(**filters)
+        limit = page_limit(limit)
+        # NOTE: Neutron only returns the projected attributes, which cuts
+        # the payload of large port listings.
+        query = {
+            **filters,
+            **marker_query(limit, cursor),
+            **fields_query(sdk_port.Port, projection),
+        }
+        if config.MCP_RAW_LISTINGS:
+            page = marker_page(
+                raw_list(conn.network, sdk_port.Port, **query),
+                limit,
+                _port_converter.validate_many,
+            )
+        else:
+            page = marker_page(
+                conn.network.ports(**query), limit, _port_converter.many
+            )
 
-        return [self._convert_to_port_model(port) for port in ports]
+        return page.project(projection)
 
     def get_port_allowed_address_pairs(self, port_id: str) -> list[dict]:
         """
@@ -481,6 +705,7 @@ class NetworkTools:
         port = conn.network.get_port(port_id)
         return list(port.allowed_address_pairs or [])
 
+    @invalidates("port")
     def set_port_binding(
         self,
         port_id: str,
@@ -511,6 +736,7 @@ class NetworkTools:
         updated = conn.network.update_port(port_id, **update_args)
         return self._convert_to_port_model(updated)
 
+    @invalidates("port")
     def create_port(
         self,
         network_id: str,
@@ -534,23 +760,151 @@ class NetworkTools:
         :return: Created Port object
         """
         conn = get_openstack_conn()
-        port_args: dict = {
-            "network_id": network_id,
-            "admin_state_up": is_admin_state_up,
-        }
-        if name:
-            port_args["name"] = name
-        if description:
-            port_args["description"] = description
-        if device_id:
-            port_args["device_id"] = device_id
-        if fixed_ips is not None:
-            port_args["fixed_ips"] = fixed_ips
-        if security_group_ids is not None:
-            port_args["security_groups"] = security_group_ids
+        port_args = self._port_args(
+            CreatePort(
+                network_id=network_id,
+                name=name,
+                description=description,
+                is_admin_state_up=is_admin_state_up,
+                device_id=device_id,
+                fixed_ips=fixed_ips,
+                security_group_ids=security_group_ids,
+            )
+        )
         port = conn.network.create_port(**port_args)
         return self._convert_to_port_model(port)
 
+    @invalidates("port")
+    def create_ports(
+        self,
+        ports: list[CreatePort],
+        chunk_size: int = 100,
+        concurrency: int | None = None,
+    ) -> BulkResult[Port]:
+        """
+        Create many Ports with Neutron's bulk create API.
+
+        Ports are sent in chunks of `chunk_size` per request. A chunk
+        the bulk API rejects is retried as concurrent single creates, so
+        failures are reported per port. Other chunk errors fail every
+        port of the chunk without a retry.
+
+        :param ports: Attributes of the ports to create
+        :param chunk_size: Maximum number of ports per bulk request
+        :param concurrency: Maximum number of concurrent requests
+        :return: Created Port objects and per-port errors
+        """
+        return self._bulk_create(
+            [self._port_args(port) for port in ports],
+            lambda conn, data: conn.network.create_ports(data),
+            lambda conn, args: conn.network.create_port(**args),
+            self._convert_to_port_model,
+            chunk_size,
+            concurrency,
+        )
+
+    def _port_args(self, port: CreatePort) -> dict:
+        """
+        Translate port attributes into openstacksdk create arguments.
+
+        :param port: Attributes of the port to create
+        :return: Arguments of the create call
+        """
+        port_args: dict = {
+            "network_id": port.network_id,
+            "admin_state_up": port.is_admin_state_up,
+        }
+        if port.name:
+            port_args["name"] = port.name
+        if port.description:
+            port_args["description"] = port.description
+        if port.device_id:
+            port_args["device_id"] = port.device_id
+        if port.fixed_ips is not None:
+            port_args["fixed_ips"] = port.fixed_ips
+        if port.security_group_ids is not None:
+            port_args["security_groups"] = port.security_group_ids
+        return port_args
+
+    def _bulk_create(
+        self,
+        items: list[dict],
+        create_chunk: Callable,
+        create_one: Callable,
+        convert: Callable,
+        chunk_size: int,
+        concurrency: int | None,
+    ) -> BulkResult:
+        """
+        Create resources in chunks with Neutron's bulk create API.
+
+        A bulk request is atomic, so a chunk rejected by a plugin without
+        bulk support created nothing and its items are retried as
+        concurrent single creates. Any other chunk error, such as a timeout
+        or a server error, may come after the chunk was created, so its
+        items are reported as failed instead of being created twice.
+
+        :param items: Create arguments of each resource
+        :param create_chunk: Creates a list of resources in one request,
+            called with a connection and the list of arguments
+        :param create_one: Creates one resource, called with a connection
+            and its arguments
+        :param convert: Converts a created resource to its response model
+        :param chunk_size: Maximum number of resources per bulk request
+        :param concurrency: Maximum number of concurrent requests
+        :return: Created resources and per-item errors
+        """
+        if chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be a positive integer: {chunk_size}"
+            )
+
+        runner = get_bulk_runner()
+        indexed = list(enumerate(items))
+        chunks = [
+            indexed[start : start + chunk_size]
+            for start in range(0, len(indexed), chunk_size)
+        ]
+        outcomes = runner.run(
+            lambda chunk: list(
+                create_chunk(get_openstack_conn(), [args for _, args in chunk])
+            ),
+            chunks,
+            concurrency,
+        )
+
+        result = BulkResult()
+        rejected = []
+        for outcome in outcomes:
+            if outcome.error is None:
+                result.succeeded.extend(convert(r) for r in outcome.result)
+            elif (
+                isinstance(outcome.error, exceptions.HttpException)
+                and outcome.error.status_code in _BULK_UNSUPPORTED_STATUSES
+            ):
+                rejected.extend(outcome.item)
+            else:
+                result.failed.extend(
+                    BulkError(item=str(index), error=str(outcome.error))
+                    for index, _ in outcome.item
+                )
+
+        fallback = runner.run(
+            lambda item: create_one(get_openstack_conn(), item[1]),
+            rejected,
+            concurrency,
+        )
+        for outcome in fallback:
+            if outcome.error is None:
+                result.succeeded.append(convert(outcome.result))
+            else:
+                result.failed.append(
+                    BulkError(
+                        item=str(outcome.item[0]), error=str(outcome.error)
+                    )
+                )
+        return result
+
     def get_port_detail(self, port_id: str) -> Port:
         """
         Get detailed information about a specific Port.
@@ -562,6 +916,7 @@ class NetworkTools:
         port = conn.network.get_port(port_id)
         return self._convert_to_port_model(port)
 
+    @invalidates("port")
     def update_port(
         self,
         port_id: str,
@@ -631,6 +986,7 @@ class NetworkTools:
         port = conn.network.update_port(port_id, **update_args)
         return self._convert_to_port_model(port)
 
+    @invalidates("port")
     def delete_port(self, port_id: str) -> None:
         """
         Delete a Port.
@@ -649,23 +1005,9 @@ class NetworkTools:
         :param openstack_port: OpenStack port object
         :return: Pydantic Port model
         """
-        return Port(
-            id=openstack_port.id,
-            name=openstack_port.name,
-            status=openstack_port.status,
-            description=openstack_port.description,
-            project_id=openstack_port.project_id,
-            network_id=openstack_port.network_id,
-            is_admin_state_up=openstack_port.is_admin_state_up,
-            device_id=openstack_port.device_id,
-            device_owner=openstack_port.device_owner,
-            mac_address=openstack_port.mac_address,
-            fixed_ips=openstack_port.fixed_ips,
-            security_group_ids=openstack_port.security_group_ids
-            if hasattr(openstack_port, "security_group_ids")
-            else None,
-        )
+        return _port_converter(openstack_port)
 
+    @coalesced("floating_ip")
     def get_floating_ips(
         self,
         status_filter: str | None = None,
@@ -673,7 +1015,10 @@ class NetworkTools:
         port_id: str | None = None,
         floating_network_id: str | None = None,
         unassigned_only: bool | None = None,
-    ) -> list[FloatingIP]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Page[FloatingIP]:
         """
         Get the list of Floating IPs with optional filtering.
 
@@ -682,9 +1027,13 @@ class NetworkTools:
         :param port_id: Filter by attached port ID
         :param floating_network_id: Filter by external network ID
         :param unassigned_only: If True, return only unassigned IPs
-        :return: List of FloatingIP objects
+        :param limit: Maximum number of floating IPs to return
+        :param cursor: The next_cursor of the previous page
+        :param fields: Fields to return for each floating IP, by default every field
+        :return: Page of FloatingIP objects
         """
         conn = get_openstack_conn()
+        projection = projected_fields(FloatingIP, fields)
         filters: dict = {}
         if status_filter:
             filters["status"] = status_filter.upper()
@@ -694,11 +1043,18 @@ class NetworkTools:
             filters["port_id"] = port_id
         if floating_network_id:
             filters["floating_network_id"] = floating_network_id
-        ips = list(conn.network.ips(**filters))
+        limit = page_limit(limit)
+        ips = conn.network.ips(**filters, **marker_query(limit, cursor))
+        # NOTE: Neutron cannot filter on a null port_id, so unassigned_only
+        # is applied while streaming the listing. On a large external
+        # network this stops fetching as soon as the page is full.
         if unassigned_only:
-            ips = [i for i in ips if not i.port_id]
-        return [self._convert_to_floating_ip_model(ip) for ip in ips]
+            ips = (i for i in ips if not i.port_id)
+        return marker_page(ips, limit, _floating_ip_converter.many).project(
+            projection
+        )
 
+    @invalidates("floating_ip")
     def create_floating_ip(
         self,
         floating_network_id: str,
@@ -735,6 +1091,7 @@ class NetworkTools:
         ip = conn.network.create_ip(**ip_args)
         return self._convert_to_floating_ip_model(ip)
 
+    @invalidates("floating_ip")
     def attach_floating_ip_to_port(
         self,
         floating_ip_id: str,
@@ -756,6 +1113,7 @@ class NetworkTools:
         ip = conn.network.update_ip(floating_ip_id, **update_args)
         return self._convert_to_floating_ip_model(ip)
 
+    @invalidates("floating_ip")
     def update_floating_ip(
         self,
         floating_ip_id: str,
@@ -805,6 +1163,7 @@ class NetworkTools:
         ip = conn.network.update_ip(floating_ip_id, **update_args)
         return self._convert_to_floating_ip_model(ip)
 
+    @invalidates("floating_ip")
     def delete_floating_ip(self, floating_ip_id: str) -> None:
         """
         Delete a Floating IP.
@@ -816,27 +1175,69 @@ class NetworkTools:
         conn.network.delete_ip(floating_ip_id, ignore_missing=False)
         return None
 
+    @invalidates("floating_ip")
     def create_floating_ips_bulk(
         self,
         floating_network_id: str,
         count: int,
-    ) -> list[FloatingIP]:
+        concurrency: int | None = None,
+        rollback_on_error: bool = False,
+    ) -> BulkResult[FloatingIP]:
         """
         Create multiple floating IPs on the specified external network.
 
+        Floating IPs are created concurrently. A failed creation does not
+        stop the others; it is reported in `failed` instead.
+
         :param floating_network_id: External network ID
         :param count: Number of floating IPs to create (negative treated as 0)
-        :return: List of created FloatingIP objects
+        :param concurrency: Maximum number of concurrent creations
+        :param rollback_on_error: If True, delete the created floating IPs
+            when any creation fails
+        :return: Created FloatingIP objects and per-item errors
         """
-        conn = get_openstack_conn()
-        created = []
-        for _ in range(max(0, count)):
-            ip = conn.network.create_ip(
+        runner = get_bulk_runner()
+
+        def create(_):
+            return get_openstack_conn().network.create_ip(
                 floating_network_id=floating_network_id,
             )
-            created.append(self._convert_to_floating_ip_model(ip))
-        return created
 
+        outcomes = runner.run(create, range(max(0, count)), concurrency)
+        created = [o.result for o in outcomes if o.error is None]
+        result = BulkResult[FloatingIP](
+            failed=[
+                BulkError(item=str(o.item), error=str(o.error))
+                for o in outcomes
+                if o.error is not None
+            ],
+        )
+
+        if result.failed and rollback_on_error:
+            cleanup = runner.run(
+                lambda ip: get_openstack_conn().network.delete_ip(
+                    ip, ignore_missing=True
+                ),
+                created,
+                concurrency,
+            )
+            result.rolled_back = [
+                o.item.id for o in cleanup if o.error is None
+            ]
+            result.failed.extend(
+                BulkError(item=o.item.id, error=f"Rollback failed: {o.error}")
+                for o in cleanup
+                if o.error is not None
+            )
+            # Floating IPs that could not be deleted are still allocated.
+            created = [o.item for o in cleanup if o.error is not None]
+
+        result.succeeded = [
+            self._convert_to_floating_ip_model(ip) for ip in created
+        ]
+        return result
+
+    @invalidates("floating_ip")
     def assign_first_available_floating_ip(
         self,
         floating_network_id: str,
@@ -846,26 +1247,58 @@ class NetworkTools:
         Assign the first available floating IP from a network to a port.
         If none are available, create a new one and assign it.
 
+        When the floating IP pool is enabled, a pre-allocated floating IP
+        is taken from the pool and assigned with a single update.
+
         :param floating_network_id: External network ID
         :param port_id: Target port ID
         :return: Updated FloatingIP object
         """
         conn = get_openstack_conn()
-        existing = list(
-            conn.network.ips(floating_network_id=floating_network_id),
-        )
-        available = next(
-            (i for i in existing if not i.port_id),
-            None,
+
+        pool = get_floating_ip_pool()
+        if pool.enabled:
+            while (entry := pool.pop(floating_network_id)) is not None:
+                ip_id, revision_number = entry
+                try:
+                    ip = conn.network.update_ip(
+                        ip_id,
+                        if_revision=revision_number,
+                        port_id=port_id,
+                    )
+                except (
+                    exceptions.PreconditionFailedException,
+                    exceptions.NotFoundException,
+                ):
+                    # Taken or deleted by another client since it was pooled.
+                    # A conflict is caused by the port, so the next floating
+                    # IP would fail the same way and it is raised instead.
+                    continue
+                return self._convert_to_floating_ip_model(ip)
+
+        for available in conn.network.ips(
+            floating_network_id=floating_network_id,
+        ):
+            if available.port_id:
+                continue
+            try:
+                ip = conn.network.update_ip(
+                    available.id,
+                    if_revision=available.revision_number,
+                    port_id=port_id,
+                )
+            except (
+                exceptions.PreconditionFailedException,
+                exceptions.NotFoundException,
+            ):
+                # Taken or deleted by another client since it was listed.
+                continue
+            return self._convert_to_floating_ip_model(ip)
+
+        created = conn.network.create_ip(
+            floating_network_id=floating_network_id,
         )
-        if available is None:
-            created = conn.network.create_ip(
-                floating_network_id=floating_network_id,
-            )
-            target_id = created.id
-        else:
-            target_id = available.id
-        ip = conn.network.update_ip(target_id, port_id=port_id)
+        ip = conn.network.update_ip(created.id, port_id=port_id)
         return self._convert_to_floating_ip_model(ip)
 
     def _convert_to_floating_ip_model(self, openstack_ip) -> FloatingIP:
@@ -875,33 +1308,30 @@ class NetworkTools:
         :param openstack_ip: OpenStack floating IP object
         :return: Pydantic FloatingIP model
         """
-        return FloatingIP(
-            id=openstack_ip.id,
-            name=openstack_ip.name,
-            status=openstack_ip.status,
-            description=openstack_ip.description,
-            project_id=openstack_ip.project_id,
-            floating_ip_address=openstack_ip.floating_ip_address,
-            floating_network_id=openstack_ip.floating_network_id,
-            fixed_ip_address=openstack_ip.fixed_ip_address,
-            port_id=openstack_ip.port_id,
-            router_id=openstack_ip.router_id,
-        )
+        return _floating_ip_converter(openstack_ip)
 
+    @coalesced("router")
     def get_routers(
         self,
         status_filter: str | None = None,
         project_id: str | None = None,
         is_admin_state_up: bool | None = None,
-    ) -> list[Router]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Page[Router]:
         """
         Get the list of Routers with optional filtering.
         :param status_filter: Filter by router status (e.g., `ACTIVE`, `DOWN`)
         :param project_id: Filter by project ID
         :param is_admin_state_up: Filter by admin state
-        :return: List of Router objects
+        :param limit: Maximum number of routers to return
+        :param cursor: The next_cursor of the previous page
+        :param fields: Fields to return for each router, by default every field
+        :return: Page of Router objects
         """
         conn = get_openstack_conn()
+        projection = projected_fields(Router, fields)
         filters: dict = {}
         if status_filter:
             filters["status"] = status_filter.upper()
@@ -911,18 +1341,23 @@ class NetworkTools:
             filters["admin_state_up"] = is_admin_state_up
         # Do not pass unsupported filters (e.g., status) to the server.
         server_filters = self._sanitize_server_filters(filters)
-        routers = conn.network.routers(**server_filters)
+        limit = page_limit(limit)
+        routers = conn.network.routers(
+            **server_filters, **marker_query(limit, cursor)
+        )
 
-        router_models = [self._convert_to_router_model(r) for r in routers]
         if status_filter:
             status_upper = status_filter.upper()
-            router_models = [
+            routers = (
                 r
-                for r in router_models
-                if (r.status or "").upper() == status_upper
-            ]
-        return router_models
+                for r in routers
+                if (getattr(r, "status", None) or "").upper() == status_upper
+            )
+        return marker_page(routers, limit, _router_converter.many).project(
+            projection
+        )
 
+    @invalidates("router")
     def create_router(
         self,
         name: str | None = None,
@@ -979,6 +1414,7 @@ class NetworkTools:
         router = conn.network.get_router(router_id)
         return self._convert_to_router_model(router)
 
+    @invalidates("router")
     def update_router(
         self,
         router_id: str,
@@ -1039,6 +1475,7 @@ class NetworkTools:
         router = conn.network.update_router(router_id, **update_args)
         return self._convert_to_router_model(router)
 
+    @invalidates("router")
     def delete_router(self, router_id: str) -> None:
         """
         Delete a Router.
@@ -1049,6 +1486,7 @@ class NetworkTools:
         conn.network.delete_router(router_id, ignore_missing=False)
         return None
 
+    @invalidates("router", "port")
     def add_router_interface(
         self,
         router_id: str,
@@ -1075,35 +1513,52 @@ class NetworkTools:
             subnet_id=res.get("subnet_id"),
         )
 
-    def get_router_interfaces(self, router_id: str) -> list[RouterInterface]:
+    @coalesced("port")
+    def get_router_interfaces(
+        self,
+        router_id: str | None = None,
+        router_ids: list[str] | None = None,
+    ) -> list[RouterInterface]:
         """
-        List interfaces attached to a Router.
+        List interfaces attached to Routers.
+
+        Interfaces of several routers are fetched with a single port listing
+        and grouped by router. Without router_id and router_ids, interfaces
+        of every router are listed.
 
         :param router_id: Target router ID
-        :return: List of RouterInterface objects representing router-owned ports
+        :param router_ids: Target router IDs
+        :return: List of RouterInterface objects representing router-owned
+            ports, grouped by router
         """
         conn = get_openstack_conn()
-        filters = {
-            "device_id": router_id,
-            "device_owner": "network:router_interface",
+        filters: dict = {"device_owner": list(_ROUTER_INTERFACE_OWNERS)}
+        if router_id and not router_ids:
+            filters["device_id"] = router_id
+        wanted = set(router_ids or []) | ({router_id} if router_id else set())
+
+        # NOTE: Many router IDs would not fit in the query string, so they
+        # are filtered while streaming the listing instead.
+        interfaces: dict[str, list[RouterInterface]] = {
+            id: [] for id in router_ids or []
         }
-        ports = conn.network.ports(**filters)
-        result: list[RouterInterface] = []
-        for p in ports:
-            subnet_id = None
-            if getattr(p, "fixed_ips", None):
-                first = p.fixed_ips[0]
-                if isinstance(first, dict):
-                    subnet_id = first.get("subnet_id")
-            result.append(
+        for p in conn.network.ports(**filters):
+            if wanted and p.device_id not in wanted:
+                continue
+            fixed_ips = getattr(p, "fixed_ips", None) or []
+            interfaces.setdefault(p.device_id, []).append(
                 RouterInterface(
-                    router_id=router_id,
+                    router_id=p.device_id,
                     port_id=p.id,
-                    subnet_id=subnet_id,
+                    subnet_id=fixed_ips[0].get("subnet_id")
+                    if fixed_ips
+                    else None,
+                    fixed_ips=fixed_ips,
                 )
             )
-        return result
+        return [i for group in interfaces.values() for i in group]
 
+    @invalidates("router", "port")
     def remove_router_interface(
         self,
         router_id: str,
@@ -1138,22 +1593,7 @@ class NetworkTools:
         :param openstack_router: OpenStack router object
         :return: Pydantic Router model
         """
-        return Router(
-            id=openstack_router.id,
-            name=getattr(openstack_router, "name", None),
-            status=getattr(openstack_router, "status", None),
-            description=getattr(openstack_router, "description", None),
-            project_id=getattr(openstack_router, "project_id", None),
-            is_admin_state_up=getattr(
-                openstack_router, "is_admin_state_up", None
-            ),
-            external_gateway_info=getattr(
-                openstack_router, "external_gateway_info", None
-            ),
-            is_distributed=getattr(openstack_router, "is_distributed", None),
-            is_ha=getattr(openstack_router, "is_ha", None),
-            routes=getattr(openstack_router, "routes", None),
-        )
+        return _router_converter(openstack_router)
 
     def _sanitize_server_filters(self, filters: dict) -> dict:
         """
@@ -1171,21 +1611,36 @@ class NetworkTools:
         attrs.pop("status", None)
         return attrs
 
+    @coalesced("security_group")
     def get_security_groups(
         self,
         project_id: str | None = None,
         name: str | None = None,
         id: str | None = None,
-    ) -> list[SecurityGroup]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        include_rules: bool = False,
+    ) -> Page[SecurityGroup]:
         """
         Get the list of Security Groups with optional filtering.
 
         :param project_id: Filter by project ID
         :param name: Filter by security group name
         :param id: Filter by security group ID
-        :return: List of SecurityGroup objects
+        :param limit: Maximum number of security groups to return
+        :param cursor: The next_cursor of the previous page
+        :param fields: Fields to return for each security group, by default every field
+        :param include_rules: If True, also return the full rules of each group
+        :return: Page of SecurityGroup objects
         """
         conn = get_openstack_conn()
+        projection = projected_fields(SecurityGroup, fields)
+        query_fields = projection
+        if projection is not None:
+            query_fields = projection - {"security_group_rules"}
+            if include_rules:
+                projection.add("security_group_rules")
         filters: dict = {}
         if project_id:
             filters["project_id"] = project_id
@@ -1193,11 +1648,77 @@ class NetworkTools:
             filters["name"] = name
         if id:
             filters["id"] = id
-        security_groups = conn.network.security_groups(**filters)
-        return [
-            self._convert_to_security_group_model(sg) for sg in security_groups
-        ]
+        limit = page_limit(limit)
+        security_groups = conn.network.security_groups(
+            **filters,
+            **marker_query(limit, cursor),
+            **fields_query(
+                sdk_security_group.SecurityGroup,
+                query_fields,
+                aliases={"security_group_rule_ids": "security_group_rules"},
+            ),
+        )
+        page = marker_page(
+            security_groups, limit, _security_group_converter.many
+        )
+        if include_rules:
+            self._attach_security_group_rules(
+                page.items,
+                project_id,
+                complete=cursor is None
+                and not page.has_more
+                and not (name or id),
+            )
+        return page.project(projection)
 
+    def _attach_security_group_rules(
+        self,
+        security_groups: list[SecurityGroup],
+        project_id: str | None = None,
+        complete: bool = False,
+    ) -> None:
+        """
+        Set the full rules of security groups.
+
+        When the groups are the complete listing, their rules are fetched by
+        one rule listing with the same project filter. Otherwise the rules
+        are listed by chunks of group IDs, so the query string stays short.
+        Rules are joined by security group ID.
+
+        :param security_groups: The security groups to complete.
+        :param project_id: The project filter of the group listing.
+        :param complete: Whether the groups are every group of the listing.
+        """
+        if not security_groups:
+            return
+        conn = get_openstack_conn()
+        if complete:
+            queries = [{"project_id": project_id} if project_id else {}]
+        else:
+            ids = [sg.id for sg in security_groups]
+            queries = [
+                {
+                    "security_group_id": ids[
+                        start : start + _ID_QUERY_CHUNK_SIZE
+                    ]
+                }
+                for start in range(0, len(ids), _ID_QUERY_CHUNK_SIZE)
+            ]
+
+        rules_by_group: dict[str, list[SecurityGroupRule]] = {
+            sg.id: [] for sg in security_groups
+        }
+        for query in queries:
+            rules = _security_group_rule_converter.many(
+                conn.network.security_group_rules(**query)
+            )
+            for rule in rules:
+                if rule.security_group_id in rules_by_group:
+                    rules_by_group[rule.security_group_id].append(rule)
+        for sg in security_groups:
+            sg.security_group_rules = rules_by_group[sg.id]
+
+    @invalidates("security_group")
     def create_security_group(
         self,
         name: str,
@@ -1234,6 +1755,7 @@ class NetworkTools:
         sg = conn.network.get_security_group(security_group_id)
         return self._convert_to_security_group_model(sg)
 
+    @invalidates("security_group")
     def update_security_group(
         self,
         security_group_id: str,
@@ -1262,6 +1784,7 @@ class NetworkTools:
         )
         return self._convert_to_security_group_model(sg)
 
+    @invalidates("security_group")
     def delete_security_group(self, security_group_id: str) -> None:
         """
         Delete a Security Group.
@@ -1282,20 +1805,124 @@ class NetworkTools:
         :param openstack_sg: OpenStack security group object
         :return: Pydantic SecurityGroup model
         """
-        rule_ids: list[str] | None = None
-        rules = getattr(openstack_sg, "security_group_rules", None)
-        if rules is not None:
-            dto_rules = [
-                SecurityGroupRule.model_validate(r, from_attributes=True)
-                for r in rules
-            ]
-            rule_ids = [str(r.id) for r in dto_rules if getattr(r, "id", None)]
-
-        return SecurityGroup(
-            id=openstack_sg.id,
-            name=getattr(openstack_sg, "name", None),
-            status=getattr(openstack_sg, "status", None),
-            description=getattr(openstack_sg, "description", None),
-            project_id=getattr(openstack_sg, "project_id", None),
-            security_group_rule_ids=rule_ids,
+        return _security_group_converter(openstack_sg)
+
+    def get_network_topology(
+        self,
+        project_id: str | None = None,
+    ) -> NetworkTopology:
+        """
+        Get the network topology as a graph of networks, subnets, routers and
+        the devices (e.g. servers) plugged into them.
+
+        Networks, subnets, ports, routers and floating IPs are each fetched
+        with a single listing, concurrently, and joined in memory, so the
+        number of API calls does not grow with the size of the project.
+
+        :param project_id: Only include resources of this project
+        :return: Adjacency lists linking networks, subnets, routers and devices
+        """
+        filters = {"project_id": project_id} if project_id else {}
+        listings: dict[str, Callable] = {
+            "networks": lambda conn: conn.network.networks(**filters),
+            "subnets": lambda conn: conn.network.subnets(**filters),
+            "ports": lambda conn: conn.network.ports(
+                **filters,
+                fields=[
+                    "id",
+                    "network_id",
+                    "device_id",
+                    "device_owner",
+                    "fixed_ips",
+                ],
+            ),
+            "routers": lambda conn: conn.network.routers(**filters),
+            "floating_ips": lambda conn: conn.network.ips(**filters),
+        }
+        outcomes = get_bulk_runner().run(
+            lambda name: list(listings[name](get_openstack_conn())),
+            list(listings),
+        )
+        for outcome in outcomes:
+            if outcome.error is not None:
+                raise outcome.error
+        resources = {outcome.item: outcome.result for outcome in outcomes}
+
+        networks = {
+            n.id: TopologyNetwork(
+                id=n.id, name=n.name, is_router_external=n.is_router_external
+            )
+            for n in resources["networks"]
+        }
+        subnets = {
+            s.id: TopologySubnet(
+                id=s.id,
+                name=s.name,
+                network_id=s.network_id,
+                cidr=s.cidr,
+                gateway_ip=s.gateway_ip,
+            )
+            for s in resources["subnets"]
+        }
+        for subnet in subnets.values():
+            if subnet.network_id in networks:
+                networks[subnet.network_id].subnet_ids.append(subnet.id)
+
+        routers = {
+            r.id: TopologyRouter(
+                id=r.id,
+                name=r.name,
+                external_network_id=(r.external_gateway_info or {}).get(
+                    "network_id"
+                ),
+            )
+            for r in resources["routers"]
+        }
+
+        floating_ip_addresses: dict[str, list[str]] = {}
+        for ip in resources["floating_ips"]:
+            if ip.port_id:
+                floating_ip_addresses.setdefault(ip.port_id, []).append(
+                    ip.floating_ip_address
+                )
+
+        devices: dict[str, TopologyDevice] = {}
+        for port in resources["ports"]:
+            owner = port.device_owner or ""
+            fixed_ips = port.fixed_ips or []
+            if owner in _ROUTER_INTERFACE_OWNERS:
+                router = routers.get(port.device_id)
+                if router is None:
+                    continue
+                for fixed_ip in fixed_ips:
+                    subnet_id = fixed_ip.get("subnet_id")
+                    if not subnet_id or subnet_id in router.subnet_ids:
+                        continue
+                    router.subnet_ids.append(subnet_id)
+                    if subnet_id in subnets:
+                        subnets[subnet_id].router_ids.append(router.id)
+            elif port.device_id and not owner.startswith("network:"):
+                device = devices.setdefault(
+                    port.device_id,
+                    TopologyDevice(id=port.device_id, device_owner=owner),
+                )
+                device.ports.append(
+                    TopologyPort(
+                        id=port.id,
+                        network_id=port.network_id,
+                        ip_addresses=[
+                            fixed_ip.get("ip_address")
+                            for fixed_ip in fixed_ips
+                        ],
+                        floating_ip_addresses=floating_ip_addresses.get(
+                            port.id, []
+                        ),
+                    )
+                )
+
+        return NetworkTopology(
+            networks=list(networks.values()),
+            subnets=list(subnets.values()),
+            routers=list(routers.values()),
+            devices=list(devices.values()),
         )
@@ -0,0 +1,137 @@
+import base64
+import binascii
+import json
+
+from collections.abc import Callable, Iterable
+from itertools import islice
+from typing import Any
+
+from openstack_mcp_server import config
+from openstack_mcp_server.tools.response.common import Page
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    """
+    Encode pagination state into an opaque cursor.
+
+    :param state: Pagination state, e.g. ``{"marker": "<id>"}``.
+    :return: An opaque cursor string.
+    """
+    payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str | None) -> dict[str, Any]:
+    """
+    Decode an opaque cursor produced by encode_cursor.
+
+    :param cursor: The cursor, or None for the first page.
+    :return: The pagination state.
+    :raises ValueError: If the cursor is malformed.
+    """
+    if not cursor:
+        return {}
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(state, dict):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return state
+
+
+def page_limit(limit: int | None) -> int | None:
+    """
+    Resolve the page size of a list tool call.
+
+    :param limit: The requested page size, or None for the default.
+    :return: The page size, or None to return every item.
+    :raises ValueError: If the limit is not positive.
+    """
+    if limit is None:
+        return config.MCP_DEFAULT_PAGE_LIMIT or None
+    if limit < 1:
+        raise ValueError(f"limit must be a positive integer: {limit}")
+    return limit
+
+
+def marker_query(limit: int | None, cursor: str | None) -> dict[str, Any]:
+    """
+    Build the native limit/marker query of a paginated OpenStack listing.
+
+    :param limit: The page size, or None to return every item.
+    :param cursor: The cursor of the page to fetch.
+    :return: Query parameters to pass to the openstacksdk list call.
+    """
+    query: dict[str, Any] = {}
+    if limit:
+        query["limit"] = limit
+    marker = decode_cursor(cursor).get("marker")
+    if marker:
+        query["marker"] = marker
+    return query
+
+
+def marker_page(
+    items: Iterable,
+    limit: int | None,
+    convert: Callable[[list], list] | None = None,
+) -> Page:
+    """
+    Take one page from a marker-paginated listing.
+
+    The listing must have been requested with marker_query so that the
+    service returns at most ``limit`` items per request; consuming only
+    ``limit`` items then never fetches the next page.
+
+    :param items: Items of the listing, in service order.
+    :param limit: The page size, or None to return every item.
+    :param convert: Converts the items of the page to models at once, if
+        the items are not models already.
+    :return: The page, with a cursor at the last returned item.
+    """
+    page = list(islice(items, limit) if limit else items)
+    if convert is not None:
+        page = convert(page)
+    if not limit:
+        return Page(items=page)
+
+    has_more = len(page) == limit
+    return Page(
+        items=page,
+        next_cursor=encode_cursor({"marker": page[-1].id})
+        if has_more
+        else None,
+        has_more=has_more,
+    )
+
+
+def offset_page(
+    items: Iterable,
+    limit: int | None,
+    cursor: str | None,
+) -> Page:
+    """
+    Take one page from a listing the service does not paginate.
+
+    Keystone, for instance, has no marker support, so the listing is
+    sliced locally by offset.
+
+    :param items: Models of the listing.
+    :param limit: The page size, or None to return every item.
+    :param cursor: The cursor of the page to fetch.
+    :return: The page, with a cursor at the next offset.
+    """
+    offset = int(decode_cursor(cursor).get("offset", 0))
+    if not limit:
+        return Page(items=list(islice(items, offset, None)))
+
+    page = list(islice(items, offset, offset + limit + 1))
+    has_more = len(page) > limit
+    return Page(
+        items=page[:limit],
+        next_cursor=encode_cursor({"offset": offset + limit})
+        if has_more
+        else None,
+        has_more=has_more,
+    )
@@ -0,0 +1,62 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def projected_fields(
+    model: type[BaseModel],
+    fields: list[str] | None,
+) -> set[str] | None:
+    """
+    Resolve the fields a list tool should return.
+
+    Required fields of the model are always kept so that projected items
+    still match the tool's output schema.
+
+    :param model: The response model of the tool.
+    :param fields: The requested fields, or None for every field.
+    :return: The field names to return, or None for every field.
+    :raises ValueError: If a requested field does not exist on the model.
+    """
+    if not fields:
+        return None
+
+    unknown = sorted(set(fields) - set(model.model_fields))
+    if unknown:
+        raise ValueError(
+            f"Unknown fields for {model.__name__}: {', '.join(unknown)}"
+        )
+
+    required = {
+        name for name, info in model.model_fields.items() if info.is_required()
+    }
+    return set(fields) | required
+
+
+def fields_query(
+    resource_type: type,
+    fields: set[str] | None,
+    aliases: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """
+    Build the Neutron `fields` query of a projected listing.
+
+    Model fields are translated to the attribute names of the API through
+    the openstacksdk resource (e.g. `security_group_ids` is sent as
+    `security_groups`).
+
+    :param resource_type: The openstacksdk resource class of the listing.
+    :param fields: Model field names to fetch, or None for every field.
+    :param aliases: Model fields named differently from the SDK attribute.
+    :return: Query parameters to pass to the openstacksdk list call.
+    """
+    if fields is None:
+        return {}
+
+    aliases = aliases or {}
+    names = set()
+    for field in fields:
+        attr = aliases.get(field, field)
+        component = getattr(resource_type, attr, None)
+        names.add(getattr(component, "name", attr))
+    return {"fields": sorted(names)}
@@ -0,0 +1,91 @@
+import functools
+
+from collections.abc import Iterator
+from typing import Any
+
+from openstack import exceptions, fields
+from openstack.proxy import Proxy
+from openstack.resource import Resource
+
+
+def raw_list(
+    proxy: Proxy,
+    resource_type: type[Resource],
+    base_path: str | None = None,
+    **params: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    List resources as plain dicts, without building openstacksdk resources.
+
+    The requests, query parameters and pagination are the same as the ones of
+    `Resource.list`, but each item is only renamed from its API keys to the
+    openstacksdk attribute names (e.g. `security_groups` of a port becomes
+    `security_group_ids`). Values are left as decoded from JSON, so response
+    models validating the dicts must accept the raw API types.
+
+    :param proxy: The service proxy, e.g. `conn.network`.
+    :param resource_type: The openstacksdk resource class of the listing.
+    :param base_path: The listing path, if different from the resource's.
+    :param params: Query parameters, as accepted by the proxy list call.
+    :return: A generator of resource dicts.
+    """
+    # NOTE: This mirrors Resource.list, so it relies on the same
+    # openstacksdk helpers instead of re-implementing version negotiation
+    # and the pagination link formats of every service. They are private,
+    # so openstacksdk is bounded to the major version they were tested on
+    # and `tox -e min-sdk` runs the tests against the minimum version.
+    session = resource_type._get_session(proxy)
+    microversion = resource_type._get_microversion(session)
+    uri = base_path or resource_type.base_path
+    query: dict[str, Any] = resource_type._query_mapping._transpose(
+        resource_type._query_mapping._validate(params, base_path=uri),
+        resource_type,
+    )
+    limit = query.get("limit")
+    names = _attribute_names(resource_type)
+
+    total = 0
+    while uri:
+        response = session.get(
+            uri,
+            headers={"Accept": "application/json"},
+            params=query.copy(),
+            microversion=microversion,
+        )
+        exceptions.raise_from_response(response)
+        data = response.json()
+        resources = data[resource_type.resources_key]
+        previous_marker = query.pop("marker", None)
+        query.pop("limit", None)
+
+        marker = None
+        for resource in resources:
+            marker = resource.get("id")
+            total += 1
+            yield {
+                names[key]: value
+                for key, value in resource.items()
+                if key in names
+            }
+
+        if not resources:
+            return
+        uri, next_query = resource_type._get_next_link(
+            uri, response, data, marker, limit, total
+        )
+        if "marker" in next_query and next_query["marker"] == previous_marker:
+            raise exceptions.SDKException(
+                "Endless pagination loop detected, aborting"
+            )
+        query.update(next_query)
+
+
+@functools.cache
+def _attribute_names(resource_type: type[Resource]) -> dict[str, str]:
+    """Map the API keys of a resource to its openstacksdk attribute names."""
+    names: dict[str, str] = {}
+    # NOTE: Attributes of subclasses come first and win over the ones they
+    # override.
+    for attr, component in resource_type._attributes_iterator(fields.Body):
+        names.setdefault(component.name, attr)
+    return names
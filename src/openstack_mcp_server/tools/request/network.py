@@ -24,3 +24,43 @@ class ExternalGatewayInfo(BaseModel):
     network_id: str
     enable_snat: bool | None = None
     external_fixed_ips: list[ExternalFixedIP] | None = None
+
+
+class CreateNetwork(BaseModel):
+    """Attributes of a network to create."""
+
+    name: str
+    description: str | None = None
+    is_admin_state_up: bool = True
+    is_shared: bool = False
+    provider_network_type: str | None = None
+    provider_physical_network: str | None = None
+    provider_segmentation_id: int | None = None
+    project_id: str | None = None
+
+
+class CreateSubnet(BaseModel):
+    """Attributes of a subnet to create."""
+
+    network_id: str
+    cidr: str
+    name: str | None = None
+    ip_version: int = 4
+    gateway_ip: str | None = None
+    is_dhcp_enabled: bool = True
+    description: str | None = None
+    dns_nameservers: list[str] | None = None
+    allocation_pools: list[dict] | None = None
+    host_routes: list[dict] | None = None
+
+
+class CreatePort(BaseModel):
+    """Attributes of a port to create."""
+
+    network_id: str
+    name: str | None = None
+    description: str | None = None
+    is_admin_state_up: bool = True
+    device_id: str | None = None
+    fixed_ips: list[dict] | None = None
+    security_group_ids: list[str] | None = None
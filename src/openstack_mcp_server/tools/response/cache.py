@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    enabled: bool
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    coalesced: int = 0
+    ttls: dict[str, float] = {}
@@ -0,0 +1,68 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, PrivateAttr, field_serializer
+
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list tool result.
+
+    Pass `next_cursor` back as `cursor` to fetch the following page.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+    has_more: bool = False
+
+    # Item fields to serialize, or None to serialize every field.
+    _fields: set[str] | None = PrivateAttr(default=None)
+
+    def project(self, fields: set[str] | None) -> "Page[T]":
+        """
+        Restrict the serialized items to a set of fields.
+
+        :param fields: Field names to keep, or None to keep every field.
+        :return: The page itself.
+        """
+        self._fields = fields
+        return self
+
+    # NOTE: The serializer has no return annotation so that the output
+    # schema of the items stays the one of the item model.
+    @field_serializer("items", mode="wrap")
+    def _serialize_items(self, items, handler):
+        data = handler(items)
+        if self._fields is None:
+            return data
+        return [
+            {k: v for k, v in item.items() if k in self._fields}
+            for item in data
+        ]
+
+
+class ResourceRef(BaseModel):
+    """Reference to an OpenStack resource."""
+
+    resource_type: str
+    id: str
+
+
+class BulkError(BaseModel):
+    """A failed item of a bulk operation."""
+
+    item: str
+    error: str
+
+
+class BulkResult(BaseModel, Generic[T]):
+    """Outcome of a bulk operation.
+
+    Items are processed independently, so some may succeed while others
+    fail. Items undone by a rollback are listed in `rolled_back`.
+    """
+
+    succeeded: list[T] = []
+    failed: list[BulkError] = []
+    rolled_back: list[str] = []
@@ -1,5 +1,10 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from .block_storage import Attachment
+from .common import BulkError
+from .image import Image
+from .network import FloatingIP, Port
+
 
 class Server(BaseModel):
     class Flavor(BaseModel):
@@ -52,3 +57,23 @@ class Flavor(BaseModel):
     is_public: bool = Field(validation_alias="os-flavor-access:is_public")
 
     model_config = ConfigDict(validate_by_name=True)
+
+
+class ServerStatus(BaseModel):
+    id: str
+    name: str
+    status: str | None = None
+
+
+class ServerBatch(BaseModel):
+    tag: str
+    servers: list[ServerStatus]
+
+
+class ServerDetails(BaseModel):
+    server: Server
+    ports: list[Port] | None = None
+    floating_ips: list[FloatingIP] | None = None
+    volume_attachments: list[Attachment] | None = None
+    image: Image | None = None
+    errors: list[BulkError] = []
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class ServicePoolStats(BaseModel):
+    service: str
+    limit: int
+    active: int
+    waiting: int
+    completed: int
+
+
+class ExecutorStats(BaseModel):
+    max_workers: int
+    active: int
+    waiting: int
+    services: list[ServicePoolStats] = []
@@ -63,15 +63,7 @@ class RouterInterface(BaseModel):
     router_id: str
     port_id: str
     subnet_id: str | None = None
-
-
-class SecurityGroup(BaseModel):
-    id: str
-    name: str | None = None
-    status: str | None = None
-    description: str | None = None
-    project_id: str | None = None
-    security_group_rule_ids: list[str] | None = None
+    fixed_ips: list[dict] | None = None
 
 
 class SecurityGroupRule(BaseModel):
@@ -90,6 +82,16 @@ class SecurityGroupRule(BaseModel):
     security_group_id: str | None = None
 
 
+class SecurityGroup(BaseModel):
+    id: str
+    name: str | None = None
+    status: str | None = None
+    description: str | None = None
+    project_id: str | None = None
+    security_group_rule_ids: list[str] | None = None
+    security_group_rules: list[SecurityGroupRule] | None = None
+
+
 class FloatingIP(BaseModel):
     id: str
     name: str | None = None
@@ -101,3 +103,46 @@ class FloatingIP(BaseModel):
     fixed_ip_address: str | None = None
     port_id: str | None = None
     router_id: str | None = None
+
+
+class TopologyNetwork(BaseModel):
+    id: str
+    name: str | None = None
+    is_router_external: bool | None = None
+    subnet_ids: list[str] = []
+
+
+class TopologySubnet(BaseModel):
+    id: str
+    name: str | None = None
+    network_id: str | None = None
+    cidr: str | None = None
+    gateway_ip: str | None = None
+    router_ids: list[str] = []
+
+
+class TopologyRouter(BaseModel):
+    id: str
+    name: str | None = None
+    external_network_id: str | None = None
+    subnet_ids: list[str] = []
+
+
+class TopologyPort(BaseModel):
+    id: str
+    network_id: str | None = None
+    ip_addresses: list[str] = []
+    floating_ip_addresses: list[str] = []
+
+
+class TopologyDevice(BaseModel):
+    id: str
+    device_owner: str | None = None
+    ports: list[TopologyPort] = []
+
+
+class NetworkTopology(BaseModel):
+    networks: list[TopologyNetwork]
+    subnets: list[TopologySubnet]
+    routers: list[TopologyRouter]
+    devices: list[TopologyDevice]
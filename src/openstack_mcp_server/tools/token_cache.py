@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+
+from pathlib import Path
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class TokenCache:
+    """
+    On-disk cache of keystoneauth auth state.
+
+    Each entry is stored in its own file, readable only by the current user,
+    and guarded by an advisory file lock so that several server processes
+    sharing the cache directory never read a half-written token.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self._cache_dir = Path(cache_dir)
+
+    def load(self, key: str) -> str | None:
+        """
+        Load the cached auth state for a key.
+
+        :param key: Cache key identifying the cloud and scope.
+        :return: The serialized auth state, or None if it is not cached.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._lock(f, shared=True)
+                return f.read() or None
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, state: str) -> None:
+        """
+        Persist the auth state for a key.
+
+        :param key: Cache key identifying the cloud and scope.
+        :param state: The serialized auth state.
+        """
+        self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(self._path(key), os.O_WRONLY | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            self._lock(f, shared=False)
+            f.truncate()
+            f.write(state)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove the cached auth state for a key.
+
+        :param key: Cache key identifying the cloud and scope.
+        """
+        self._path(key).unlink(missing_ok=True)
+
+    @staticmethod
+    def make_key(cloud_name: str, scope: dict) -> str:
+        """
+        Build a cache key from a cloud name and its (non-secret) auth scope.
+
+        :param cloud_name: Name of the cloud in clouds.yaml.
+        :param scope: Auth arguments identifying the user and scope.
+        :return: A stable cache key.
+        """
+        payload = json.dumps([cloud_name, scope], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _lock(f, shared: bool) -> None:
+        # NOTE: The lock is released when the file is closed.
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
@@ -0,0 +1,307 @@
+import logging
+import threading
+import time
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from openstack import exceptions
+from openstack.connection import Connection
+
+from openstack_mcp_server import config
+from openstack_mcp_server.tools.base import get_openstack_conn
+from openstack_mcp_server.tools.executor import current_cancel_event
+
+
+logger = logging.getLogger("openstack-mcp-server")
+
+# Status reported for resources missing from the listing.
+DELETED = "DELETED"
+
+# Lists the (ID, status) pairs of the resources of a type with the given
+# IDs, within the given listing filters; pairs of other resources are
+# ignored.
+StatusSource = Callable[
+    [Connection, list[str], dict[str, Any]], Iterable[tuple[str, str]]
+]
+
+# Waits for at most this many resources of a type without an ID filter get
+# each resource instead of listing every resource.
+_GET_EACH_LIMIT = 10
+# Maximum number of IDs in one query string filter.
+_ID_QUERY_CHUNK_SIZE = 100
+
+
+@dataclass(eq=False)
+class _PendingWait:
+    resource_type: str
+    statuses: dict[str, str | None]
+    final: set[str]
+    on_progress: Callable[[int, int], None] | None
+    filters: dict[str, Any] = field(default_factory=dict)
+    done: threading.Event = field(default_factory=threading.Event)
+
+    def update(self, current: dict[str, str]) -> bool:
+        """
+        Record the statuses of a listing.
+
+        :return: True if any status changed.
+        """
+        changed = False
+        for id, status in self.statuses.items():
+            new_status = current.get(id, DELETED)
+            if new_status != status:
+                self.statuses[id] = new_status
+                changed = True
+
+        settled = sum(s in self.final for s in self.statuses.values())
+        if changed and self.on_progress is not None:
+            self.on_progress(settled, len(self.statuses))
+        if settled == len(self.statuses):
+            self.done.set()
+        return changed
+
+
+class Waiter:
+    """
+    Waits for resources to reach a status, sharing polls between callers.
+
+    Every pending wait is served by one background thread, which polls the
+    statuses of each resource type once per round, for the resources of
+    every waiting tool call together. The poll interval starts at `min_interval`
+    and grows by `backoff` up to `max_interval` while no status changes; it
+    drops back to `min_interval` when one does or a new wait arrives.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = 1.5,
+    ):
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._sources: dict[str, StatusSource] = {}
+        self._pending: list[_PendingWait] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register_source(self, resource_type: str, source: StatusSource):
+        """
+        Declare how to list the statuses of a resource type.
+
+        :param resource_type: The resource type.
+        :param source: A callable listing the (ID, status) pairs of the
+            resources with the given IDs, within the given listing
+            filters.
+        """
+        self._sources[resource_type] = source
+
+    def wait(
+        self,
+        resource_type: str,
+        ids: list[str],
+        targets: set[str],
+        failures: set[str] | None = None,
+        timeout: float = 600,
+        on_progress: Callable[[int, int], None] | None = None,
+        cancel: threading.Event | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> dict[str, str | None]:
+        """
+        Wait until resources reach a target or failure status.
+
+        Resources missing from the listing have the status DELETED. The wait
+        ends early when `cancel`, or the cancellation flag of the current
+        tool call, is set.
+
+        :param resource_type: The resource type.
+        :param ids: IDs of the resources.
+        :param targets: Statuses that end the wait successfully.
+        :param failures: Statuses that end the wait unsuccessfully.
+        :param timeout: Maximum number of seconds to wait.
+        :param on_progress: Called with the number of settled resources and
+            the total whenever a status changes.
+        :param cancel: A flag aborting the wait.
+        :param filters: Listing filters every resource matches, e.g. the tag
+            of a batch, so the poll lists only them. Values must be
+            hashable; waits with the same filters share their polls.
+        :return: The last known status of each resource, None if it was
+            never polled.
+        """
+        if resource_type not in self._sources:
+            raise ValueError(f"Cannot wait for {resource_type} resources")
+
+        pending = _PendingWait(
+            resource_type=resource_type,
+            statuses=dict.fromkeys(ids),
+            final=set(targets) | set(failures or ()),
+            on_progress=on_progress,
+            filters=filters or {},
+        )
+        if not pending.statuses:
+            return {}
+
+        cancel = cancel or current_cancel_event()
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._pending.append(pending)
+            self._start()
+        self._wakeup.set()
+
+        try:
+            # NOTE: Waking up periodically keeps cancellation responsive
+            # while the poll interval is long.
+            while not pending.done.wait(
+                min(self._min_interval, deadline - time.monotonic())
+            ):
+                if time.monotonic() >= deadline or (
+                    cancel and cancel.is_set()
+                ):
+                    break
+        finally:
+            with self._lock:
+                self._pending.remove(pending)
+        return dict(pending.statuses)
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="openstack-mcp-waiter",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        interval = self._min_interval
+        while not self._stopped.is_set():
+            if self._wakeup.is_set():
+                self._wakeup.clear()
+                interval = self._min_interval
+
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                self._wakeup.wait()
+                continue
+
+            if self._poll(pending):
+                interval = self._min_interval
+            else:
+                interval = min(interval * self._backoff, self._max_interval)
+            self._wakeup.wait(interval)
+
+    def _poll(self, pending: list[_PendingWait]) -> bool:
+        """
+        Poll each resource type and filters once and update the pending
+        waits.
+
+        :return: True if any status changed.
+        """
+        groups: dict[tuple, list[_PendingWait]] = {}
+        for wait in pending:
+            key = (wait.resource_type, tuple(sorted(wait.filters.items())))
+            groups.setdefault(key, []).append(wait)
+
+        changed = False
+        for (resource_type, filters), waits in groups.items():
+            ids = list(
+                dict.fromkeys(id for wait in waits for id in wait.statuses)
+            )
+            try:
+                conn = get_openstack_conn()
+                current = dict(
+                    self._sources[resource_type](conn, ids, dict(filters))
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to poll %s resources", resource_type, exc_info=True
+                )
+                continue
+
+            with self._lock:
+                for wait in waits:
+                    if wait in self._pending and wait.update(current):
+                        changed = True
+        return changed
+
+
+def _get_each_or_list(
+    get: Callable[[Connection, str], Any],
+    list_all: Callable[..., Iterable[Any]],
+) -> StatusSource:
+    """
+    Build a status source for an API without an ID filter.
+
+    Resources of a filtered wait are read by the filtered listing. Otherwise
+    a few resources are read one by one, a resource that is not found being
+    deleted, and more resources by a single listing of every resource.
+
+    :param get: Gets a resource by ID.
+    :param list_all: Lists resources, called with a connection and the
+        listing filters.
+    :return: The status source.
+    """
+
+    def source(
+        conn: Connection, ids: list[str], filters: dict[str, Any]
+    ) -> list[tuple[str, str]]:
+        if filters or len(ids) > _GET_EACH_LIMIT:
+            return [(r.id, r.status) for r in list_all(conn, **filters)]
+        statuses = []
+        for id in ids:
+            try:
+                statuses.append((id, get(conn, id).status))
+            except exceptions.NotFoundException:
+                continue
+        return statuses
+
+    return source
+
+
+def _image_statuses(
+    conn: Connection, ids: list[str], filters: dict[str, Any]
+) -> Iterable[tuple[str, str]]:
+    if filters:
+        for image in conn.image.images(**filters):
+            yield image.id, image.status
+        return
+    # NOTE: Glance filters by several IDs with the "in:" operator.
+    for start in range(0, len(ids), _ID_QUERY_CHUNK_SIZE):
+        chunk = ids[start : start + _ID_QUERY_CHUNK_SIZE]
+        for image in conn.image.images(id=f"in:{','.join(chunk)}"):
+            yield image.id, image.status
+
+
+_waiter = Waiter(
+    min_interval=config.MCP_WAIT_MIN_INTERVAL,
+    max_interval=config.MCP_WAIT_MAX_INTERVAL,
+)
+_waiter.register_source(
+    "server",
+    _get_each_or_list(
+        lambda conn, id: conn.compute.get_server(id),
+        lambda conn, **filters: conn.compute.servers(**filters),
+    ),
+)
+_waiter.register_source(
+    "volume",
+    _get_each_or_list(
+        lambda conn, id: conn.block_storage.get_volume(id),
+        lambda conn, **filters: conn.block_storage.volumes(**filters),
+    ),
+)
+_waiter.register_source("image", _image_statuses)
+
+
+def get_waiter() -> Waiter:
+    return _waiter
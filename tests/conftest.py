@@ -2,6 +2,16 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from openstack_mcp_server.tools.cache import get_tool_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    """Start every test with an empty read cache."""
+    get_tool_cache().clear()
+    yield
+    get_tool_cache().clear()
+
 
 @pytest.fixture
 def mock_get_openstack_conn():
@@ -73,3 +83,27 @@ def mock_get_openstack_conn_block_storage():
         return_value=mock_conn,
     ):
         yield mock_conn
+
+
+@pytest.fixture
+def mock_get_openstack_conn_bulk():
+    """Mock get_openstack_conn function for bulk_tools."""
+    mock_conn = Mock()
+
+    with patch(
+        "openstack_mcp_server.tools.bulk_tools.get_openstack_conn",
+        return_value=mock_conn,
+    ):
+        yield mock_conn
+
+
+@pytest.fixture
+def mock_waiter():
+    """Mock the waiter shared by tools waiting for status transitions."""
+    mock_waiter = Mock()
+
+    with patch(
+        "openstack_mcp_server.tools.waiter._waiter",
+        mock_waiter,
+    ):
+        yield mock_waiter
@@ -53,7 +53,7 @@ class TestBlockStorageTools:
 
         # Test BlockStorageTools
         block_storage_tools = BlockStorageTools()
-        result = block_storage_tools.get_volumes()
+        result = block_storage_tools.get_volumes().items
 
         # Verify results
         assert isinstance(result, list)
@@ -88,7 +88,7 @@ class TestBlockStorageTools:
         mock_conn.block_storage.volumes.return_value = []
 
         block_storage_tools = BlockStorageTools()
-        result = block_storage_tools.get_volumes()
+        result = block_storage_tools.get_volumes().items
 
         # Verify empty list
         assert isinstance(result, list)
@@ -120,7 +120,7 @@ class TestBlockStorageTools:
         mock_conn.block_storage.volumes.return_value = [mock_volume]
 
         block_storage_tools = BlockStorageTools()
-        result = block_storage_tools.get_volumes()
+        result = block_storage_tools.get_volumes().items
 
         assert isinstance(result, list)
         assert len(result) == 1
@@ -165,7 +165,7 @@ class TestBlockStorageTools:
         mock_conn.block_storage.volumes.return_value = mock_volumes
 
         block_storage_tools = BlockStorageTools()
-        result = block_storage_tools.get_volumes()
+        result = block_storage_tools.get_volumes().items
 
         # Verify result is a list with correct length
         assert isinstance(result, list)
@@ -221,7 +221,7 @@ class TestBlockStorageTools:
         ]
 
         block_storage_tools = BlockStorageTools()
-        result = block_storage_tools.get_volumes()
+        result = block_storage_tools.get_volumes().items
 
         assert isinstance(result, list)
         assert len(result) == 2
@@ -401,6 +401,50 @@ class TestBlockStorageTools:
             availability_zone="nova",
         )
 
+    def test_create_volume_wait(
+        self,
+        mock_get_openstack_conn_block_storage,
+        mock_waiter,
+    ):
+        """Test creating volume and waiting until it is available."""
+        mock_conn = mock_get_openstack_conn_block_storage
+
+        mock_volume = Mock()
+        mock_volume.name = "new-volume"
+        mock_volume.id = "vol-new-123"
+        mock_volume.size = 10
+        mock_volume.status = "available"
+        mock_volume.volume_type = "ssd"
+        mock_volume.availability_zone = "nova"
+        mock_volume.created_at = "2024-01-01T12:00:00Z"
+        mock_volume.is_bootable = False
+        mock_volume.is_encrypted = False
+        mock_volume.description = None
+        mock_volume.attachments = []
+
+        mock_conn.block_storage.create_volume.return_value = Mock(
+            id="vol-new-123",
+        )
+        mock_conn.block_storage.get_volume.return_value = mock_volume
+
+        block_storage_tools = BlockStorageTools()
+        result = block_storage_tools.create_volume(
+            "new-volume",
+            10,
+            wait=True,
+            timeout=60,
+        )
+
+        assert result.status == "available"
+        mock_waiter.wait.assert_called_once()
+        wait_call = mock_waiter.wait.call_args
+        assert wait_call.args == ("volume", ["vol-new-123"])
+        assert wait_call.kwargs["targets"] == {"available"}
+        assert wait_call.kwargs["timeout"] == 60
+        mock_conn.block_storage.get_volume.assert_called_once_with(
+            "vol-new-123",
+        )
+
     def test_create_volume_minimal_params(
         self,
         mock_get_openstack_conn_block_storage,
@@ -573,6 +617,24 @@ class TestBlockStorageTools:
             20,
         )
 
+    def test_extend_volume_wait(
+        self,
+        mock_get_openstack_conn_block_storage,
+        mock_waiter,
+    ):
+        """Test extending volume and waiting until it is done."""
+        mock_conn = mock_get_openstack_conn_block_storage
+
+        block_storage_tools = BlockStorageTools()
+        result = block_storage_tools.extend_volume("vol-extend", 20, wait=True)
+
+        assert result is None
+        mock_conn.block_storage.extend_volume.assert_called_once_with(
+            "vol-extend",
+            20,
+        )
+        assert mock_waiter.wait.call_args.args == ("volume", ["vol-extend"])
+
     def test_extend_volume_invalid_size(
         self,
         mock_get_openstack_conn_block_storage,
@@ -612,7 +674,8 @@ class TestBlockStorageTools:
 
         # Verify all methods were registered
         registered_methods = [
-            call[0][0] for call in mock_tool_decorator.call_args_list
+            call[0][0].__wrapped__
+            for call in mock_tool_decorator.call_args_list
         ]
         expected_methods = [
             block_storage_tools.get_volumes,
@@ -652,8 +715,8 @@ class TestBlockStorageTools:
         assert "Get the list of Block Storage volumes" in docstring
         assert "return" in docstring.lower() or "Return" in docstring
         assert (
-            "list[Volume]" in docstring
-            or "A list of Volume objects" in docstring
+            "Page[Volume]" in docstring
+            or "A page of Volume objects" in docstring
         )
 
     def test_all_block_storage_methods_have_docstrings(self):
@@ -762,7 +825,7 @@ class TestBlockStorageTools:
             "volume_id": "vol-123",
             "instance": "server-123",
         }
-        result = block_storage_tools.get_attachments(**filter)
+        result = block_storage_tools.get_attachments(**filter).items
 
         # Verify the result
         assert isinstance(result, list)
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from openstack_mcp_server.tools.bulk import BulkRunner
+
+
+class TestBulkRunner:
+    """Test cases for BulkRunner class."""
+
+    def test_outcomes_keep_item_order(self):
+        """Test that outcomes are returned in the order of the items."""
+        runner = BulkRunner(max_workers=4, default_concurrency=4)
+
+        def work(item):
+            time.sleep(0.01 * (5 - item))
+            return item * 2
+
+        outcomes = runner.run(work, range(5))
+
+        assert [o.item for o in outcomes] == [0, 1, 2, 3, 4]
+        assert [o.result for o in outcomes] == [0, 2, 4, 6, 8]
+        assert all(o.error is None for o in outcomes)
+        runner.shutdown()
+
+    def test_failed_items_do_not_stop_others(self):
+        """Test that a failing item is reported in its outcome."""
+        runner = BulkRunner(max_workers=2, default_concurrency=2)
+
+        def work(item):
+            if item == 1:
+                raise RuntimeError("boom")
+            return item
+
+        outcomes = runner.run(work, [0, 1, 2])
+
+        assert [o.result for o in outcomes] == [0, None, 2]
+        assert isinstance(outcomes[1].error, RuntimeError)
+        runner.shutdown()
+
+    def test_concurrency_cap(self):
+        """Test that no more than `concurrency` items run at once."""
+        runner = BulkRunner(max_workers=8, default_concurrency=8)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work(item):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        runner.run(work, range(10), concurrency=3)
+
+        assert peak <= 3
+        runner.shutdown()
+
+    def test_invalid_concurrency(self):
+        """Test that non-positive concurrency is rejected."""
+        runner = BulkRunner(max_workers=2, default_concurrency=2)
+
+        with pytest.raises(ValueError, match="concurrency"):
+            runner.run(lambda item: item, [1], concurrency=0)
+        runner.shutdown()
@@ -0,0 +1,136 @@
+from unittest.mock import Mock
+
+from openstack.exceptions import ConflictException, HttpException
+
+from openstack_mcp_server.tools.bulk_tools import BulkTools
+from openstack_mcp_server.tools.waiter import DELETED
+
+
+class TestBulkTools:
+    """Test cases for BulkTools class."""
+
+    def test_register_tools(self):
+        """Test that bulk tools are registered."""
+        mock_mcp = Mock()
+        mock_tool_decorator = Mock()
+        mock_mcp.tool.return_value = mock_tool_decorator
+
+        bulk_tools = BulkTools()
+        bulk_tools.register_tools(mock_mcp)
+
+        registered_methods = [
+            c.args[0].__wrapped__ for c in mock_tool_decorator.call_args_list
+        ]
+        assert registered_methods == [bulk_tools.delete_resources]
+
+    def test_delete_resources(self, mock_get_openstack_conn_bulk):
+        """Test deleting resources of every type."""
+        mock_conn = mock_get_openstack_conn_bulk
+
+        result = BulkTools().delete_resources(
+            volume_ids=["vol-1"],
+            port_ids=["port-1", "port-1"],
+            floating_ip_ids=["fip-1"],
+        )
+
+        assert [(r.resource_type, r.id) for r in result.succeeded] == [
+            ("floating_ip", "fip-1"),
+            ("port", "port-1"),
+            ("volume", "vol-1"),
+        ]
+        assert result.failed == []
+        mock_conn.network.delete_ip.assert_called_once_with(
+            "fip-1", ignore_missing=True
+        )
+        mock_conn.network.delete_port.assert_called_once_with(
+            "port-1", ignore_missing=True
+        )
+        mock_conn.block_storage.delete_volume.assert_called_once_with(
+            "vol-1", ignore_missing=True
+        )
+        mock_conn.compute.servers.assert_not_called()
+
+    def test_delete_resources_waits_for_servers_before_volumes(
+        self, mock_get_openstack_conn_bulk, mock_waiter
+    ):
+        """Test that volumes are deleted once their servers are gone."""
+        mock_conn = mock_get_openstack_conn_bulk
+        mock_waiter.wait.return_value = {"server-1": DELETED}
+
+        result = BulkTools().delete_resources(
+            server_ids=["server-1"],
+            volume_ids=["vol-1"],
+        )
+
+        mock_waiter.wait.assert_called_once()
+        assert mock_waiter.wait.call_args.args[:2] == ("server", ["server-1"])
+        assert [r.id for r in result.succeeded] == ["server-1", "vol-1"]
+        mock_conn.block_storage.delete_volume.assert_called_once_with(
+            "vol-1", ignore_missing=True
+        )
+
+    def test_delete_resources_retries_conflicts(
+        self, mock_get_openstack_conn_bulk, monkeypatch
+    ):
+        """Test that conflicting deletes are retried with backoff."""
+        mock_conn = mock_get_openstack_conn_bulk
+        monkeypatch.setattr(
+            "openstack_mcp_server.tools.bulk.time.sleep", lambda _: None
+        )
+        mock_conn.network.delete_port.side_effect = [
+            ConflictException(response=Mock(status_code=409, headers={})),
+            None,
+        ]
+
+        result = BulkTools().delete_resources(port_ids=["port-1"])
+
+        assert [r.id for r in result.succeeded] == ["port-1"]
+        assert mock_conn.network.delete_port.call_count == 2
+
+    def test_delete_resources_reports_failures(
+        self, mock_get_openstack_conn_bulk
+    ):
+        """Test that failed deletes are reported per resource."""
+        mock_conn = mock_get_openstack_conn_bulk
+        mock_conn.network.delete_port.side_effect = HttpException(
+            "Port is in use", response=Mock(status_code=400, headers={})
+        )
+
+        result = BulkTools().delete_resources(port_ids=["port-1"])
+
+        assert result.succeeded == []
+        assert [e.item for e in result.failed] == ["port/port-1"]
+
+    def test_delete_resources_wait_timeout(
+        self, mock_get_openstack_conn_bulk, mock_waiter
+    ):
+        """Test that resources not gone at the deadline are failures."""
+        mock_waiter.wait.return_value = {
+            "vol-1": "deleting",
+            "vol-2": "error_deleting",
+        }
+
+        result = BulkTools().delete_resources(
+            volume_ids=["vol-1", "vol-2"], wait=True, timeout=0
+        )
+
+        assert result.succeeded == []
+        assert [(e.item, e.error) for e in result.failed] == [
+            ("volume/vol-1", "Timed out waiting for deletion"),
+            ("volume/vol-2", "Deletion failed with status error_deleting"),
+        ]
+
+    def test_delete_resources_server_error(
+        self, mock_get_openstack_conn_bulk, mock_waiter
+    ):
+        """Test that a server going to ERROR while deleting fails early."""
+        mock_waiter.wait.return_value = {"server-1": "ERROR"}
+
+        result = BulkTools().delete_resources(
+            server_ids=["server-1"], wait=True
+        )
+
+        assert mock_waiter.wait.call_args.kwargs["failures"] == {"ERROR"}
+        assert [(e.item, e.error) for e in result.failed] == [
+            ("server/server-1", "Deletion failed with status ERROR"),
+        ]
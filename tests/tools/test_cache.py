@@ -0,0 +1,271 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack_mcp_server.tools.cache import (
+    ToolCache,
+    cached,
+    coalesced,
+    get_tool_cache,
+    invalidates,
+)
+
+
+class TestToolCache:
+    """Test cases for ToolCache class."""
+
+    def test_get_and_set(self):
+        """Test a cache miss followed by a hit."""
+        cache = ToolCache(max_entries=4)
+
+        assert cache.get(("k",)) == (False, None)
+        cache.set(("k",), "flavor", ["m1.tiny"])
+
+        assert cache.get(("k",)) == (True, ["m1.tiny"])
+        stats = cache.get_cache_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL elapsed."""
+        cache = ToolCache(max_entries=4, ttls={"flavor": 10})
+
+        with patch(
+            "openstack_mcp_server.tools.cache.time.monotonic",
+            side_effect=[100.0, 105.0, 111.0],
+        ):
+            cache.set(("k",), "flavor", "value")
+            assert cache.get(("k",)) == (True, "value")
+            assert cache.get(("k",)) == (False, None)
+
+        assert cache.get_cache_stats().entries == 0
+
+    def test_resource_type_without_ttl_is_not_cached(self):
+        """Test that resource types with no TTL are never stored."""
+        cache = ToolCache(max_entries=4)
+
+        cache.set(("k",), "server", "value")
+
+        assert cache.get(("k",)) == (False, None)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ToolCache(max_entries=2)
+        cache.set(("a",), "flavor", 1)
+        cache.set(("b",), "flavor", 2)
+        cache.get(("a",))
+
+        cache.set(("c",), "flavor", 3)
+
+        assert cache.get(("a",)) == (True, 1)
+        assert cache.get(("b",)) == (False, None)
+        assert cache.get(("c",)) == (True, 3)
+        assert cache.get_cache_stats().evictions == 1
+
+    def test_invalidate_resource_type(self):
+        """Test dropping every entry of one resource type."""
+        cache = ToolCache(max_entries=4)
+        cache.set(("a",), "flavor", 1)
+        cache.set(("b",), "image", 2)
+
+        cache.invalidate("flavor")
+
+        assert cache.get(("a",)) == (False, None)
+        assert cache.get(("b",)) == (True, 2)
+
+    def test_cached_decorator(self):
+        """Test that decorated tools are cached per arguments."""
+        loader = Mock(side_effect=lambda name: [name])
+
+        class Tools:
+            @cached("image")
+            def get_images(self, name: str, refresh: bool = False):
+                return loader(name)
+
+        tools = Tools()
+        assert tools.get_images("a") == ["a"]
+        assert tools.get_images(name="a") == ["a"]
+        assert tools.get_images("b") == ["b"]
+        assert loader.call_count == 2
+
+        assert tools.get_images("a", refresh=True) == ["a"]
+        assert loader.call_count == 3
+
+    def test_cached_decorator_disabled(self):
+        """Test that a disabled cache always calls through."""
+        loader = Mock(return_value=[])
+
+        class Tools:
+            @cached("flavor")
+            def get_flavors(self):
+                return loader()
+
+        with patch(
+            "openstack_mcp_server.tools.cache._tool_cache",
+            ToolCache(max_entries=4, enabled=False),
+        ):
+            Tools().get_flavors()
+            Tools().get_flavors()
+
+        assert loader.call_count == 2
+
+
+class TestCoalescing:
+    """Test cases for coalescing concurrent identical loads."""
+
+    @staticmethod
+    def call_concurrently(fn, calls: int, release: threading.Event):
+        """Call fn from several threads once all but one joined the load."""
+        with ThreadPoolExecutor(max_workers=calls) as pool:
+            futures = [pool.submit(fn) for _ in range(calls)]
+            deadline = time.monotonic() + 5
+            while (
+                get_tool_cache().get_cache_stats().coalesced < calls - 1
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+            release.set()
+            return [f.result() for f in futures]
+
+    def test_coalesced_decorator(self):
+        """Test that concurrent identical calls share one load."""
+        release = threading.Event()
+        loader = Mock(side_effect=lambda: release.wait() and ["net-1"])
+
+        class Tools:
+            @coalesced("network")
+            def get_networks(self, shared_only: bool = False):
+                return loader()
+
+        tools = Tools()
+        results = self.call_concurrently(tools.get_networks, 3, release)
+
+        assert results == [["net-1"]] * 3
+        assert loader.call_count == 1
+        assert get_tool_cache().get_cache_stats().coalesced == 2
+
+        # NOTE: Finished loads are not kept.
+        tools.get_networks()
+        assert loader.call_count == 2
+
+    def test_coalesced_decorator_shares_errors(self):
+        """Test that callers joining a failing load receive its error."""
+        release = threading.Event()
+
+        def fail():
+            release.wait()
+            raise RuntimeError("Service unavailable")
+
+        class Tools:
+            @coalesced("server")
+            def get_servers(self):
+                return fail()
+
+        with pytest.raises(RuntimeError, match="Service unavailable"):
+            self.call_concurrently(Tools().get_servers, 2, release)
+
+    def test_cached_decorator_coalesces_misses(self):
+        """Test that concurrent cache misses share one load."""
+        release = threading.Event()
+        loader = Mock(side_effect=lambda: release.wait() and ["m1.tiny"])
+
+        class Tools:
+            @cached("flavor")
+            def get_flavors(self):
+                return loader()
+
+        results = self.call_concurrently(Tools().get_flavors, 4, release)
+
+        assert results == [["m1.tiny"]] * 4
+        assert loader.call_count == 1
+
+    def test_load_not_joined_after_invalidation(self):
+        """Test that calls after a write do not join an older load."""
+        cache = ToolCache(max_entries=4)
+        release = threading.Event()
+        calls = []
+
+        def load():
+            generation = cache.generation("network")
+            calls.append(generation)
+            if len(calls) == 1:
+                release.wait()
+            return generation
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            first = pool.submit(
+                cache.load, ("k", cache.generation("network")), load
+            )
+            while not calls:
+                time.sleep(0.01)
+            cache.invalidate("network")
+            second = cache.load(("k", cache.generation("network")), load)
+            release.set()
+
+        assert (first.result(), second) == (0, 1)
+
+
+class TestCacheInvalidation:
+    """Test cases for write-through cache invalidation."""
+
+    def test_invalidate_dependent_resource_types(self):
+        """Test that registered dependents are invalidated transitively."""
+        cache = ToolCache(max_entries=8, ttls={"port": 60, "floating_ip": 60})
+        cache.set(("ports",), "port", 1)
+        cache.set(("fips",), "floating_ip", 2)
+        cache.set(("flavors",), "flavor", 3)
+
+        cache.invalidate("server")
+
+        assert cache.get(("ports",)) == (False, None)
+        assert cache.get(("fips",)) == (False, None)
+        assert cache.get(("flavors",)) == (True, 3)
+
+    def test_set_discards_value_loaded_before_invalidation(self):
+        """Test that a read racing with a write does not cache stale data."""
+        cache = ToolCache(max_entries=4)
+        generation = cache.generation("image")
+
+        cache.invalidate("image")
+        cache.set(("k",), "image", "stale", generation)
+
+        assert cache.get(("k",)) == (False, None)
+
+    def test_invalidates_decorator(self):
+        """Test that mutating tools drop cached reads of their type."""
+        loader = Mock(return_value=[])
+
+        class Tools:
+            @cached("image")
+            def get_images(self):
+                return loader()
+
+            @invalidates("image")
+            def delete_image(self, image_id: str):
+                return None
+
+        tools = Tools()
+        tools.get_images()
+        tools.get_images()
+        tools.delete_image("image-1")
+        tools.get_images()
+
+        assert loader.call_count == 2
+
+    def test_invalidates_decorator_on_failure(self):
+        """Test that a failed write still invalidates the cache."""
+
+        class Tools:
+            @invalidates("flavor")
+            def broken(self):
+                raise RuntimeError("boom")
+
+        get_tool_cache().set(("k",), "flavor", 1)
+
+        with pytest.raises(RuntimeError):
+            Tools().broken()
+
+        assert get_tool_cache().get(("k",)) == (False, None)
@@ -0,0 +1,90 @@
+import asyncio
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from openstack_mcp_server.tools.catalog import ServiceCatalogMiddleware
+from openstack_mcp_server.tools.manifest import register_manifest_tools
+
+
+@pytest.fixture
+def mock_catalog_conn():
+    """Mock a connection whose catalog lacks the network service."""
+    mock_conn = Mock()
+    mock_conn.has_service.side_effect = lambda service_type: (
+        service_type != "network"
+    )
+
+    with (
+        patch(
+            "openstack_mcp_server.tools.catalog.get_openstack_conn",
+            return_value=mock_conn,
+        ),
+        patch(
+            "openstack_mcp_server.tools.catalog.get_openstack_cloud_name",
+            return_value="cloud-a",
+        ),
+    ):
+        yield mock_conn
+
+
+def make_server() -> FastMCP:
+    mcp = FastMCP("test", middleware=[ServiceCatalogMiddleware()])
+    register_manifest_tools(mcp, services=["compute", "network", "bulk"])
+    return mcp
+
+
+class TestServiceCatalogMiddleware:
+    """Test cases for ServiceCatalogMiddleware class."""
+
+    def test_list_tools_hides_missing_services(self, mock_catalog_conn):
+        """Test that tools of services missing from the catalog are hidden."""
+        mcp = make_server()
+
+        async def main():
+            async with Client(mcp) as client:
+                first = await client.list_tools()
+                second = await client.list_tools()
+                return first, second
+
+        first, second = asyncio.run(main())
+
+        names = {tool.name for tool in first}
+        assert "get_servers" in names
+        assert "get_networks" not in names
+        assert "delete_resources" in names
+        assert [tool.name for tool in second] == [tool.name for tool in first]
+        # The catalog is read once per cloud.
+        assert mock_catalog_conn.has_service.call_count == 5
+
+    def test_call_tool_of_missing_service(self, mock_catalog_conn):
+        """Test that tools of missing services cannot be called."""
+        mcp = make_server()
+
+        async def main():
+            async with Client(mcp) as client:
+                await client.call_tool("get_networks", {})
+
+        with pytest.raises(ToolError, match="network service is not in"):
+            asyncio.run(main())
+        mock_catalog_conn.network.networks.assert_not_called()
+
+    def test_unreadable_catalog_keeps_tools(self, mock_catalog_conn):
+        """Test that every tool stays listed when the catalog fails."""
+        mock_catalog_conn.has_service.side_effect = RuntimeError("no auth")
+        mcp = make_server()
+
+        async def main():
+            async with Client(mcp) as client:
+                await client.list_tools()
+                return await client.list_tools()
+
+        tools = asyncio.run(main())
+
+        assert "get_networks" in {tool.name for tool in tools}
+        # Failures are not cached, so the catalog is read again.
+        assert mock_catalog_conn.has_service.call_count == 2
@@ -1,10 +1,15 @@
-from unittest.mock import Mock, call
+import threading
+
+from unittest.mock import Mock, patch
 
 import pytest
 
 from openstack.exceptions import ConflictException, NotFoundException
 
-from openstack_mcp_server.tools.compute_tools import ComputeTools
+from openstack_mcp_server.tools.compute_tools import (
+    ComputeTools,
+    ServerActionEnum,
+)
 from openstack_mcp_server.tools.response.compute import Flavor, Server
 
 
@@ -69,7 +74,7 @@ class TestComputeTools:
 
         # Test ComputeTools
         compute_tools = ComputeTools()
-        result = compute_tools.get_servers()
+        result = compute_tools.get_servers().items
 
         # Verify results
         expected_output = [
@@ -126,13 +131,110 @@ class TestComputeTools:
         mock_conn.compute.servers.return_value = []
 
         compute_tools = ComputeTools()
-        result = compute_tools.get_servers()
+        result = compute_tools.get_servers().items
 
         # Verify empty list
         assert result == []
 
         mock_conn.compute.servers.assert_called_once()
 
+    def test_get_servers_with_filters(self, mock_get_openstack_conn):
+        """Test that server filters are passed to Nova."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = []
+
+        compute_tools = ComputeTools()
+        compute_tools.get_servers(
+            status="active",
+            name="^web-",
+            flavor_id="flavor-1",
+            image_id="image-1",
+            host="compute-01",
+            availability_zone="nova",
+            project_id="project-1",
+            all_projects=True,
+            tags=["prod", "web"],
+            changes_since="2025-01-01T00:00:00Z",
+            ip="10.0.0.",
+        )
+
+        mock_conn.compute.servers.assert_called_once_with(
+            status="ACTIVE",
+            name="^web-",
+            flavor="flavor-1",
+            image="image-1",
+            compute_host="compute-01",
+            availability_zone="nova",
+            project_id="project-1",
+            all_projects=True,
+            tags="prod,web",
+            changes_since="2025-01-01T00:00:00Z",
+            ipv4_address="10.0.0.",
+        )
+
+    def test_get_servers_paginated(self, mock_get_openstack_conn):
+        """Test that limit and cursor are passed to Nova as limit/marker."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = [
+            {"id": "server-1", "name": "web-1", "status": "ACTIVE"},
+            {"id": "server-2", "name": "web-2", "status": "ACTIVE"},
+        ]
+
+        compute_tools = ComputeTools()
+        page = compute_tools.get_servers(limit=2)
+
+        mock_conn.compute.servers.assert_called_once_with(limit=2)
+        assert [server.id for server in page.items] == [
+            "server-1",
+            "server-2",
+        ]
+        assert page.has_more is True
+
+        mock_conn.compute.servers.return_value = []
+        page = compute_tools.get_servers(limit=2, cursor=page.next_cursor)
+
+        mock_conn.compute.servers.assert_called_with(
+            limit=2, marker="server-2"
+        )
+        assert page.items == []
+        assert page.has_more is False
+
+    def test_get_servers_raw_listing(self, mock_get_openstack_conn):
+        """Test that raw listings map the API JSON without SDK resources."""
+        mock_conn = mock_get_openstack_conn
+
+        with (
+            patch(
+                "openstack_mcp_server.tools.compute_tools.config.MCP_RAW_LISTINGS",
+                True,
+            ),
+            patch(
+                "openstack_mcp_server.tools.compute_tools.raw_list",
+                return_value=iter(
+                    [
+                        {
+                            "id": "server-1",
+                            "name": "web-1",
+                            "status": "ACTIVE",
+                            "image": "",
+                        }
+                    ]
+                ),
+            ) as mock_raw_list,
+        ):
+            page = ComputeTools().get_servers(status="active")
+
+        mock_raw_list.assert_called_once()
+        assert mock_raw_list.call_args.args[0] is mock_conn.compute
+        assert mock_raw_list.call_args.kwargs == {
+            "base_path": "/servers/detail",
+            "status": "ACTIVE",
+        }
+        mock_conn.compute.servers.assert_not_called()
+        assert page.items == [
+            Server(id="server-1", name="web-1", status="ACTIVE", image=None)
+        ]
+
     def test_get_server_success(self, mock_get_openstack_conn):
         """Test getting a specific server successfully."""
         mock_conn = mock_get_openstack_conn
@@ -161,6 +263,190 @@ class TestComputeTools:
             "fe4b6b9b-090c-4dee-ab27-5155476e8e7d",
         )
 
+    @staticmethod
+    def make_port(id, device_id):
+        port = Mock(
+            id=id,
+            device_id=device_id,
+            network_id="net-1",
+            status="ACTIVE",
+            fixed_ips=[{"subnet_id": "subnet-1", "ip_address": "10.0.0.5"}],
+            security_group_ids=[],
+            **dict.fromkeys(
+                [
+                    "description",
+                    "project_id",
+                    "is_admin_state_up",
+                    "device_owner",
+                    "mac_address",
+                ]
+            ),
+        )
+        port.name = None
+        return port
+
+    @staticmethod
+    def make_floating_ip(id, port_id):
+        ip = Mock(
+            id=id,
+            port_id=port_id,
+            floating_ip_address="203.0.113.10",
+            **dict.fromkeys(
+                [
+                    "status",
+                    "description",
+                    "project_id",
+                    "floating_network_id",
+                    "fixed_ip_address",
+                    "router_id",
+                ]
+            ),
+        )
+        ip.name = None
+        return ip
+
+    def test_get_server_details(self, mock_get_openstack_conn):
+        """Test joining a server with its related resources."""
+        mock_get_openstack_conn.compute.get_server.return_value = {
+            "id": "server-1",
+            "name": "web",
+            "status": "ACTIVE",
+            "image": {"id": "image-1"},
+        }
+        network = mock_get_openstack_conn.network
+        network.ports.return_value = [self.make_port("port-1", "server-1")]
+        network.ips.return_value = [self.make_floating_ip("fip-1", "port-1")]
+        attachment = Mock(
+            id="att-1",
+            instance="server-1",
+            volume_id="vol-1",
+            connection_info={},
+            **dict.fromkeys(
+                [
+                    "status",
+                    "attach_mode",
+                    "connector",
+                    "attached_at",
+                    "detached_at",
+                ]
+            ),
+        )
+        block_storage = mock_get_openstack_conn.block_storage
+        block_storage.attachments.return_value = [attachment]
+        mock_get_openstack_conn.image.get_image.return_value = {
+            "id": "image-1",
+            "name": "ubuntu",
+        }
+
+        result = ComputeTools().get_server_details("server-1")
+
+        assert result.server.name == "web"
+        assert [p.id for p in result.ports] == ["port-1"]
+        assert [ip.id for ip in result.floating_ips] == ["fip-1"]
+        assert [a.volume_id for a in result.volume_attachments] == ["vol-1"]
+        assert result.image.name == "ubuntu"
+        assert result.errors == []
+        network.ports.assert_called_once_with(device_id="server-1")
+        network.ips.assert_called_once_with(port_id="port-1")
+        block_storage.attachments.assert_called_once_with(instance="server-1")
+
+    def test_get_server_details_connection_per_lookup(
+        self, mock_get_openstack_conn
+    ):
+        """Test that each lookup gets the connection of its own thread."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.get_server.return_value = {
+            "id": "server-1",
+            "name": "web",
+            "image": {"id": "image-1"},
+        }
+        mock_conn.network.ports.return_value = [
+            self.make_port("port-1", "server-1"),
+            self.make_port("port-2", "server-1"),
+        ]
+        mock_conn.network.ips.return_value = []
+        mock_conn.block_storage.attachments.return_value = []
+        mock_conn.image.get_image.return_value = {"id": "image-1"}
+        threads = []
+
+        def get_conn():
+            threads.append(threading.current_thread())
+            return mock_conn
+
+        with patch(
+            "openstack_mcp_server.tools.compute_tools.get_openstack_conn",
+            side_effect=get_conn,
+        ):
+            result = ComputeTools().get_server_details("server-1")
+
+        assert result.errors == []
+        # Server, ports, attachments, image and the IPs of each port.
+        assert len(threads) == 6
+        assert threading.main_thread() not in threads
+
+    def test_get_server_details_partial_failure(self, mock_get_openstack_conn):
+        """Test that failed lookups are reported instead of raised."""
+        mock_get_openstack_conn.compute.get_server.return_value = {
+            "id": "server-1",
+            "name": "web",
+            "image": {"id": "image-1"},
+        }
+        network = mock_get_openstack_conn.network
+        network.ports.side_effect = Exception("Network unavailable")
+        block_storage = mock_get_openstack_conn.block_storage
+        block_storage.attachments.return_value = []
+        mock_get_openstack_conn.image.get_image.side_effect = (
+            NotFoundException("Image not found")
+        )
+
+        result = ComputeTools().get_server_details("server-1")
+
+        assert result.server.id == "server-1"
+        assert result.ports is None
+        assert result.floating_ips is None
+        assert result.volume_attachments == []
+        assert result.image is None
+        assert [(e.item, e.error) for e in result.errors] == [
+            ("ports", "Network unavailable"),
+            ("image", "Image not found"),
+        ]
+        network.ips.assert_not_called()
+
+    def test_get_server_details_not_found(self, mock_get_openstack_conn):
+        """Test that a missing server fails the call."""
+        mock_get_openstack_conn.compute.get_server.side_effect = (
+            NotFoundException("Server not found")
+        )
+        mock_get_openstack_conn.network.ports.return_value = []
+        mock_get_openstack_conn.block_storage.attachments.return_value = []
+
+        with pytest.raises(NotFoundException, match="Server not found"):
+            ComputeTools().get_server_details("server-1")
+
+    def test_get_server_details_ignores_page_limit(
+        self, mock_get_openstack_conn
+    ):
+        """Test that related resources are not cut by the page limit."""
+        mock_get_openstack_conn.compute.get_server.return_value = {
+            "id": "server-1",
+            "name": "web",
+        }
+        network = mock_get_openstack_conn.network
+        network.ports.return_value = [
+            self.make_port(f"port-{index}", "server-1") for index in range(3)
+        ]
+        network.ips.return_value = []
+        mock_get_openstack_conn.block_storage.attachments.return_value = []
+
+        with patch(
+            "openstack_mcp_server.tools.pagination.config.MCP_DEFAULT_PAGE_LIMIT",
+            1,
+        ):
+            result = ComputeTools().get_server_details("server-1")
+
+        assert [p.id for p in result.ports] == ["port-0", "port-1", "port-2"]
+        assert network.ips.call_count == 3
+
     def test_create_server_success(self, mock_get_openstack_conn):
         """Test creating a server successfully."""
         mock_conn = mock_get_openstack_conn
@@ -206,6 +492,131 @@ class TestComputeTools:
             mock_create_response.id,
         )
 
+    def test_create_server_wait(self, mock_get_openstack_conn, mock_waiter):
+        """Test creating a server and waiting until it is active."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.create_server.return_value = Mock(id="server-1")
+        mock_conn.compute.get_server.return_value = {
+            "name": "new-server",
+            "id": "server-1",
+            "status": "ACTIVE",
+        }
+
+        result = ComputeTools().create_server(
+            name="new-server",
+            image="image-1",
+            flavor=1,
+            network="net-1",
+            wait=True,
+        )
+
+        assert result.status == "ACTIVE"
+        wait_call = mock_waiter.wait.call_args
+        assert wait_call.args == ("server", ["server-1"])
+        assert wait_call.kwargs["targets"] == {"ACTIVE"}
+        assert "ERROR" in wait_call.kwargs["failures"]
+        mock_conn.compute.get_server.assert_called_once_with("server-1")
+
+    @staticmethod
+    def make_server_status(id, status):
+        server = Mock(id=id, status=status)
+        server.name = id
+        return server
+
+    def test_create_servers(self, mock_get_openstack_conn, mock_waiter):
+        """Test creating a batch of servers with one API call."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = [
+            self.make_server_status("web-1", "BUILD"),
+            self.make_server_status("web-2", "BUILD"),
+        ]
+        mock_waiter.wait.return_value = {"web-1": "ACTIVE", "web-2": "ERROR"}
+
+        compute_tools = ComputeTools()
+        result = compute_tools.create_servers(
+            name="web",
+            image="image-1",
+            flavor=1,
+            network="net-1",
+            count=2,
+            wait=True,
+        )
+
+        mock_conn.compute.create_server.assert_called_once_with(
+            name="web",
+            flavorRef=1,
+            imageRef="image-1",
+            networks=[{"uuid": "net-1"}],
+            min_count=2,
+            max_count=2,
+            tags=[result.tag],
+        )
+        mock_conn.compute.servers.assert_called_once_with(tags=result.tag)
+        assert mock_waiter.wait.call_args.args[:2] == (
+            "server",
+            ["web-1", "web-2"],
+        )
+        assert mock_waiter.wait.call_args.kwargs["filters"] == {
+            "tags": result.tag
+        }
+        assert [(s.id, s.status) for s in result.servers] == [
+            ("web-1", "ACTIVE"),
+            ("web-2", "ERROR"),
+        ]
+        mock_conn.compute.get_server.assert_not_called()
+
+    def test_create_servers_wait_polls_batch(self, mock_get_openstack_conn):
+        """Test that waiting for a batch polls its tag-filtered listing."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = [
+            self.make_server_status(f"web-{i}", "ACTIVE") for i in range(2)
+        ]
+
+        compute_tools = ComputeTools()
+        with patch(
+            "openstack_mcp_server.tools.waiter.get_openstack_conn",
+            return_value=mock_conn,
+        ):
+            result = compute_tools.create_servers(
+                name="web",
+                image="image-1",
+                flavor=1,
+                network="net-1",
+                count=2,
+                wait=True,
+                timeout=5,
+            )
+
+        assert [s.status for s in result.servers] == ["ACTIVE", "ACTIVE"]
+        # Listed once for the batch IDs, then by each poll of the waiter.
+        assert mock_conn.compute.servers.call_count >= 2
+        for call in mock_conn.compute.servers.call_args_list:
+            assert call.kwargs == {"tags": result.tag}
+        mock_conn.compute.get_server.assert_not_called()
+
+    def test_create_servers_without_wait(self, mock_get_openstack_conn):
+        """Test that the batch is listed once when not waiting."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = [
+            self.make_server_status("web-1", "BUILD"),
+        ]
+
+        compute_tools = ComputeTools()
+        result = compute_tools.create_servers(
+            name="web",
+            image="image-1",
+            flavor=1,
+            network="net-1",
+            count=3,
+            min_count=1,
+        )
+
+        create_kwargs = mock_conn.compute.create_server.call_args.kwargs
+        assert create_kwargs["min_count"] == 1
+        assert create_kwargs["max_count"] == 3
+        mock_conn.compute.servers.assert_called_once()
+        assert [s.status for s in result.servers] == ["BUILD"]
+
     def test_create_server_with_optional_params(self, mock_get_openstack_conn):
         """Test creating a server with optional parameters."""
         mock_conn = mock_get_openstack_conn
@@ -259,20 +670,25 @@ class TestComputeTools:
         compute_tools = ComputeTools()
         compute_tools.register_tools(mock_mcp)
 
-        mock_tool_decorator.assert_has_calls(
-            [
-                call(compute_tools.get_servers),
-                call(compute_tools.get_server),
-                call(compute_tools.create_server),
-                call(compute_tools.get_flavors),
-                call(compute_tools.action_server),
-                call(compute_tools.update_server),
-                call(compute_tools.delete_server),
-                call(compute_tools.attach_volume),
-                call(compute_tools.detach_volume),
-            ],
-        )
-        assert mock_tool_decorator.call_count == 9
+        # Tools are registered through the worker pool wrapper
+        registered_methods = [
+            c.args[0].__wrapped__ for c in mock_tool_decorator.call_args_list
+        ]
+        assert registered_methods == [
+            compute_tools.get_servers,
+            compute_tools.get_server,
+            compute_tools.get_server_details,
+            compute_tools.create_server,
+            compute_tools.create_servers,
+            compute_tools.get_flavors,
+            compute_tools.action_server,
+            compute_tools.action_servers,
+            compute_tools.update_server,
+            compute_tools.delete_server,
+            compute_tools.attach_volume,
+            compute_tools.detach_volume,
+        ]
+        assert mock_tool_decorator.call_count == 12
 
     def test_compute_tools_instantiation(self):
         """Test ComputeTools can be instantiated."""
@@ -320,7 +736,7 @@ class TestComputeTools:
         mock_conn.compute.flavors.return_value = [mock_flavor1, mock_flavor2]
 
         compute_tools = ComputeTools()
-        result = compute_tools.get_flavors()
+        result = compute_tools.get_flavors().items
 
         expected_output = [
             Flavor(
@@ -351,11 +767,24 @@ class TestComputeTools:
         mock_conn.compute.flavors.return_value = []
 
         compute_tools = ComputeTools()
-        result = compute_tools.get_flavors()
+        result = compute_tools.get_flavors().items
 
         assert result == []
         mock_conn.compute.flavors.assert_called_once()
 
+    def test_get_flavors_cached(self, mock_get_openstack_conn):
+        """Test that repeated flavor listings are served from the cache."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.flavors.return_value = []
+
+        compute_tools = ComputeTools()
+        compute_tools.get_flavors()
+        compute_tools.get_flavors()
+        mock_conn.compute.flavors.assert_called_once()
+
+        compute_tools.get_flavors(refresh=True)
+        assert mock_conn.compute.flavors.call_count == 2
+
     @pytest.mark.parametrize(
         "action",
         [
@@ -437,6 +866,56 @@ class TestComputeTools:
 
         mock_conn.compute.start_server.assert_called_once_with(server_id)
 
+    def test_action_servers_tolerates_conflicts(self, mock_get_openstack_conn):
+        """Test that a conflicting server does not stop the batch."""
+        mock_conn = mock_get_openstack_conn
+
+        def stop_server(server_id):
+            if server_id == "server-2":
+                raise ConflictException("Server is already stopped")
+
+        mock_conn.compute.stop_server.side_effect = stop_server
+
+        compute_tools = ComputeTools()
+        result = compute_tools.action_servers(
+            ServerActionEnum.STOP,
+            ids=["server-1", "server-2", "server-3"],
+        )
+
+        assert sorted(result.succeeded) == ["server-1", "server-3"]
+        assert [(e.item, e.error) for e in result.failed] == [
+            ("server-2", "Server is already stopped"),
+        ]
+        assert mock_conn.compute.stop_server.call_count == 3
+
+    def test_action_servers_by_filter(self, mock_get_openstack_conn):
+        """Test selecting servers with Nova filters."""
+        mock_conn = mock_get_openstack_conn
+        mock_conn.compute.servers.return_value = [
+            Mock(id="server-1"),
+            Mock(id="server-2"),
+        ]
+
+        compute_tools = ComputeTools()
+        result = compute_tools.action_servers(
+            ServerActionEnum.SHELVE,
+            ids=["server-1"],
+            tags=["ci"],
+        )
+
+        mock_conn.compute.servers.assert_called_once_with(
+            details=False, tags="ci"
+        )
+        assert result.succeeded == ["server-1", "server-2"]
+        assert mock_conn.compute.shelve_server.call_count == 2
+
+    def test_action_servers_requires_selection(self, mock_get_openstack_conn):
+        """Test that acting on every server needs an explicit selection."""
+        compute_tools = ComputeTools()
+
+        with pytest.raises(ValueError, match="Select servers"):
+            compute_tools.action_servers(ServerActionEnum.STOP)
+
     def test_update_server_success(self, mock_get_openstack_conn):
         """Test updating a server successfully with all parameters."""
         mock_conn = mock_get_openstack_conn
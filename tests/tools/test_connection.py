@@ -0,0 +1,225 @@
+import threading
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack_mcp_server.tools.connection import ConnectionManager
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_pool():
+    """Isolate the class-level connection pool between tests."""
+    cloud_name = ConnectionManager._cloud_name
+    ConnectionManager._connections.clear()
+    yield
+    ConnectionManager._connections.clear()
+    ConnectionManager._cloud_name = cloud_name
+
+
+@pytest.fixture
+def mock_connect():
+    """Mock openstack.connect returning a fresh connection per call."""
+    with patch(
+        "openstack_mcp_server.tools.connection.openstack.connect",
+        side_effect=lambda **kwargs: Mock(),
+    ) as mock_connect:
+        yield mock_connect
+
+
+class TestConnectionManager:
+    """Test cases for ConnectionManager connection pooling."""
+
+    def test_get_connection_reuses_pooled_connection(self, mock_connect):
+        """Test that repeated calls share one authenticated connection."""
+        manager = ConnectionManager()
+
+        first = manager.get_connection()
+        second = ConnectionManager().get_connection()
+
+        assert first is second
+        mock_connect.assert_called_once_with(
+            cloud=ConnectionManager.get_cloud_name()
+        )
+
+    def test_get_connection_keyed_by_scope(self, mock_connect):
+        """Test that region and project scopes get distinct connections."""
+        manager = ConnectionManager()
+
+        default = manager.get_connection()
+        regional = manager.get_connection(region_name="RegionTwo")
+        scoped = manager.get_connection(
+            region_name="RegionTwo", project_name="demo"
+        )
+
+        assert len({id(default), id(regional), id(scoped)}) == 3
+        assert manager.get_connection(region_name="RegionTwo") is regional
+        mock_connect.assert_any_call(
+            cloud=ConnectionManager.get_cloud_name(),
+            region_name="RegionTwo",
+            project_name="demo",
+        )
+
+    def test_get_connection_refreshes_expiring_token(self, mock_connect):
+        """Test that a token close to expiry is invalidated before reuse."""
+        manager = ConnectionManager()
+        conn = manager.get_connection()
+        conn.session.auth.auth_ref.will_expire_soon.return_value = True
+        conn.session.auth.invalidate.reset_mock()
+
+        manager.get_connection()
+
+        conn.session.auth.invalidate.assert_called_once()
+
+    def test_get_connection_keeps_valid_token(self, mock_connect):
+        """Test that a valid token is reused as is."""
+        manager = ConnectionManager()
+        conn = manager.get_connection()
+        conn.session.auth.auth_ref.will_expire_soon.return_value = False
+        conn.session.auth.invalidate.reset_mock()
+
+        manager.get_connection()
+
+        conn.session.auth.invalidate.assert_not_called()
+
+    def test_set_cloud_name_invalidates_previous_cloud(self, mock_connect):
+        """Test that switching clouds closes the old cloud's connections."""
+        manager = ConnectionManager()
+        ConnectionManager.set_cloud_name("cloud-a")
+        old_conn = manager.get_connection()
+
+        ConnectionManager.set_cloud_name("cloud-b")
+        new_conn = manager.get_connection()
+
+        old_conn.close.assert_called_once()
+        assert new_conn is not old_conn
+        mock_connect.assert_called_with(cloud="cloud-b")
+
+    def test_set_same_cloud_name_keeps_connections(self, mock_connect):
+        """Test that re-selecting the active cloud keeps the pool."""
+        manager = ConnectionManager()
+        ConnectionManager.set_cloud_name("cloud-a")
+        conn = manager.get_connection()
+
+        ConnectionManager.set_cloud_name("cloud-a")
+
+        assert manager.get_connection() is conn
+        conn.close.assert_not_called()
+
+    def test_invalidate_connections_all(self, mock_connect):
+        """Test dropping every pooled connection."""
+        manager = ConnectionManager()
+        conn = manager.get_connection()
+
+        ConnectionManager.invalidate_connections()
+
+        conn.close.assert_called_once()
+        assert ConnectionManager._connections == {}
+
+
+class TestConnectionManagerTokenCache:
+    """Test cases for restoring auth state from the token cache."""
+
+    @pytest.fixture
+    def token_cache(self):
+        token_cache = Mock()
+        with patch.object(ConnectionManager, "_token_cache", token_cache):
+            yield token_cache
+
+    @staticmethod
+    def _connection(expiring: bool):
+        conn = Mock()
+        conn.config.get_auth_args.return_value = {
+            "auth_url": "https://keystone",
+            "username": "admin",
+            "password": "secret",
+        }
+        conn.config.get_region_name.return_value = "RegionOne"
+        conn.session.auth.auth_ref.will_expire_soon.return_value = expiring
+        conn.session.auth.get_auth_state.return_value = '{"token": "new"}'
+        return conn
+
+    def test_valid_cached_token_skips_authentication(self, token_cache):
+        """Test that a valid cached token avoids a keystone round trip."""
+        conn = self._connection(expiring=False)
+        token_cache.load.return_value = '{"token": "cached"}'
+
+        with patch(
+            "openstack_mcp_server.tools.connection.openstack.connect",
+            return_value=conn,
+        ):
+            ConnectionManager().get_connection()
+
+        conn.session.auth.set_auth_state.assert_called_once_with(
+            '{"token": "cached"}'
+        )
+        conn.authorize.assert_not_called()
+        token_cache.save.assert_not_called()
+
+    def test_expired_cached_token_is_replaced(self, token_cache):
+        """Test that an expiring cached token is refreshed and persisted."""
+        conn = self._connection(expiring=True)
+        token_cache.load.return_value = '{"token": "old"}'
+
+        with patch(
+            "openstack_mcp_server.tools.connection.openstack.connect",
+            return_value=conn,
+        ):
+            ConnectionManager().get_connection()
+
+        conn.session.auth.invalidate.assert_called()
+        conn.authorize.assert_called()
+        token_cache.save.assert_called_with(
+            token_cache.load.call_args.args[0], '{"token": "new"}'
+        )
+
+    def test_cache_miss_authenticates_and_persists(self, token_cache):
+        """Test that a cache miss authenticates once and stores the token."""
+        conn = self._connection(expiring=False)
+        token_cache.load.return_value = None
+
+        with patch(
+            "openstack_mcp_server.tools.connection.openstack.connect",
+            return_value=conn,
+        ):
+            ConnectionManager().get_connection()
+
+        conn.authorize.assert_called_once()
+        token_cache.save.assert_called_once()
+
+    def test_cache_key_excludes_secrets(self):
+        """Test that passwords never influence the cache key."""
+        manager = ConnectionManager()
+        conn = self._connection(expiring=False)
+        other = self._connection(expiring=False)
+        other.config.get_auth_args.return_value = {
+            **conn.config.get_auth_args.return_value,
+            "password": "changed",
+        }
+
+        assert manager._token_cache_key(conn) == manager._token_cache_key(
+            other
+        )
+
+
+class TestConnectionManagerThreads:
+    """Test cases for per-thread pooled connections."""
+
+    def test_threads_get_own_connection_sharing_token(self, mock_connect):
+        """Test that worker threads reuse the token of the same scope."""
+        manager = ConnectionManager()
+        main_conn = manager.get_connection()
+        main_conn.session.auth.get_auth_state.return_value = "state"
+        result = {}
+
+        thread = threading.Thread(
+            target=lambda: result.update(conn=manager.get_connection())
+        )
+        thread.start()
+        thread.join()
+
+        assert result["conn"] is not main_conn
+        result["conn"].session.auth.set_auth_state.assert_called_once_with(
+            "state"
+        )
+        assert manager.get_connection() is main_conn
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pydantic import BaseModel, ValidationError
+
+from openstack_mcp_server.tools.conversion import ModelConverter
+
+
+class Item(BaseModel):
+    id: str
+    name: str = ""
+    size: int | None = None
+
+
+class TestModelConverter:
+    """Test cases for ModelConverter class."""
+
+    def test_convert_resource(self):
+        """Test that fields are read from attributes or accessors."""
+        converter = ModelConverter(Item, name=lambda r: r.name or "")
+
+        item = converter(SimpleNamespace(id="item-1", name=None, size=3))
+
+        assert item == Item(id="item-1", name="", size=3)
+
+    def test_convert_missing_attribute(self):
+        """Test that missing attributes are converted to None."""
+        converter = ModelConverter(Item, name=lambda r: "item")
+
+        assert converter(SimpleNamespace(id="item-1")) == Item(
+            id="item-1", name="item"
+        )
+
+    def test_convert_undeclared_attribute(self):
+        """Test that fields the resource class lacks are not read."""
+
+        class Resource:
+            # Attributes are declared on the class, as by openstacksdk.
+            id = property(lambda self: self._id)
+            name = "item"
+
+            def __init__(self, id):
+                self._id = id
+
+            def __getattr__(self, name):
+                raise AssertionError(f"{name} is read by name")
+
+        converter = ModelConverter(Item)
+
+        items = converter.many([Resource("item-1"), Resource("item-2")])
+
+        assert items == [
+            Item(id="item-1", name="item"),
+            Item(id="item-2", name="item"),
+        ]
+
+    def test_convert_many(self):
+        """Test that lists are converted in order."""
+        converter = ModelConverter(Item, name=lambda r: r.name or "")
+        resources = [
+            SimpleNamespace(id=f"item-{i}", name=f"name-{i}", size="2")
+            for i in range(3)
+        ]
+
+        items = converter.many(resources)
+
+        assert items == [
+            Item(id=f"item-{i}", name=f"name-{i}", size=2) for i in range(3)
+        ]
+
+    def test_validate_many(self):
+        """Test that mappings keyed by field name are validated as they are."""
+        converter = ModelConverter(Item)
+
+        items = converter.validate_many(
+            iter([{"id": "item-1", "size": 1, "extra": True}])
+        )
+
+        assert items == [Item(id="item-1", size=1)]
+
+    def test_convert_many_invalid(self):
+        """Test that an invalid resource fails the whole conversion."""
+        converter = ModelConverter(Item, name=lambda r: "")
+
+        with pytest.raises(ValidationError):
+            converter.many([SimpleNamespace(id=None)])
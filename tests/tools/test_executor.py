@@ -0,0 +1,232 @@
+import asyncio
+import inspect
+import threading
+import time
+
+from fastmcp import Client, Context, FastMCP
+
+from openstack_mcp_server.tools.executor import (
+    ToolExecutor,
+    current_cancel_event,
+    progress_reporter,
+    register_service_tools,
+)
+
+
+class SampleTools:
+    def get_thread_name(self, suffix: str | None = None) -> str:
+        """
+        Return the name of the thread running the tool.
+
+        :param suffix: Text appended to the thread name
+        """
+        return threading.current_thread().name + (suffix or "")
+
+    def count(self, total: int, ctx: Context | None = None) -> int:
+        """
+        Report progress up to a total.
+
+        :param total: Number of steps
+        """
+        report = progress_reporter(ctx)
+        for step in range(1, total + 1):
+            report(step, total)
+        return total
+
+
+class TestToolExecutor:
+    """Test cases for ToolExecutor class."""
+
+    def test_wrap_preserves_signature_and_runs_on_pool(self):
+        """Test that wrapped tools keep their schema and leave the loop."""
+        executor = ToolExecutor(max_workers=2)
+        tool = executor.wrap(SampleTools().get_thread_name, "compute")
+
+        assert inspect.iscoroutinefunction(tool)
+        assert tool.__name__ == "get_thread_name"
+        assert list(inspect.signature(tool).parameters) == ["suffix"]
+
+        result = asyncio.run(tool(suffix="-done"))
+
+        assert result.startswith("openstack-mcp-tool")
+        assert result.endswith("-done")
+        executor.shutdown()
+
+    def test_wrap_keeps_coroutine_functions(self):
+        """Test that async tools are registered unchanged."""
+        executor = ToolExecutor(max_workers=1)
+
+        async def tool():
+            return None
+
+        assert executor.wrap(tool, "compute") is tool
+        executor.shutdown()
+
+    def test_service_concurrency_limit(self):
+        """Test that a service never exceeds its concurrency limit."""
+        executor = ToolExecutor(max_workers=8, service_limits={"network": 2})
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def slow_call():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        async def main():
+            await asyncio.gather(
+                *(executor.run("network", slow_call) for _ in range(6))
+            )
+
+        asyncio.run(main())
+
+        assert peak == 2
+        stats = executor.get_tool_executor_stats()
+        assert stats.max_workers == 8
+        assert stats.active == 0
+        assert stats.waiting == 0
+        assert stats.services[0].service == "network"
+        assert stats.services[0].limit == 2
+        assert stats.services[0].completed == 6
+        executor.shutdown()
+
+    def test_stats_report_saturation(self):
+        """Test that in-flight and queued calls are reported."""
+        executor = ToolExecutor(max_workers=4, service_limits={"compute": 1})
+        release = threading.Event()
+
+        async def main():
+            calls = [
+                asyncio.ensure_future(executor.run("compute", release.wait))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            stats = executor.get_tool_executor_stats()
+            release.set()
+            await asyncio.gather(*calls)
+            return stats
+
+        stats = asyncio.run(main())
+
+        assert stats.active == 1
+        assert stats.waiting == 2
+        executor.shutdown()
+
+    def test_register_service_tools(self):
+        """Test that registered tools are callable through FastMCP."""
+        mcp = FastMCP("test")
+        register_service_tools(mcp, "compute", [SampleTools().get_thread_name])
+
+        async def main():
+            async with Client(mcp) as client:
+                tools = await client.list_tools()
+                result = await client.call_tool(
+                    "get_thread_name", {"suffix": "!"}
+                )
+                return tools, result
+
+        tools, result = asyncio.run(main())
+
+        assert [t.name for t in tools] == ["get_thread_name"]
+        assert result.data.startswith("openstack-mcp-tool")
+
+    def test_progress_reporter(self):
+        """Test that worker threads send progress notifications."""
+        mcp = FastMCP("test")
+        register_service_tools(mcp, "compute", [SampleTools().count])
+        progress = []
+
+        async def on_progress(current, total, message):
+            progress.append((current, total))
+
+        async def main():
+            async with Client(mcp, progress_handler=on_progress) as client:
+                tools = await client.list_tools()
+                result = await client.call_tool("count", {"total": 2})
+                # Notifications are sent without blocking the tool.
+                await asyncio.sleep(0.05)
+                return tools, result
+
+        tools, result = asyncio.run(main())
+
+        assert list(tools[0].input_schema["properties"]) == ["total"]
+        assert result.data == 2
+        assert progress == [(1, 2), (2, 2)]
+
+    def test_progress_reporter_outside_tool_call(self):
+        """Test that progress is not reported without a tool call."""
+        assert progress_reporter(None) is None
+        assert current_cancel_event() is None
+
+    def test_cancel_event_set_on_cancellation(self):
+        """Test that cancelling a tool call flags the worker thread."""
+        executor = ToolExecutor(max_workers=1)
+        started = threading.Event()
+        events = []
+
+        def wait_for_cancel():
+            events.append(current_cancel_event())
+            started.set()
+            return events[0].wait(1)
+
+        async def main():
+            call = asyncio.ensure_future(
+                executor.run("compute", wait_for_cancel)
+            )
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait
+            )
+            call.cancel()
+            await asyncio.gather(call, return_exceptions=True)
+
+        asyncio.run(main())
+
+        assert events[0].is_set()
+        executor.shutdown()
+
+    def test_cancelled_call_holds_service_slot(self):
+        """Test that a cancelled call keeps its slot until its thread ends."""
+        executor = ToolExecutor(max_workers=4, service_limits={"compute": 1})
+        started = threading.Event()
+        release = threading.Event()
+        running = []
+
+        def blocking_call():
+            started.set()
+            release.wait(1)
+
+        async def main():
+            call = asyncio.ensure_future(
+                executor.run("compute", blocking_call)
+            )
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait
+            )
+            call.cancel()
+            await asyncio.gather(call, return_exceptions=True)
+
+            queued = asyncio.ensure_future(
+                executor.run("compute", lambda: running.append(True))
+            )
+            await asyncio.sleep(0.05)
+            stats = executor.get_tool_executor_stats()
+            ran_early = bool(running)
+            release.set()
+            await queued
+            return stats, ran_early
+
+        stats, ran_early = asyncio.run(main())
+
+        assert not ran_early
+        assert stats.active == 1
+        assert stats.waiting == 1
+        assert stats.services[0].completed == 0
+        assert running == [True]
+        final = executor.get_tool_executor_stats().services[0]
+        assert (final.active, final.completed) == (0, 2)
+        executor.shutdown()
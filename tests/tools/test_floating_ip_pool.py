@@ -0,0 +1,238 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack import exceptions
+
+from openstack_mcp_server.tools.floating_ip_pool import FloatingIPPool
+from openstack_mcp_server.tools.network_tools import NetworkTools
+
+
+def make_ip(id, port_id=None, revision_number=1):
+    return Mock(id=id, port_id=port_id, revision_number=revision_number)
+
+
+def make_assigned_ip(id, port_id):
+    ip = Mock(
+        id=id,
+        port_id=port_id,
+        **dict.fromkeys(
+            [
+                "status",
+                "description",
+                "project_id",
+                "floating_ip_address",
+                "floating_network_id",
+                "fixed_ip_address",
+                "router_id",
+            ]
+        ),
+    )
+    ip.name = None
+    return ip
+
+
+@pytest.fixture
+def mock_pool_conn():
+    with patch(
+        "openstack_mcp_server.tools.floating_ip_pool.get_openstack_conn"
+    ) as mock_get_conn:
+        mock_conn = Mock()
+        mock_get_conn.return_value = mock_conn
+        yield mock_conn
+
+
+@pytest.fixture
+def pool():
+    pool = FloatingIPPool(size=2, refill_interval=3600)
+    # Keep the background refiller from running during tests.
+    pool._thread = Mock()
+    yield pool
+    pool.shutdown()
+
+
+class TestFloatingIPPool:
+    """Test cases for FloatingIPPool class."""
+
+    def test_refill_reconciles_and_allocates(self, pool, mock_pool_conn):
+        """Test that free IPs are indexed and missing ones allocated."""
+        mock_pool_conn.network.ips.return_value = [
+            make_ip("fip-1", port_id="port-1"),
+            make_ip("fip-2", revision_number=3),
+        ]
+        mock_pool_conn.network.create_ip.return_value = make_ip("fip-3")
+
+        pool.refill("ext-net")
+
+        mock_pool_conn.network.create_ip.assert_called_once_with(
+            floating_network_id="ext-net",
+        )
+        assert pool.size("ext-net") == 2
+        assert pool.pop("ext-net") == ("fip-2", 3)
+        assert pool.pop("ext-net") == ("fip-3", 1)
+        assert pool.pop("ext-net") is None
+
+    def test_refill_drops_stale_entries(self, pool, mock_pool_conn):
+        """Test that IPs assigned elsewhere leave the pool."""
+        mock_pool_conn.network.ips.return_value = [
+            make_ip("fip-1"),
+            make_ip("fip-2"),
+        ]
+        pool.refill("ext-net")
+
+        mock_pool_conn.network.ips.return_value = [
+            make_ip("fip-1", port_id="port-1"),
+            make_ip("fip-2"),
+            make_ip("fip-3"),
+        ]
+        pool.refill("ext-net")
+
+        assert pool.pop("ext-net")[0] == "fip-2"
+        assert pool.pop("ext-net")[0] == "fip-3"
+
+    def test_pop_wakes_refiller_below_low_water(self, mock_pool_conn):
+        """Test that pops above half of the pool size do not refill."""
+        pool = FloatingIPPool(size=4, refill_interval=3600)
+        pool._thread = Mock()
+        mock_pool_conn.network.ips.return_value = [
+            make_ip(f"fip-{index}") for index in range(4)
+        ]
+        pool.refill("ext-net")
+
+        pool.pop("ext-net")
+        assert not pool._wakeup.is_set()
+        pool.pop("ext-net")
+        assert not pool._wakeup.is_set()
+        pool.pop("ext-net")
+        assert pool._wakeup.is_set()
+
+    def test_disabled(self):
+        """Test that a pool of size 0 is disabled."""
+        assert FloatingIPPool(size=0, refill_interval=30).enabled is False
+
+
+class TestAssignFromPool:
+    """Test cases for assigning floating IPs from the pool."""
+
+    def test_assign_pops_from_pool(self, mock_openstack_connect_network):
+        """Test that assignment is a single conditional update."""
+        mock_conn = mock_openstack_connect_network
+        pool = Mock(enabled=True)
+        pool.pop.side_effect = [("fip-1", 4), ("fip-2", 7)]
+        assigned = Mock(
+            id="fip-2",
+            port_id="port-1",
+            **dict.fromkeys(
+                [
+                    "status",
+                    "description",
+                    "project_id",
+                    "floating_ip_address",
+                    "floating_network_id",
+                    "fixed_ip_address",
+                    "router_id",
+                ]
+            ),
+        )
+        assigned.name = None
+        mock_conn.network.update_ip.side_effect = [
+            exceptions.PreconditionFailedException(),
+            assigned,
+        ]
+
+        with patch(
+            "openstack_mcp_server.tools.network_tools.get_floating_ip_pool",
+            return_value=pool,
+        ):
+            result = NetworkTools().assign_first_available_floating_ip(
+                "ext-net", "port-1"
+            )
+
+        assert result.id == "fip-2"
+        mock_conn.network.update_ip.assert_called_with(
+            "fip-2", if_revision=7, port_id="port-1"
+        )
+        mock_conn.network.ips.assert_not_called()
+
+    def test_assign_conflict_is_raised(self, mock_openstack_connect_network):
+        """Test that a conflict caused by the port does not drain the pool."""
+        mock_conn = mock_openstack_connect_network
+        pool = Mock(enabled=True)
+        pool.pop.side_effect = [("fip-1", 4), ("fip-2", 7)]
+        mock_conn.network.update_ip.side_effect = exceptions.ConflictException(
+            "Port already has a floating IP"
+        )
+
+        with (
+            patch(
+                "openstack_mcp_server.tools.network_tools.get_floating_ip_pool",
+                return_value=pool,
+            ),
+            pytest.raises(exceptions.ConflictException),
+        ):
+            NetworkTools().assign_first_available_floating_ip(
+                "ext-net", "port-1"
+            )
+
+        assert pool.pop.call_count == 1
+        mock_conn.network.update_ip.assert_called_once_with(
+            "fip-1", if_revision=4, port_id="port-1"
+        )
+
+    def test_assign_listed_ip_race(self, mock_openstack_connect_network):
+        """Test that a listed IP taken by another client is skipped."""
+        mock_conn = mock_openstack_connect_network
+        pool = Mock(enabled=False)
+        mock_conn.network.ips.return_value = [
+            make_ip("fip-0", port_id="port-0"),
+            make_ip("fip-1", revision_number=2),
+            make_ip("fip-2", revision_number=5),
+        ]
+        mock_conn.network.update_ip.side_effect = [
+            exceptions.PreconditionFailedException(),
+            make_assigned_ip("fip-2", "port-1"),
+        ]
+
+        with patch(
+            "openstack_mcp_server.tools.network_tools.get_floating_ip_pool",
+            return_value=pool,
+        ):
+            result = NetworkTools().assign_first_available_floating_ip(
+                "ext-net", "port-1"
+            )
+
+        assert result.id == "fip-2"
+        assert mock_conn.network.update_ip.call_args_list == [
+            (("fip-1",), {"if_revision": 2, "port_id": "port-1"}),
+            (("fip-2",), {"if_revision": 5, "port_id": "port-1"}),
+        ]
+        mock_conn.network.create_ip.assert_not_called()
+
+    def test_assign_creates_when_listed_ips_taken(
+        self, mock_openstack_connect_network
+    ):
+        """Test that an IP is created once every listed IP is taken."""
+        mock_conn = mock_openstack_connect_network
+        pool = Mock(enabled=False)
+        mock_conn.network.ips.return_value = [make_ip("fip-1")]
+        mock_conn.network.create_ip.return_value = make_ip("fip-3")
+        mock_conn.network.update_ip.side_effect = [
+            exceptions.PreconditionFailedException(),
+            make_assigned_ip("fip-3", "port-1"),
+        ]
+
+        with patch(
+            "openstack_mcp_server.tools.network_tools.get_floating_ip_pool",
+            return_value=pool,
+        ):
+            result = NetworkTools().assign_first_available_floating_ip(
+                "ext-net", "port-1"
+            )
+
+        assert result.id == "fip-3"
+        mock_conn.network.create_ip.assert_called_once_with(
+            floating_network_id="ext-net"
+        )
+        mock_conn.network.update_ip.assert_called_with(
+            "fip-3", port_id="port-1"
+        )
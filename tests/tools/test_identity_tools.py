@@ -38,7 +38,7 @@ class TestIdentityTools:
 
         # Test get_regions()
         identity_tools = self.get_identity_tools()
-        result = identity_tools.get_regions()
+        result = identity_tools.get_regions().items
 
         # Verify results
         assert result == [
@@ -58,7 +58,7 @@ class TestIdentityTools:
 
         # Test get_regions()
         identity_tools = self.get_identity_tools()
-        result = identity_tools.get_regions()
+        result = identity_tools.get_regions().items
 
         # Verify results
         assert result == []
@@ -363,7 +363,7 @@ class TestIdentityTools:
 
         # Test get_domains()
         identity_tools = self.get_identity_tools()
-        result = identity_tools.get_domains()
+        result = identity_tools.get_domains().items
 
         # Verify results
         assert result == [
@@ -393,7 +393,7 @@ class TestIdentityTools:
 
         # Test get_domains()
         identity_tools = self.get_identity_tools()
-        result = identity_tools.get_domains()
+        result = identity_tools.get_domains().items
 
         # Verify results
         assert result == []
@@ -749,7 +749,7 @@ class TestIdentityTools:
 
         # Test get_projects()
         identity_tools = self.get_identity_tools()
-        result = identity_tools.get_projects()
+        result = identity_tools.get_projects().items
 
         # Verify results
         assert result == [
@@ -791,7 +791,7 @@ class TestIdentityTools:
 
         # Test get_projects()
         identity_tools = self.get_identity_tools()
-        result = identity_tools.get_projects(name="ProjectOne")
+        result = identity_tools.get_projects(name="ProjectOne").items
 
         # Verify results
         assert result[0] == Project(
@@ -817,7 +817,7 @@ class TestIdentityTools:
 
         # Test get_projects()
         identity_tools = self.get_identity_tools()
-        result = identity_tools.get_projects()
+        result = identity_tools.get_projects().items
 
         # Verify results
         assert result == []
@@ -83,7 +83,7 @@ class TestImageTools:
         )
         mock_conn.image.images.return_value = [mock_image1, mock_image2]
 
-        result = ImageTools().get_images()
+        result = ImageTools().get_images().items
 
         mock_conn.image.images.assert_called_once()
         expected_output = [
@@ -97,11 +97,28 @@ class TestImageTools:
         mock_conn = mock_get_openstack_conn_image
         mock_conn.image.images.return_value = []
 
-        result = ImageTools().get_images()
+        result = ImageTools().get_images().items
 
         mock_conn.image.images.assert_called_once()
         assert result == []
 
+    def test_get_images_invalidated_by_delete(
+        self, mock_get_openstack_conn_image
+    ):
+        """Test that deleting an image invalidates cached image listings."""
+        mock_conn = mock_get_openstack_conn_image
+        mock_conn.image.images.return_value = []
+
+        image_tools = ImageTools()
+        image_tools.get_images()
+        image_tools.get_images()
+        mock_conn.image.images.assert_called_once()
+
+        image_tools.delete_image("img-123-abc-def")
+        image_tools.get_images()
+
+        assert mock_conn.image.images.call_count == 2
+
     def test_get_images_with_status_filter(
         self, mock_get_openstack_conn_image
     ):
@@ -117,7 +134,7 @@ class TestImageTools:
         )
         mock_conn.image.images.return_value = [mock_image]
 
-        result = ImageTools().get_images(status="active")
+        result = ImageTools().get_images(status="active").items
 
         mock_conn.image.images.assert_called_once_with(status="active")
         expected_output = [Image(**mock_image)]
@@ -138,7 +155,7 @@ class TestImageTools:
         )
         mock_conn.image.images.return_value = [mock_image]
 
-        result = ImageTools().get_images(visibility="private")
+        result = ImageTools().get_images(visibility="private").items
 
         mock_conn.image.images.assert_called_once_with(visibility="private")
         expected_output = [Image(**mock_image)]
@@ -157,7 +174,7 @@ class TestImageTools:
         )
         mock_conn.image.images.return_value = [mock_image]
 
-        result = ImageTools().get_images(name="centos-8-stream")
+        result = ImageTools().get_images(name="centos-8-stream").items
 
         mock_conn.image.images.assert_called_once_with(name="centos-8-stream")
         expected_output = [Image(**mock_image)]
@@ -178,8 +195,14 @@ class TestImageTools:
         )
         mock_conn.image.images.return_value = [mock_image]
 
-        result = ImageTools().get_images(
-            name="ubuntu-20.04-server", status="active", visibility="public"
+        result = (
+            ImageTools()
+            .get_images(
+                name="ubuntu-20.04-server",
+                status="active",
+                visibility="public",
+            )
+            .items
         )
 
         mock_conn.image.images.assert_called_once_with(
@@ -298,6 +321,32 @@ class TestImageTools:
             mock_image["id"],
         )
 
+    def test_create_image_wait(
+        self,
+        mock_get_openstack_conn_image,
+        mock_waiter,
+    ):
+        """Test creating an image and waiting until it is active."""
+        mock_image = self.image_factory()
+        mock_get_openstack_conn_image.block_storage.create_image.return_value = Mock(
+            id=mock_image["id"],
+        )
+        mock_get_openstack_conn_image.get_image.return_value = mock_image
+
+        image_data = CreateImage(
+            name=mock_image["name"],
+            volume="6cf57d8d-00ca-43ff-ae6f-56912b69528a",
+            container_format=mock_image["container_format"],
+            disk_format=mock_image["disk_format"],
+        )
+        created_image = ImageTools().create_image(image_data, wait=True)
+
+        assert created_image == Image(**mock_image)
+        wait_call = mock_waiter.wait.call_args
+        assert wait_call.args == ("image", [mock_image["id"]])
+        assert wait_call.kwargs["targets"] == {"active"}
+        assert wait_call.kwargs["timeout"] == 3600
+
     def test_delete_image_success(self, mock_get_openstack_conn_image):
         """Test deleting an image successfully."""
         mock_conn = mock_get_openstack_conn_image
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import sys
+
+import pytest
+
+from fastmcp import Client, FastMCP
+
+from openstack_mcp_server.tools import manifest as manifest_module
+from openstack_mcp_server.tools.lazy import lazy_import
+from openstack_mcp_server.tools.manifest import (
+    MANIFEST_PATH,
+    LazyTool,
+    build_manifest,
+    register_manifest_tools,
+)
+
+
+class TestManifest:
+    """Test cases for the tool manifest."""
+
+    def test_manifest_up_to_date(self):
+        """Test that the manifest matches the registered tools.
+
+        Regenerate it with `python -m openstack_mcp_server.tools.manifest`.
+        """
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+        assert asyncio.run(build_manifest()) == manifest
+
+    def test_register_manifest_tools(self):
+        """Test that manifest tools list the schemas of the real tools."""
+        mcp = FastMCP("test")
+        register_manifest_tools(mcp)
+
+        async def main():
+            tools = await mcp.list_tools()
+            built = await build_manifest()
+            return tools, built
+
+        tools, built = asyncio.run(main())
+
+        entries = built["tools"]
+        assert all(isinstance(tool, LazyTool) for tool in tools)
+        assert [tool.name for tool in tools] == [e["name"] for e in entries]
+        get_servers = next(t for t in tools if t.name == "get_servers")
+        assert (
+            get_servers.to_mcp_tool().input_schema == entries[0]["parameters"]
+        )
+
+    def test_register_selected_tools(self):
+        """Test that only tools of enabled services or names register."""
+        mcp = FastMCP("test")
+        register_manifest_tools(mcp, services=["image"], tools=["get_servers"])
+
+        tools = asyncio.run(mcp.list_tools())
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+        assert [tool.name for tool in tools] == [
+            entry["name"]
+            for entry in manifest["tools"]
+            if entry["name"] == "get_servers" or entry["tags"] == ["image"]
+        ]
+        assert "get_networks" not in {tool.name for tool in tools}
+
+    def test_register_eagerly_on_version_mismatch(self, monkeypatch):
+        """Test that other schema package versions skip the manifest."""
+        monkeypatch.setattr(
+            manifest_module,
+            "schema_versions",
+            lambda: {"fastmcp": "0.0.0", "pydantic": "0.0.0"},
+        )
+        mcp = FastMCP("test")
+        register_manifest_tools(mcp, services=["image"], tools=["get_servers"])
+
+        tools = asyncio.run(mcp.list_tools())
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+        assert not any(isinstance(tool, LazyTool) for tool in tools)
+        assert {tool.name for tool in tools} == {
+            entry["name"]
+            for entry in manifest["tools"]
+            if entry["name"] == "get_servers" or entry["tags"] == ["image"]
+        }
+
+    def test_register_unknown_service(self):
+        """Test that unknown services or tools are rejected."""
+        mcp = FastMCP("test")
+
+        with pytest.raises(ValueError, match="Unknown services: dns"):
+            register_manifest_tools(mcp, services=["compute", "dns"])
+        with pytest.raises(ValueError, match="Unknown tools: get_zones"):
+            register_manifest_tools(mcp, tools=["get_zones"])
+
+    def test_call_manifest_tool(self, mock_get_openstack_conn):
+        """Test that calling a manifest tool runs the real tool."""
+        mock_get_openstack_conn.compute.servers.return_value = [
+            {"id": "server-1", "name": "web-1", "status": "ACTIVE"}
+        ]
+        mcp = FastMCP("test")
+        register_manifest_tools(mcp)
+
+        async def main():
+            async with Client(mcp) as client:
+                return await client.call_tool(
+                    "get_servers", {"status": "active"}
+                )
+
+        result = asyncio.run(main())
+
+        mock_get_openstack_conn.compute.servers.assert_called_once_with(
+            status="ACTIVE"
+        )
+        assert result.structured_content["items"][0]["id"] == "server-1"
+
+
+class TestLazyImport:
+    """Test cases for lazy_import function."""
+
+    def test_lazy_import_defers_execution(self, tmp_path, monkeypatch):
+        """Test that the module only runs on first attribute access."""
+        marker = tmp_path / "executed"
+        (tmp_path / "lazy_sample.py").write_text(
+            f"open({str(marker)!r}, 'w').close()\nVALUE = 1\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "lazy_sample", raising=False)
+
+        module = lazy_import("lazy_sample")
+
+        assert not marker.exists()
+        assert module.VALUE == 1
+        assert marker.exists()
+        monkeypatch.delitem(sys.modules, "lazy_sample")
+
+    def test_lazy_import_loaded_module(self):
+        """Test that loaded modules are returned as they are."""
+        assert lazy_import("json") is json
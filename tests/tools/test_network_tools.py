@@ -1,7 +1,13 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack import exceptions
 
 from openstack_mcp_server.tools.network_tools import NetworkTools
 from openstack_mcp_server.tools.request.network import (
+    CreateNetwork,
+    CreatePort,
     ExternalGatewayInfo,
     Route,
 )
@@ -12,6 +18,7 @@ from openstack_mcp_server.tools.response.network import (
     Router,
     RouterInterface,
     SecurityGroup,
+    SecurityGroupRule,
     Subnet,
 )
 
@@ -62,7 +69,7 @@ class TestNetworkTools:
         ]
 
         network_tools = self.get_network_tools()
-        result = network_tools.get_networks()
+        result = network_tools.get_networks().items
 
         expected_network1 = Network(
             id="net-123-abc-def",
@@ -108,7 +115,7 @@ class TestNetworkTools:
         mock_conn.network.networks.return_value = []
 
         network_tools = self.get_network_tools()
-        result = network_tools.get_networks()
+        result = network_tools.get_networks().items
 
         assert result == []
 
@@ -151,7 +158,7 @@ class TestNetworkTools:
             mock_network1,
         ]  # Only ACTIVE network
         network_tools = self.get_network_tools()
-        result = network_tools.get_networks(status_filter="ACTIVE")
+        result = network_tools.get_networks(status_filter="ACTIVE").items
 
         assert len(result) == 1
         assert result[0].id == "net-active"
@@ -199,7 +206,7 @@ class TestNetworkTools:
         ]  # Only shared network
 
         network_tools = self.get_network_tools()
-        result = network_tools.get_networks(shared_only=True)
+        result = network_tools.get_networks(shared_only=True).items
 
         assert len(result) == 1
         assert result[0].id == "net-shared"
@@ -231,7 +238,7 @@ class TestNetworkTools:
         mock_conn.network.networks.return_value = [mock_network]
 
         tools = self.get_network_tools()
-        res = tools.get_networks(status_filter="active")
+        res = tools.get_networks(status_filter="active").items
 
         assert len(res) == 1
         assert res[0].status == "ACTIVE"
@@ -527,7 +534,7 @@ class TestNetworkTools:
             status_filter="ACTIVE",
             device_id="device-1",
             network_id="net-1",
-        )
+        ).items
 
         assert result == [
             Port(
@@ -554,6 +561,154 @@ class TestNetworkTools:
             network_id="net-1",
         )
 
+    @staticmethod
+    def make_port(id):
+        port = Mock(
+            id=id,
+            **dict.fromkeys(
+                [
+                    "status",
+                    "description",
+                    "project_id",
+                    "network_id",
+                    "is_admin_state_up",
+                    "device_id",
+                    "device_owner",
+                    "mac_address",
+                    "fixed_ips",
+                    "security_group_ids",
+                ]
+            ),
+        )
+        port.name = None
+        return port
+
+    def test_create_ports_in_chunks(self, mock_openstack_connect_network):
+        """Test that ports are created with chunked bulk requests."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.create_ports.side_effect = lambda data: [
+            self.make_port(f"port-{args['name']}") for args in data
+        ]
+
+        tools = self.get_network_tools()
+        result = tools.create_ports(
+            [
+                CreatePort(network_id="net-1", name=str(index))
+                for index in range(3)
+            ],
+            chunk_size=2,
+        )
+
+        assert sorted(port.id for port in result.succeeded) == [
+            "port-0",
+            "port-1",
+            "port-2",
+        ]
+        assert result.failed == []
+        chunks = sorted(
+            (c.args[0] for c in mock_conn.network.create_ports.call_args_list),
+            key=len,
+        )
+        assert [len(chunk) for chunk in chunks] == [1, 2]
+        assert chunks[1][0] == {
+            "network_id": "net-1",
+            "admin_state_up": True,
+            "name": "0",
+        }
+        mock_conn.network.create_port.assert_not_called()
+
+    def test_create_ports_falls_back_to_single_creates(
+        self, mock_openstack_connect_network
+    ):
+        """Test that a rejected bulk request is retried port by port."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.create_ports.side_effect = (
+            exceptions.BadRequestException(
+                message="Bulk operation not supported",
+                response=Mock(status_code=400, headers={}),
+            )
+        )
+
+        def create_port(**args):
+            if args["name"] == "1":
+                raise Exception("No more IP addresses available")
+            return self.make_port(f"port-{args['name']}")
+
+        mock_conn.network.create_port.side_effect = create_port
+
+        tools = self.get_network_tools()
+        result = tools.create_ports(
+            [
+                CreatePort(network_id="net-1", name=str(index))
+                for index in range(2)
+            ]
+        )
+
+        assert [port.id for port in result.succeeded] == ["port-0"]
+        assert [(e.item, e.error) for e in result.failed] == [
+            ("1", "No more IP addresses available"),
+        ]
+
+    def test_create_ports_chunk_timeout_not_retried(
+        self, mock_openstack_connect_network
+    ):
+        """Test that a chunk failing after it may be created is not retried."""
+        mock_conn = mock_openstack_connect_network
+
+        def create_ports(data):
+            if data[0]["name"] == "0":
+                raise TimeoutError("Read timed out")
+            return [self.make_port(f"port-{args['name']}") for args in data]
+
+        mock_conn.network.create_ports.side_effect = create_ports
+
+        tools = self.get_network_tools()
+        result = tools.create_ports(
+            [
+                CreatePort(network_id="net-1", name=str(index))
+                for index in range(3)
+            ],
+            chunk_size=2,
+        )
+
+        assert [port.id for port in result.succeeded] == ["port-2"]
+        assert [(e.item, e.error) for e in result.failed] == [
+            ("0", "Read timed out"),
+            ("1", "Read timed out"),
+        ]
+        mock_conn.network.create_port.assert_not_called()
+
+    def test_create_networks_bulk(self, mock_openstack_connect_network):
+        """Test that networks are created with one bulk request."""
+        mock_conn = mock_openstack_connect_network
+        network = Mock(
+            id="net-1",
+            status="ACTIVE",
+            description=None,
+            is_admin_state_up=True,
+            is_shared=False,
+            mtu=1500,
+            provider_network_type=None,
+            provider_physical_network=None,
+            provider_segmentation_id=None,
+            project_id=None,
+        )
+        network.name = "net"
+
+        with patch(
+            "openstack_mcp_server.tools.network_tools.sdk_network.Network.bulk_create",
+            return_value=iter([network]),
+        ) as mock_bulk_create:
+            result = self.get_network_tools().create_networks(
+                [CreateNetwork(name="net")]
+            )
+
+        mock_bulk_create.assert_called_once_with(
+            mock_conn.network,
+            [{"name": "net", "admin_state_up": True, "shared": False}],
+        )
+        assert [n.id for n in result.succeeded] == ["net-1"]
+
     def test_create_port_success(self, mock_openstack_connect_network):
         mock_conn = mock_openstack_connect_network
 
@@ -601,6 +756,42 @@ class TestNetworkTools:
 
         mock_conn.network.create_port.assert_called_once()
 
+    def test_get_ports_with_fields(self, mock_openstack_connect_network):
+        """Test that projected port fields are pushed down to Neutron."""
+        mock_conn = mock_openstack_connect_network
+
+        # Neutron leaves out every attribute that was not requested.
+        port = Mock(
+            id="port-1",
+            status="ACTIVE",
+            **dict.fromkeys(
+                [
+                    "description",
+                    "project_id",
+                    "network_id",
+                    "is_admin_state_up",
+                    "device_id",
+                    "device_owner",
+                    "mac_address",
+                    "fixed_ips",
+                    "security_group_ids",
+                ]
+            ),
+        )
+        port.name = None
+        mock_conn.network.ports.return_value = [port]
+
+        tools = self.get_network_tools()
+        page = tools.get_ports(network_id="net-1", fields=["status"])
+
+        mock_conn.network.ports.assert_called_once_with(
+            network_id="net-1",
+            fields=["id", "status"],
+        )
+        assert page.model_dump()["items"] == [
+            {"id": "port-1", "status": "ACTIVE"},
+        ]
+
     def test_get_ports_status_filter_only(
         self, mock_openstack_connect_network
     ):
@@ -624,7 +815,7 @@ class TestNetworkTools:
         mock_conn.network.ports.return_value = [port]
 
         tools = self.get_network_tools()
-        res = tools.get_ports(status_filter="down")
+        res = tools.get_ports(status_filter="down").items
         assert len(res) == 1
         assert res[0].status == "DOWN"
         mock_conn.network.ports.assert_called_once_with(status="DOWN")
@@ -916,7 +1107,7 @@ class TestNetworkTools:
             project_id="proj-1",
             has_gateway=True,
             is_dhcp_enabled=True,
-        )
+        ).items
 
         assert len(result) == 1
         assert result[0] == Subnet(
@@ -986,7 +1177,7 @@ class TestNetworkTools:
         result = tools.get_subnets(
             network_id="net-1",
             has_gateway=False,
-        )
+        ).items
 
         assert len(result) == 1
         assert result[0].id == "subnet-2"
@@ -1240,7 +1431,7 @@ class TestNetworkTools:
             project_id="proj-1",
             floating_network_id="ext-net",
             unassigned_only=True,
-        )
+        ).items
         assert result == [
             FloatingIP(
                 id="fip-1",
@@ -1256,6 +1447,51 @@ class TestNetworkTools:
             ),
         ]
 
+    def test_get_floating_ips_unassigned_streams_listing(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test that unassigned_only stops reading once the page is full."""
+        mock_conn = mock_openstack_connect_network
+
+        def make_ip(index, port_id):
+            ip = Mock(
+                id=f"fip-{index}",
+                status="DOWN",
+                port_id=port_id,
+                **dict.fromkeys(
+                    [
+                        "description",
+                        "project_id",
+                        "floating_ip_address",
+                        "floating_network_id",
+                        "fixed_ip_address",
+                        "router_id",
+                    ]
+                ),
+            )
+            ip.name = None
+            return ip
+
+        ips = iter(
+            [
+                make_ip(0, "port-0"),
+                make_ip(1, None),
+                make_ip(2, "port-2"),
+                make_ip(3, None),
+                make_ip(4, None),
+            ]
+        )
+        mock_conn.network.ips.return_value = ips
+
+        tools = self.get_network_tools()
+        page = tools.get_floating_ips(unassigned_only=True, limit=2)
+
+        assert [ip.id for ip in page.items] == ["fip-1", "fip-3"]
+        assert page.has_more is True
+        # The rest of the listing is never fetched.
+        assert next(ips).id == "fip-4"
+
     def test_create_attach_detach_delete_floating_ip(
         self,
         mock_openstack_connect_network,
@@ -1310,6 +1546,34 @@ class TestNetworkTools:
             ignore_missing=False,
         )
 
+    def test_create_floating_ips_bulk_partial_failure_rollback(
+        self,
+        mock_openstack_connect_network,
+    ):
+        """Test that created floating IPs are deleted when one fails."""
+        mock_conn = mock_openstack_connect_network
+
+        created = Mock(id="fip-1")
+        mock_conn.network.create_ip.side_effect = [
+            created,
+            Exception("quota exceeded"),
+        ]
+
+        tools = self.get_network_tools()
+        result = tools.create_floating_ips_bulk(
+            "ext-net",
+            2,
+            concurrency=1,
+            rollback_on_error=True,
+        )
+
+        assert result.succeeded == []
+        assert result.rolled_back == ["fip-1"]
+        assert [e.error for e in result.failed] == ["quota exceeded"]
+        mock_conn.network.delete_ip.assert_called_once_with(
+            created, ignore_missing=True
+        )
+
     def test_update_reassign_bulk_and_auto_assign_floating_ip(
         self,
         mock_openstack_connect_network,
@@ -1350,8 +1614,9 @@ class TestNetworkTools:
         f1.router_id = None
         mock_conn.network.create_ip.side_effect = [f1]
         bulk = tools.create_floating_ips_bulk("ext-net", 1)
-        assert len(bulk) == 1
-        assert bulk[0].id == f1.id
+        assert len(bulk.succeeded) == 1
+        assert bulk.succeeded[0].id == f1.id
+        assert bulk.failed == []
 
         exists = Mock()
         exists.id = "fip-b"
@@ -1397,7 +1662,9 @@ class TestNetworkTools:
 
         # Test by project_id and name
         mock_conn.network.security_groups.return_value = [sg]
-        res = tools.get_security_groups(project_id="proj-1", name="default")
+        res = tools.get_security_groups(
+            project_id="proj-1", name="default"
+        ).items
         assert res == [expected_sg]
         mock_conn.network.security_groups.assert_called_with(
             project_id="proj-1", name="default"
@@ -1405,9 +1672,122 @@ class TestNetworkTools:
 
         # Test by id
         mock_conn.network.security_groups.return_value = [sg]
-        res = tools.get_security_groups(id="sg-1")
+        res = tools.get_security_groups(id="sg-1").items
         assert res == [expected_sg]
         mock_conn.network.security_groups.assert_called_with(id="sg-1")
+        mock_conn.network.security_group_rules.assert_not_called()
+
+    def test_get_security_groups_include_rules(
+        self, mock_openstack_connect_network
+    ):
+        """Test that rules of a complete listing come from one listing."""
+        mock_conn = mock_openstack_connect_network
+
+        groups = []
+        for sg_id in ("sg-1", "sg-2"):
+            sg = Mock()
+            sg.id = sg_id
+            sg.name = sg_id
+            sg.status = None
+            sg.description = None
+            sg.project_id = "proj-1"
+            sg.security_group_rules = []
+            groups.append(sg)
+        mock_conn.network.security_groups.return_value = groups
+
+        rule_fields = {
+            "name": None,
+            "status": None,
+            "description": None,
+            "project_id": "proj-1",
+            "direction": "ingress",
+            "ethertype": "IPv4",
+            "protocol": "tcp",
+            "port_range_min": 22,
+            "port_range_max": 22,
+            "remote_ip_prefix": "0.0.0.0/0",
+            "remote_group_id": None,
+        }
+        rules = []
+        for rule_id, sg_id in (
+            ("r-1", "sg-1"),
+            ("r-2", "sg-1"),
+            ("r-3", "sg-other"),
+        ):
+            rule = Mock(id=rule_id, security_group_id=sg_id, **rule_fields)
+            rule.name = None
+            rules.append(rule)
+        mock_conn.network.security_group_rules.return_value = rules
+
+        tools = self.get_network_tools()
+        page = tools.get_security_groups(
+            project_id="proj-1", include_rules=True
+        )
+
+        mock_conn.network.security_group_rules.assert_called_once_with(
+            project_id="proj-1"
+        )
+        assert page.items[0].security_group_rules == [
+            SecurityGroupRule(
+                id=rule_id, security_group_id="sg-1", **rule_fields
+            )
+            for rule_id in ("r-1", "r-2")
+        ]
+        assert page.items[1].security_group_rules == []
+
+    def test_get_security_groups_include_rules_of_page(
+        self, mock_openstack_connect_network
+    ):
+        """Test that rules of a partial listing are listed by ID chunks."""
+        mock_conn = mock_openstack_connect_network
+
+        groups = []
+        for index in range(151):
+            sg = Mock(
+                id=f"sg-{index}",
+                status=None,
+                description=None,
+                project_id="proj-1",
+                security_group_rules=[],
+            )
+            sg.name = sg.id
+            groups.append(sg)
+        mock_conn.network.security_groups.return_value = groups
+        mock_conn.network.security_group_rules.return_value = []
+
+        tools = self.get_network_tools()
+        page = tools.get_security_groups(limit=150, include_rules=True)
+
+        assert page.has_more
+        chunks = [
+            c.kwargs["security_group_id"]
+            for c in mock_conn.network.security_group_rules.call_args_list
+        ]
+        assert chunks == [
+            [f"sg-{index}" for index in range(100)],
+            [f"sg-{index}" for index in range(100, 150)],
+        ]
+        assert all(sg.security_group_rules == [] for sg in page.items)
+
+    def test_get_security_groups_include_rules_projected(
+        self, mock_openstack_connect_network
+    ):
+        """Test that groups are listed without their embedded rules."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.security_groups.return_value = []
+
+        tools = self.get_network_tools()
+        page = tools.get_security_groups(fields=["name"], include_rules=True)
+
+        mock_conn.network.security_groups.assert_called_once_with(
+            fields=["id", "name"]
+        )
+        mock_conn.network.security_group_rules.assert_not_called()
+        assert page.model_dump() == {
+            "items": [],
+            "next_cursor": None,
+            "has_more": False,
+        }
 
     def test_create_security_group(self, mock_openstack_connect_network):
         mock_conn = mock_openstack_connect_network
@@ -1523,7 +1903,7 @@ class TestNetworkTools:
             status_filter="ACTIVE",
             project_id="proj-1",
             is_admin_state_up=True,
-        )
+        ).items
 
         assert res == [
             Router(
@@ -1715,6 +2095,7 @@ class TestNetworkTools:
 
         p = Mock()
         p.id = "p-1"
+        p.device_id = "r-if-1"
         p.fixed_ips = [{"subnet_id": "s-1", "ip_address": "10.0.0.1"}]
         mock_conn.network.ports.return_value = [p]
 
@@ -1729,7 +2110,12 @@ class TestNetworkTools:
 
         lst = tools.get_router_interfaces("r-if-1")
         assert lst == [
-            RouterInterface(router_id="r-if-1", port_id="p-1", subnet_id="s-1")
+            RouterInterface(
+                router_id="r-if-1",
+                port_id="p-1",
+                subnet_id="s-1",
+                fixed_ips=p.fixed_ips,
+            )
         ]
 
         removed = tools.remove_router_interface("r-if-1", subnet_id="s-1")
@@ -1747,6 +2133,7 @@ class TestNetworkTools:
 
         p = Mock()
         p.id = "p-2"
+        p.device_id = "r-if-2"
         p.fixed_ips = [{"subnet_id": "s-2", "ip_address": "10.0.1.1"}]
         mock_conn.network.ports.return_value = [p]
 
@@ -1761,10 +2148,179 @@ class TestNetworkTools:
 
         lst = tools.get_router_interfaces("r-if-2")
         assert lst == [
-            RouterInterface(router_id="r-if-2", port_id="p-2", subnet_id="s-2")
+            RouterInterface(
+                router_id="r-if-2",
+                port_id="p-2",
+                subnet_id="s-2",
+                fixed_ips=p.fixed_ips,
+            )
         ]
 
         removed = tools.remove_router_interface("r-if-2", port_id="p-2")
         assert removed == RouterInterface(
             router_id="r-if-2", port_id="p-2", subnet_id="s-2"
         )
+
+    def test_get_router_interfaces_of_many_routers(
+        self, mock_openstack_connect_network
+    ):
+        """Test listing interfaces of several routers with one query."""
+        mock_conn = mock_openstack_connect_network
+
+        def port(id, router_id, *subnet_ids):
+            p = Mock(id=id, device_id=router_id)
+            p.fixed_ips = [
+                {"subnet_id": s, "ip_address": f"10.0.{i}.1"}
+                for i, s in enumerate(subnet_ids)
+            ]
+            return p
+
+        mock_conn.network.ports.return_value = [
+            port("p-1", "r-1", "s-1"),
+            port("p-2", "r-2", "s-2", "s-3"),
+            port("p-3", "r-1", "s-4"),
+            port("p-4", "r-other", "s-5"),
+        ]
+
+        lst = self.get_network_tools().get_router_interfaces(
+            router_ids=["r-2", "r-1", "r-3"]
+        )
+
+        assert [(i.router_id, i.port_id) for i in lst] == [
+            ("r-2", "p-2"),
+            ("r-1", "p-1"),
+            ("r-1", "p-3"),
+        ]
+        assert [ip["subnet_id"] for ip in lst[0].fixed_ips] == ["s-2", "s-3"]
+        mock_conn.network.ports.assert_called_once_with(
+            device_owner=[
+                "network:router_interface",
+                "network:router_interface_distributed",
+                "network:ha_router_replicated_interface",
+            ]
+        )
+
+    def test_get_router_interfaces_of_router_id_and_ids(
+        self, mock_openstack_connect_network
+    ):
+        """Test that router_id joins router_ids instead of narrowing them."""
+        mock_conn = mock_openstack_connect_network
+        mock_conn.network.ports.return_value = [
+            Mock(id="p-1", device_id="r-1", fixed_ips=[]),
+            Mock(id="p-2", device_id="r-2", fixed_ips=[]),
+            Mock(id="p-3", device_id="r-3", fixed_ips=[]),
+            Mock(id="p-4", device_id="r-other", fixed_ips=[]),
+        ]
+
+        lst = self.get_network_tools().get_router_interfaces(
+            router_id="r-3", router_ids=["r-1", "r-2"]
+        )
+
+        assert [(i.router_id, i.port_id) for i in lst] == [
+            ("r-1", "p-1"),
+            ("r-2", "p-2"),
+            ("r-3", "p-3"),
+        ]
+        assert "device_id" not in mock_conn.network.ports.call_args.kwargs
+
+    def test_get_network_topology(self, mock_openstack_connect_network):
+        """Test joining one listing per resource type into a graph."""
+        mock_conn = mock_openstack_connect_network
+
+        def resource(**attrs):
+            mock = Mock(**{k: v for k, v in attrs.items() if k != "name"})
+            mock.name = attrs.get("name")
+            return mock
+
+        mock_conn.network.networks.return_value = [
+            resource(id="net-ext", name="public", is_router_external=True),
+            resource(id="net-1", name="private", is_router_external=False),
+        ]
+        mock_conn.network.subnets.return_value = [
+            resource(
+                id="subnet-1",
+                name="private-v4",
+                network_id="net-1",
+                cidr="10.0.0.0/24",
+                gateway_ip="10.0.0.1",
+            ),
+        ]
+        mock_conn.network.routers.return_value = [
+            resource(
+                id="router-1",
+                name="gw",
+                external_gateway_info={"network_id": "net-ext"},
+            ),
+        ]
+        mock_conn.network.ports.return_value = [
+            resource(
+                id="port-r",
+                network_id="net-1",
+                device_id="router-1",
+                device_owner="network:router_interface",
+                fixed_ips=[
+                    {"subnet_id": "subnet-1", "ip_address": "10.0.0.1"}
+                ],
+            ),
+            resource(
+                id="port-dhcp",
+                network_id="net-1",
+                device_id="dhcp-1",
+                device_owner="network:dhcp",
+                fixed_ips=[
+                    {"subnet_id": "subnet-1", "ip_address": "10.0.0.2"}
+                ],
+            ),
+            resource(
+                id="port-vm",
+                network_id="net-1",
+                device_id="server-1",
+                device_owner="compute:nova",
+                fixed_ips=[
+                    {"subnet_id": "subnet-1", "ip_address": "10.0.0.5"}
+                ],
+            ),
+        ]
+        mock_conn.network.ips.return_value = [
+            resource(port_id="port-vm", floating_ip_address="203.0.113.10"),
+            resource(port_id=None, floating_ip_address="203.0.113.11"),
+        ]
+
+        topology = self.get_network_tools().get_network_topology(
+            project_id="project-1"
+        )
+
+        assert [(n.id, n.subnet_ids) for n in topology.networks] == [
+            ("net-ext", []),
+            ("net-1", ["subnet-1"]),
+        ]
+        assert topology.subnets[0].router_ids == ["router-1"]
+        assert topology.routers[0].external_network_id == "net-ext"
+        assert topology.routers[0].subnet_ids == ["subnet-1"]
+        assert len(topology.devices) == 1
+        device = topology.devices[0]
+        assert (device.id, device.device_owner) == ("server-1", "compute:nova")
+        assert device.ports[0].ip_addresses == ["10.0.0.5"]
+        assert device.ports[0].floating_ip_addresses == ["203.0.113.10"]
+        mock_conn.network.networks.assert_called_once_with(
+            project_id="project-1"
+        )
+        assert mock_conn.network.ports.call_args.kwargs["fields"] == [
+            "id",
+            "network_id",
+            "device_id",
+            "device_owner",
+            "fixed_ips",
+        ]
+
+    def test_get_network_topology_listing_error(
+        self, mock_openstack_connect_network
+    ):
+        """Test that a failed listing fails the topology."""
+        mock_conn = mock_openstack_connect_network
+        for listing in ("networks", "subnets", "ports", "routers", "ips"):
+            getattr(mock_conn.network, listing).return_value = []
+        mock_conn.network.routers.side_effect = Exception("Forbidden")
+
+        with pytest.raises(Exception, match="Forbidden"):
+            self.get_network_tools().get_network_topology()
@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from openstack_mcp_server.tools.pagination import (
+    decode_cursor,
+    encode_cursor,
+    marker_page,
+    marker_query,
+    offset_page,
+    page_limit,
+)
+
+
+def make_items(count):
+    return [SimpleNamespace(id=f"id-{i}") for i in range(count)]
+
+
+class TestCursor:
+    """Test cases for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the state it was built from."""
+        cursor = encode_cursor({"marker": "id-1"})
+
+        assert decode_cursor(cursor) == {"marker": "id-1"}
+
+    def test_empty_cursor(self):
+        """Test that no cursor means the first page."""
+        assert decode_cursor(None) == {}
+        assert decode_cursor("") == {}
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor!", "WzFd"])
+    def test_invalid_cursor(self, cursor):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+
+class TestPageLimit:
+    """Test cases for page size resolution."""
+
+    def test_default_limit(self):
+        """Test that the configured default applies when no limit is set."""
+        with patch(
+            "openstack_mcp_server.tools.pagination.config.MCP_DEFAULT_PAGE_LIMIT",
+            0,
+        ):
+            assert page_limit(None) is None
+        with patch(
+            "openstack_mcp_server.tools.pagination.config.MCP_DEFAULT_PAGE_LIMIT",
+            50,
+        ):
+            assert page_limit(None) == 50
+            assert page_limit(10) == 10
+
+    def test_invalid_limit(self):
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError, match="limit"):
+            page_limit(0)
+
+
+class TestMarkerPagination:
+    """Test cases for marker based pagination."""
+
+    def test_marker_query(self):
+        """Test that only set pagination parameters are sent."""
+        cursor = encode_cursor({"marker": "id-1"})
+
+        assert marker_query(None, None) == {}
+        assert marker_query(2, None) == {"limit": 2}
+        assert marker_query(2, cursor) == {"limit": 2, "marker": "id-1"}
+
+    def test_full_page_has_more(self):
+        """Test that a full page points at its last item."""
+        items = iter(make_items(5))
+
+        page = marker_page(items, 2)
+
+        assert [item.id for item in page.items] == ["id-0", "id-1"]
+        assert page.has_more is True
+        assert decode_cursor(page.next_cursor) == {"marker": "id-1"}
+        # The rest of the listing is never consumed.
+        assert next(items).id == "id-2"
+
+    def test_last_page(self):
+        """Test that a short page ends the listing."""
+        page = marker_page(make_items(1), 2)
+
+        assert len(page.items) == 1
+        assert page.has_more is False
+        assert page.next_cursor is None
+
+    def test_unlimited(self):
+        """Test that every item is returned without a limit."""
+        page = marker_page(make_items(5), None)
+
+        assert len(page.items) == 5
+        assert page.has_more is False
+
+    def test_convert_page(self):
+        """Test that only the items of the page are converted, at once."""
+        batches = []
+
+        def convert(items):
+            batches.append([item.id for item in items])
+            return [SimpleNamespace(id=item.id.upper()) for item in items]
+
+        page = marker_page(iter(make_items(5)), 2, convert)
+
+        assert batches == [["id-0", "id-1"]]
+        assert [item.id for item in page.items] == ["ID-0", "ID-1"]
+        assert decode_cursor(page.next_cursor) == {"marker": "ID-1"}
+
+
+class TestOffsetPagination:
+    """Test cases for offset based pagination."""
+
+    def test_pages(self):
+        """Test walking a listing page by page."""
+        page = offset_page(make_items(5), 2, None)
+        assert [item.id for item in page.items] == ["id-0", "id-1"]
+        assert page.has_more is True
+
+        page = offset_page(make_items(5), 2, page.next_cursor)
+        assert [item.id for item in page.items] == ["id-2", "id-3"]
+
+        page = offset_page(make_items(5), 2, page.next_cursor)
+        assert [item.id for item in page.items] == ["id-4"]
+        assert page.has_more is False
+        assert page.next_cursor is None
+
+    def test_exact_last_page(self):
+        """Test that a full last page does not report more items."""
+        page = offset_page(make_items(2), 2, None)
+
+        assert len(page.items) == 2
+        assert page.has_more is False
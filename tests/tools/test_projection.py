@@ -0,0 +1,63 @@
+import pytest
+
+from openstack.network.v2 import port as sdk_port
+from pydantic import TypeAdapter
+
+from openstack_mcp_server.tools.projection import (
+    fields_query,
+    projected_fields,
+)
+from openstack_mcp_server.tools.response.common import Page
+from openstack_mcp_server.tools.response.network import Network, Port
+
+
+class TestProjection:
+    """Test cases for field projection helpers."""
+
+    def test_projected_fields_keeps_required_fields(self):
+        """Test that required fields are always projected."""
+        assert projected_fields(Network, ["mtu"]) == {
+            "id",
+            "name",
+            "status",
+            "mtu",
+        }
+
+    def test_projected_fields_without_fields(self):
+        """Test that no fields means every field."""
+        assert projected_fields(Port, None) is None
+        assert projected_fields(Port, []) is None
+
+    def test_projected_fields_unknown_field(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValueError, match="Unknown fields for Port: bogus"):
+            projected_fields(Port, ["name", "bogus"])
+
+    def test_fields_query_uses_api_names(self):
+        """Test that model fields are sent under their API names."""
+        query = fields_query(
+            sdk_port.Port,
+            {"id", "is_admin_state_up", "security_group_ids"},
+        )
+
+        assert query == {
+            "fields": ["admin_state_up", "id", "security_groups"],
+        }
+
+    def test_fields_query_without_projection(self):
+        """Test that no projection sends no fields query."""
+        assert fields_query(sdk_port.Port, None) == {}
+
+    def test_page_serializes_projected_fields(self):
+        """Test that a projected page only serializes the projected fields."""
+        page = Page[Port](items=[Port(id="port-1", name="p1")])
+
+        adapter = TypeAdapter(Page[Port])
+        assert adapter.dump_python(page, mode="json")["items"][0]["name"] == (
+            "p1"
+        )
+
+        page.project({"id", "status"})
+        assert adapter.dump_python(page, mode="json")["items"] == [
+            {"id": "port-1", "status": None},
+        ]
@@ -0,0 +1,145 @@
+import inspect
+
+from unittest.mock import Mock
+
+import pytest
+
+from keystoneauth1 import adapter
+from openstack import exceptions
+from openstack.compute.v2 import server as sdk_server
+from openstack.network.v2 import port as sdk_port
+
+from openstack_mcp_server.tools.raw_listing import raw_list
+
+
+def response(body: dict) -> Mock:
+    """Get a successful response with the given JSON body."""
+    resp = Mock(status_code=200, headers={}, links={})
+    resp.json.return_value = body
+    return resp
+
+
+def get_session(*responses: Mock, microversion: str | None = None) -> Mock:
+    """Get a session returning the given responses in order."""
+    session = Mock(spec=adapter.Adapter)
+    session.default_microversion = microversion
+    session.get.side_effect = list(responses)
+    return session
+
+
+class TestRawList:
+    """Test cases for raw_list function."""
+
+    def test_raw_list_renames_keys(self):
+        """Test that API keys are renamed to the SDK attribute names."""
+        session = get_session(
+            response(
+                {
+                    "ports": [
+                        {
+                            "id": "port-1",
+                            "network_id": "net-1",
+                            "security_groups": ["sg-1"],
+                            "fixed_ips": [{"ip_address": "10.0.0.2"}],
+                            "unknown": "ignored",
+                        }
+                    ]
+                }
+            )
+        )
+
+        ports = list(raw_list(session, sdk_port.Port, device_id="server-1"))
+
+        assert ports == [
+            {
+                "id": "port-1",
+                "network_id": "net-1",
+                "security_group_ids": ["sg-1"],
+                "fixed_ips": [{"ip_address": "10.0.0.2"}],
+            }
+        ]
+        session.get.assert_called_once_with(
+            "/ports",
+            headers={"Accept": "application/json"},
+            params={"device_id": "server-1"},
+            microversion=None,
+        )
+
+    def test_raw_list_follows_pagination_links(self):
+        """Test that every page is requested until no next link is left."""
+        session = get_session(
+            response(
+                {
+                    "ports": [{"id": "port-1"}],
+                    "ports_links": [
+                        {"rel": "next", "href": "/ports?marker=port-1"}
+                    ],
+                }
+            ),
+            response({"ports": [{"id": "port-2"}]}),
+        )
+
+        ports = list(raw_list(session, sdk_port.Port))
+
+        assert [p["id"] for p in ports] == ["port-1", "port-2"]
+        assert session.get.call_count == 2
+        assert session.get.call_args_list[1].kwargs["params"] == {
+            "marker": ["port-1"]
+        }
+
+    def test_raw_list_base_path_and_microversion(self):
+        """Test listing from a custom path with the session microversion."""
+        session = get_session(
+            response({"servers": [{"id": "server-1", "status": "ACTIVE"}]}),
+            microversion="2.79",
+        )
+
+        servers = list(
+            raw_list(
+                session,
+                sdk_server.Server,
+                base_path="/servers/detail",
+                status="ACTIVE",
+            )
+        )
+
+        assert servers == [{"id": "server-1", "status": "ACTIVE"}]
+        session.get.assert_called_once_with(
+            "/servers/detail",
+            headers={"Accept": "application/json"},
+            params={"status": "ACTIVE"},
+            microversion="2.79",
+        )
+
+    def test_sdk_helpers(self):
+        """Test that the private openstacksdk helpers keep their signature."""
+        resource = sdk_port.Port
+        helpers = {
+            resource._get_session: ["session"],
+            resource._get_microversion: ["session"],
+            resource._get_next_link: [
+                "uri",
+                "response",
+                "data",
+                "marker",
+                "limit",
+                "total_yielded",
+            ],
+            resource._query_mapping._validate: [
+                "query",
+                "base_path",
+                "allow_unknown_params",
+            ],
+            resource._query_mapping._transpose: ["query", "resource_type"],
+            resource._attributes_iterator: ["components"],
+        }
+
+        for helper, parameters in helpers.items():
+            assert list(inspect.signature(helper).parameters) == parameters
+
+    def test_raw_list_invalid_query(self):
+        """Test that unsupported query parameters are rejected."""
+        session = get_session()
+
+        with pytest.raises(exceptions.InvalidResourceQuery):
+            list(raw_list(session, sdk_port.Port, unknown="value"))
@@ -0,0 +1,63 @@
+import stat
+
+from openstack_mcp_server.tools.token_cache import TokenCache
+
+
+class TestTokenCache:
+    """Test cases for the on-disk TokenCache."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved auth state is loaded back."""
+        cache = TokenCache(tmp_path / "tokens")
+
+        cache.save("key-1", '{"auth_token": "abc"}')
+
+        assert cache.load("key-1") == '{"auth_token": "abc"}'
+
+    def test_load_missing_key(self, tmp_path):
+        """Test that an unknown key is a cache miss."""
+        cache = TokenCache(tmp_path / "tokens")
+
+        assert cache.load("missing") is None
+
+    def test_save_overwrites_previous_state(self, tmp_path):
+        """Test that saving a shorter state fully replaces the old one."""
+        cache = TokenCache(tmp_path / "tokens")
+
+        cache.save("key-1", '{"auth_token": "a-much-longer-token"}')
+        cache.save("key-1", '{"auth_token": "b"}')
+
+        assert cache.load("key-1") == '{"auth_token": "b"}'
+
+    def test_save_restricts_permissions(self, tmp_path):
+        """Test that cache files and directory are private to the user."""
+        cache_dir = tmp_path / "tokens"
+        cache = TokenCache(cache_dir)
+
+        cache.save("key-1", "state")
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        file_mode = (cache_dir / "key-1.json").stat().st_mode
+        assert stat.S_IMODE(file_mode) == 0o600
+
+    def test_delete(self, tmp_path):
+        """Test removing a cached entry, including a missing one."""
+        cache = TokenCache(tmp_path / "tokens")
+        cache.save("key-1", "state")
+
+        cache.delete("key-1")
+        cache.delete("key-1")
+
+        assert cache.load("key-1") is None
+
+    def test_make_key_depends_on_cloud_and_scope(self):
+        """Test that keys are stable and scope sensitive."""
+        scope = {"auth_url": "https://keystone", "project_name": "demo"}
+
+        key = TokenCache.make_key("cloud-a", scope)
+
+        assert key == TokenCache.make_key("cloud-a", dict(scope))
+        assert key != TokenCache.make_key("cloud-b", scope)
+        assert key != TokenCache.make_key(
+            "cloud-a", {**scope, "project_name": "other"}
+        )
@@ -0,0 +1,225 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openstack import exceptions
+
+from openstack_mcp_server.tools.waiter import (
+    DELETED,
+    Waiter,
+    _get_each_or_list,
+    _image_statuses,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_get_openstack_conn_waiter():
+    """Mock get_openstack_conn function for the waiter."""
+    with patch(
+        "openstack_mcp_server.tools.waiter.get_openstack_conn",
+        return_value=Mock(),
+    ):
+        yield
+
+
+class TestWaiter:
+    """Test cases for Waiter class."""
+
+    def get_waiter(self, listings: list[dict[str, str]]) -> Waiter:
+        """Get a waiter polling the given listings, repeating the last."""
+        waiter = Waiter(min_interval=0.01, max_interval=0.02)
+        source = Mock(
+            side_effect=lambda conn, ids, filters: (
+                listings.pop(0).items()
+                if len(listings) > 1
+                else listings[0].items()
+            )
+        )
+        waiter.register_source("server", source)
+        return waiter
+
+    def test_wait_until_target(self):
+        """Test waiting until every resource reaches a final status."""
+        waiter = self.get_waiter(
+            [
+                {"s-1": "BUILD", "s-2": "BUILD"},
+                {"s-1": "ACTIVE", "s-2": "BUILD"},
+                {"s-1": "ACTIVE", "s-2": "ERROR"},
+            ]
+        )
+        progress = []
+
+        statuses = waiter.wait(
+            "server",
+            ["s-1", "s-2"],
+            targets={"ACTIVE"},
+            failures={"ERROR"},
+            timeout=5,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert statuses == {"s-1": "ACTIVE", "s-2": "ERROR"}
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        waiter.shutdown()
+
+    def test_wait_shares_polls(self):
+        """Test that concurrent waits are served by one listing per poll."""
+        waiter = Waiter(min_interval=0.01, max_interval=0.02)
+        release = threading.Event()
+        released_polls = []
+
+        def source(conn, ids, filters):
+            if not release.is_set():
+                return {"s-1": "BUILD", "s-2": "BUILD"}.items()
+            released_polls.append(conn)
+            return {"s-1": "ACTIVE", "s-2": "ACTIVE"}.items()
+
+        waiter.register_source("server", source)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(waiter.wait, "server", [id], {"ACTIVE"}, None, 5)
+                for id in ("s-1", "s-2")
+            ]
+            threading.Timer(0.1, release.set).start()
+            results = [f.result() for f in futures]
+
+        assert results == [{"s-1": "ACTIVE"}, {"s-2": "ACTIVE"}]
+        assert len(released_polls) == 1
+        waiter.shutdown()
+
+    def test_wait_missing_resource_is_deleted(self):
+        """Test that resources missing from the listing are deleted."""
+        waiter = self.get_waiter([{"s-1": "ACTIVE"}, {}])
+
+        statuses = waiter.wait("server", ["s-1"], {DELETED}, timeout=5)
+
+        assert statuses == {"s-1": DELETED}
+        waiter.shutdown()
+
+    def test_wait_timeout(self):
+        """Test that the last known status is returned at the deadline."""
+        waiter = self.get_waiter([{"s-1": "BUILD"}])
+
+        statuses = waiter.wait("server", ["s-1"], {"ACTIVE"}, timeout=0.1)
+
+        assert statuses == {"s-1": "BUILD"}
+        waiter.shutdown()
+
+    def test_wait_cancel(self):
+        """Test that a set cancellation flag ends the wait."""
+        waiter = self.get_waiter([{"s-1": "BUILD"}])
+        cancel = threading.Event()
+        cancel.set()
+
+        statuses = waiter.wait(
+            "server", ["s-1"], {"ACTIVE"}, timeout=5, cancel=cancel
+        )
+
+        assert statuses["s-1"] in (None, "BUILD")
+        waiter.shutdown()
+
+    def test_poll_passes_waited_ids(self):
+        """Test that sources are asked for the IDs being waited for."""
+        waiter = Waiter(min_interval=0.01, max_interval=0.02)
+        source = Mock(return_value=[("s-1", "ACTIVE")])
+        waiter.register_source("server", source)
+
+        waiter.wait("server", ["s-1"], {"ACTIVE"}, timeout=5)
+
+        assert source.call_args.args[1] == ["s-1"]
+        waiter.shutdown()
+
+    def test_poll_passes_filters(self):
+        """Test that waits with other filters are polled separately."""
+        waiter = Waiter(min_interval=0.01, max_interval=0.02)
+        source = Mock(return_value=[("s-1", "ACTIVE"), ("s-2", "ACTIVE")])
+        waiter.register_source("server", source)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(
+                    waiter.wait,
+                    "server",
+                    [id],
+                    {"ACTIVE"},
+                    timeout=5,
+                    filters={"tags": tag},
+                )
+                for id, tag in (("s-1", "batch-1"), ("s-2", "batch-2"))
+            ]
+            results = [f.result() for f in futures]
+
+        assert results == [{"s-1": "ACTIVE"}, {"s-2": "ACTIVE"}]
+        assert {
+            (tuple(c.args[1]), c.args[2]["tags"])
+            for c in source.call_args_list
+        } == {(("s-1",), "batch-1"), (("s-2",), "batch-2")}
+        waiter.shutdown()
+
+    def test_wait_unknown_resource_type(self):
+        """Test that waiting for unsupported resources fails."""
+        waiter = Waiter(min_interval=0.01, max_interval=0.02)
+
+        with pytest.raises(ValueError, match="Cannot wait for port"):
+            waiter.wait("port", ["p-1"], {"ACTIVE"})
+
+
+class TestStatusSources:
+    """Test cases for the status sources of the waiter."""
+
+    def test_get_each_few_resources(self):
+        """Test that few resources are read one by one."""
+        conn = Mock()
+
+        def get(conn, id):
+            if id == "s-2":
+                raise exceptions.NotFoundException()
+            return Mock(status="ACTIVE")
+
+        list_all = Mock()
+        source = _get_each_or_list(get, list_all)
+
+        assert source(conn, ["s-1", "s-2"], {}) == [("s-1", "ACTIVE")]
+        list_all.assert_not_called()
+
+    def test_list_many_resources(self):
+        """Test that many resources are read by one listing."""
+        conn = Mock()
+        get = Mock()
+        list_all = Mock(return_value=[Mock(id="s-1", status="ACTIVE")])
+        source = _get_each_or_list(get, list_all)
+
+        assert source(conn, [f"s-{i}" for i in range(11)], {}) == [
+            ("s-1", "ACTIVE")
+        ]
+        list_all.assert_called_once_with(conn)
+        get.assert_not_called()
+
+    def test_list_filtered_resources(self):
+        """Test that resources of a filtered wait are listed filtered."""
+        conn = Mock()
+        get = Mock()
+        list_all = Mock(return_value=[Mock(id="s-1", status="ACTIVE")])
+        source = _get_each_or_list(get, list_all)
+
+        assert source(conn, ["s-1"], {"tags": "batch"}) == [("s-1", "ACTIVE")]
+        list_all.assert_called_once_with(conn, tags="batch")
+        get.assert_not_called()
+
+    def test_image_statuses_filter_by_id(self):
+        """Test that images are listed by chunks of IDs."""
+        conn = Mock()
+        conn.image.images.return_value = [Mock(id="i-1", status="active")]
+        ids = [f"i-{i}" for i in range(101)]
+
+        statuses = list(_image_statuses(conn, ids, {}))
+
+        assert statuses == [("i-1", "active"), ("i-1", "active")]
+        assert [c.kwargs["id"] for c in conn.image.images.call_args_list] == [
+            "in:" + ",".join(ids[:100]),
+            "in:i-100",
+        ]